@@ -1,4 +1,4 @@
-from .engine import argument_parsers, create_project, run_project
+from .engine import argument_parsers, create_project, read_logs, run_project
 
 if __name__ == "__main__":
     parser = argument_parsers.at_launching()
@@ -8,3 +8,5 @@ if __name__ == "__main__":
         create_project.create()
     elif args.command == argument_parsers.RUN:
         run_project.run()
+    elif args.command == argument_parsers.LOGS:
+        read_logs.read()
@@ -1,2 +1,3 @@
+from .async_base_app import AsyncBaseApp
 from .base_app import BaseApp
 from .launcher import Launcher
@@ -0,0 +1,251 @@
+import asyncio
+import threading
+import time
+from typing import *
+
+from ..constants import SHUTDOWN_NAME
+from ..core import logging_tool, startup_profiler
+from ..core.event_loop import get_process_event_loop
+from ..core.value_sharing import FolderDictWithLock, ShutdownFlag, Trigger
+from .base_app import BaseApp
+
+# Futures done at shutdown, keyed by (event loop, name of shutdown flag).
+_shutdown_futures: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
+
+
+class _TriggerWatcher(object):
+    """
+    Wakes futures of an event loop when the trigger is notified.
+    The thread of the watcher waits for notifications, and sets results
+    of waiting futures in the event loop.
+    """
+
+    def __init__(self, trigger: Trigger, loop: asyncio.AbstractEventLoop) -> None:
+        self.trigger = trigger
+        self.loop = loop
+        self.waiters: List[Tuple[int, asyncio.Future]] = []
+        threading.Thread(target=self.watch, name=f"{trigger.name}.watcher", daemon=True).start()
+
+    def watch(self) -> None:
+        generation = self.trigger.generation
+        while True:
+            self.trigger.wait(generation)
+            generation = self.trigger.generation
+            self.loop.call_soon_threadsafe(self.wake)
+
+    def wake(self) -> None:
+        generation = self.trigger.generation
+        waiters = []
+        for waiter_generation, future in self.waiters:
+            if future.done():  # cancelled.
+                continue
+            if waiter_generation != generation:
+                future.set_result(None)
+            else:
+                waiters.append((waiter_generation, future))
+        self.waiters = waiters
+
+    def waiter(self, generation: int) -> asyncio.Future:
+        """Returns the future which is done when notified after `generation`.
+        Must be called in the event loop.
+        """
+        future = self.loop.create_future()
+        if self.trigger.generation != generation:
+            future.set_result(None)
+        else:
+            self.waiters = [w for w in self.waiters if not w[1].done()]
+            self.waiters.append((generation, future))
+        return future
+
+
+# Watchers of triggers, keyed by (event loop, name of trigger).
+_trigger_watchers: Dict[Tuple[asyncio.AbstractEventLoop, str], _TriggerWatcher] = {}
+
+
+class AsyncBaseApp(BaseApp):
+    """
+    The base class of asyncio applications.
+
+    All async applications in a process share one event loop
+    (`JarvisEngine.core.event_loop`), so async thread applications
+    do not occupy their own threads.
+    `UpdateAsync` is awaited instead of `Update`, and frames are scheduled by
+    timers of the event loop instead of `time.sleep`.
+
+    The other override methods are same as `BaseApp`, and are called
+    in the event loop. Do not block long in them.
+    `precise_timing` is not supported, because spinning blocks the event loop.
+    Scheduling settings (`cpu_affinity`, ...) of async thread applications
+    are applied to the event loop thread, which is shared by them.
+
+    Ex:
+    >>> class App(AsyncBaseApp):
+    >>>     frame_rate = 10.0
+    >>>
+    >>>     async def UpdateAsync(self, delta_time):
+    >>>         data = await self.reader.read(1024)
+    """
+
+    is_async = True
+
+    def launch(self, process_shared_values: FolderDictWithLock) -> None:
+        """
+        Runs `launch_async` on the event loop of this process,
+        and waits for its termination.
+        """
+        future = asyncio.run_coroutine_threadsafe(self.launch_async(process_shared_values), get_process_event_loop())
+        future.result()
+
+    async def launch_async(self, process_shared_values: FolderDictWithLock) -> None:
+        """
+        Wrapps `self._launch_async` by try-except error catching.
+        """
+        try:
+            await self._launch_async(process_shared_values)
+        except Exception as e:
+            self.logger.exception(e)
+            logging_tool.flushLogger(self.logger)
+
+    async def _launch_async(self, process_shared_values: FolderDictWithLock) -> None:
+        """
+        Launch all applications on the event loop.
+        The process flow is same as `BaseApp._launch`.
+        """
+        self.logger.info("launch")
+        if not self.is_thread:
+            startup_profiler.enable_shared(process_shared_values)
+        self.apply_scheduling_settings()
+        with startup_profiler.measure(self.name, startup_profiler.AWAKE):
+            self.Awake()
+
+        self.process_shared_values = process_shared_values
+        self.prepare_for_launching_thread_apps()
+        self.launch_child_apps()
+        self.resolve_shared_value_bindings()
+
+        self.Start()
+
+        await self.periodic_update_async()
+
+        self.End()
+        logging_tool.flushLogger(self.logger)
+
+        await self.join_child_apps_async()
+
+        self.Terminate()
+        self.logger.debug("terminate")
+        logging_tool.flushLogger(self.logger)
+
+    async def join_child_apps_async(self) -> None:
+        """
+        Join all child applications without blocking the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        for thread in self.threads:
+            await loop.run_in_executor(None, thread.join)
+
+        for future in self.async_futures:
+            await asyncio.wrap_future(future)
+
+        for process in self.processes:
+            await loop.run_in_executor(None, process.join)
+
+    def get_shutdown_future(self) -> asyncio.Future:
+        """
+        Returns the future which is done at shutdown of JarvisEngine.
+        One thread per event loop waits for the shutdown flag.
+        """
+        loop = asyncio.get_running_loop()
+        shutdown: ShutdownFlag = self.getProcessSharedValue(SHUTDOWN_NAME)
+        key = (loop, shutdown.name)
+        future = _shutdown_futures.get(key)
+        if future is None:
+            future = _shutdown_futures[key] = loop.create_future()
+
+            def wait() -> None:
+                shutdown.wait()
+                loop.call_soon_threadsafe(future.set_result, None)
+
+            threading.Thread(target=wait, name=f"{self.name}.shutdown", daemon=True).start()
+        return future
+
+    async def wait_for_shutdown(self) -> None:
+        """
+        Awaitable which completes at shutdown of JarvisEngine.
+        Ex:
+        >>> await asyncio.wait([task, asyncio.ensure_future(self.wait_for_shutdown())], return_when=FIRST_COMPLETED)
+        """
+        await asyncio.shield(self.get_shutdown_future())
+
+    def get_trigger_waiter(self, trigger: Trigger, generation: int) -> asyncio.Future:
+        """
+        Returns the future which is done when `trigger` is notified after `generation`.
+        One thread per event loop and trigger waits for notifications,
+        so waiting apps do not occupy threads of the executor.
+        """
+        loop = asyncio.get_running_loop()
+        key = (loop, trigger.name)
+        watcher = _trigger_watchers.get(key)
+        if watcher is None:
+            watcher = _trigger_watchers[key] = _TriggerWatcher(trigger, loop)
+        return watcher.waiter(generation)
+
+    async def periodic_update_async(self) -> None:
+        """
+        Awaits override method `UpdateAsync` at intervals determined by
+        `frame_rate`, until shutdown.
+        Between frames, the event loop runs other async applications.
+        Frames are recorded like `BaseApp.periodic_update`.
+        """
+        shutdown, trigger = self.start_frames()
+        scheduler = self.frame_scheduler
+        shutdown_future = self.get_shutdown_future()
+
+        previous_time = time.perf_counter()
+        while True:
+            if trigger is not None:
+                generation = trigger.generation
+            # Checked after reading the generation, so the notification at shutdown always wakes the wait.
+            if shutdown.value:
+                break
+            current_time = time.perf_counter()
+            with self.measure_update():
+                await self.UpdateAsync(current_time - previous_time)
+            previous_time = current_time
+            update_end_time = time.perf_counter()
+
+            if trigger is not None:
+                # shutdown interrupts waiting.
+                waiter = self.get_trigger_waiter(trigger, generation)
+                await asyncio.wait(
+                    [waiter, shutdown_future], timeout=self.trigger_timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                waiter.cancel()
+            elif self.frame_rate > 0.0:
+                deadline = scheduler.next_deadline(1 / self.frame_rate, self.overrun_policy)
+                delay = deadline - time.perf_counter()
+                if delay > 0:
+                    # shutdown interrupts sleeping.
+                    await asyncio.wait([shutdown_future], timeout=delay)
+                else:
+                    await asyncio.sleep(0)
+            else:
+                # Yield to other async applications.
+                await asyncio.sleep(0)
+
+            self.record_frame(current_time, update_end_time)
+            if self.frame_rate == 0.0 and trigger is None:
+                # call `UpdateAsync` once only when frame_rate is 0.
+                break
+
+        self.finish_frames()
+
+    async def UpdateAsync(self, delta_time: float) -> None:
+        """
+        Awaited at intervals determined by `frame_rate` attribute.
+        Calls `Update` by default.
+        Args:
+        - delta_time: float
+            The interval time[seconds] of previous Update.
+        """
+        self.Update(delta_time)
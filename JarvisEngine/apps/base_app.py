@@ -1,21 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 import multiprocessing as mp
 import os
 import threading
 import time
 from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import nullcontext
 from multiprocessing.managers import SyncManager
 from types import *
 from typing import *
 
 from attr_dict import AttrDict
 
-from ..constants import SHUTDOWN_NAME
-from ..core import logging_tool
+from ..constants import FRAME_STATS_NAME, METRICS_NAME, SHUTDOWN_NAME
+from ..core import logging_tool, metrics
 from ..core import name as name_tools
-from ..core.value_sharing import FolderDictWithLock
+from ..core import scheduling, startup_profiler
+from ..core.event_loop import get_process_event_loop
+from ..core.frame_scheduler import SKIP, FrameScheduler
+from ..core.frame_stats import FrameStatsRecorder
+from ..core.value_sharing import FolderDictWithLock, SharedArray, ShutdownFlag, Trigger
 
 
 class BaseApp(object):
@@ -48,8 +55,10 @@ class BaseApp(object):
     - engine_config: AttrDict
         AttrDict of `engine_config.toml`
 
-    - project_config: AttrDict
-        Full of `config.json`
+    - project_config: AttrDict | None
+        Full of `config.json`.
+        None in apps constructed in child process (`construct_in_child`),
+        which receive only configs of their subtree.
 
     - app_dir: str | None
         The directory to the application.
@@ -60,9 +69,28 @@ class BaseApp(object):
     - is_thread: bool
         Whether the application is thread or process.
 
+    - is_async: bool
+        Whether the application is `AsyncBaseApp`.
+
     - child_app_configs
         `apps` attribute of `self.config`.
 
+    - replica_index: int
+        The index of this app among its replicas. 0 if not replicated.
+
+    - num_replicas: int
+        The number of replicas, `replicas` of `config.json`. 1 if not replicated.
+
+    - construct_in_child: bool
+        Whether the process app subtree is constructed in its own process.
+        `construct_in_child` of `config.json`, or `multiprocessing.construct_in_child`
+        of engine config. Always False for thread apps.
+
+    - init_skipped: bool
+        True if this app was constructed in the parent process only for
+        registering process shared values. `Init` is not called,
+        and the app is constructed again in its own process.
+
     - frame_rate: float
         Period to call the `Update` method.
         The behavior depends on the value range.
@@ -76,6 +104,36 @@ class BaseApp(object):
         - frame_rate < 0.0
             Call next `Update` immediately.
 
+    - overrun_policy: str
+        How to schedule next frames when `Update` is late for the deadline.
+        `"skip"` (default), `"catch_up"` or `"rephase"`.
+        Please see `JarvisEngine.core.frame_scheduler`.
+
+    - update_trigger: str | None
+        The process shared value name of a `Trigger`, or of an object
+        which has `trigger` attribute (ex. `RingBuffer`).
+        If set, `Update` is called whenever the trigger is notified,
+        instead of at `frame_rate`.
+
+    - trigger_timeout: float | None
+        Seconds to wait for the trigger. `Update` is also called when
+        timeout expired. If None, waits forever.
+
+    - precise_timing: bool | None
+        If True, sleeps between `Update` are finished by spinning.
+        If None, uses `timing.precise` of engine config.
+
+    - spin_threshold: float | None
+        Seconds of spinning before deadlines in precise timing.
+        If None, uses `timing.spin_threshold` of engine config.
+
+    - frame_scheduler: FrameScheduler
+        The property. Schedules deadlines of `Update`.
+
+    - frame_stats: FrameStatsRecorder
+        The property. Records timings of `Update` frames, and they are
+        published to the `FrameStatsTable` of `FRAME_STATS_NAME`.
+
     - process_shared_values: FolderDictWithLock | None
         The property. Hold shard values inter `processes`.
 
@@ -127,6 +185,7 @@ class BaseApp(object):
         2. construct_child_apps
             1. import_app
         3. Init (override method)
+            Skipped if the app is constructed in child process (`construct_in_child`).
 
     2. prepare_for_launching (only Launcher application.)
         1. set_process_shared_values_to_all_apps (set FolderDictWithLock)
@@ -135,29 +194,44 @@ class BaseApp(object):
             2. RegisterProcessSharedValues (child applications)
                 ...
         2. set_process_shared_values_to_all_apps (set None)
+        3. freeze process shared values (at `Launcher.launch`)
 
     3. launch (_launch)
-        1. Awake (override method)
-        2. setter of process_shared_value
-        3. prepare_for_launching_thread_apps
+        1. apply_scheduling_settings
+        2. Awake (override method)
+        3. setter of process_shared_value
+        4. prepare_for_launching_thread_apps
             If process app
                 1. set_thread_shared_values_to_all_apps(FolderDictWithLock)
                 2. RegisterThreadSharedValues (override method)
                     1. RegisterThreadSharedValues (child thread apps)
                         ...
-        4. launch_child_apps
-        5. Start (override method)
-        6. periodic_update
+                3. freeze thread shared values
+        5. launch_child_apps
+            If child process app is `construct_in_child`,
+                1. get_launch_spec
+                2. launch_from_spec (in the child process)
+                    1. __init__ (with Init)
+                    2. launch
+        6. resolve_shared_value_bindings
+        7. Start (override method)
+        8. periodic_update
             1. Update (override method)
             2. adjust_update_frame_rate
             ...
-        7. End (override method)
-        8. join_child_apps
-        9. Terminate (override method)
+        9. End (override method)
+        10. join_child_apps
+        11. Terminate (override method)
     """
 
     def __init__(
-        self, name: str, config: AttrDict, engine_config: AttrDict, project_config: AttrDict, app_dir: str = None
+        self,
+        name: str,
+        config: AttrDict,
+        engine_config: AttrDict,
+        project_config: AttrDict,
+        app_dir: str = None,
+        skip_init: bool = False,
     ) -> None:
         """Initialization of BaseApp
         Args:
@@ -181,22 +255,34 @@ class BaseApp(object):
 
         - project_config
             The whole configuration of applications.
+            None if the app is constructed in child process.
 
         - app_dir (optional)
             The absolute path to the application folder.
+
+        - skip_init (optional)
+            If True, `Init` of this and all child apps are not called.
+            Given by parent app when this app is constructed in child process.
         """
         self.__name = name
         self.__config = config
         self.__engine_config = engine_config
         self.__project_config = project_config
         self.__app_dir = app_dir
-        self.__logger = logging_tool.getAppLogger(name, engine_config.logging)
+        self.__logger = logging_tool.getAppLogger(name, engine_config.logging, self.get_log_level(config), config)
+        self.__shared_value_bindings: List[Tuple[str, str, bool]] = []
+        self.__frame_scheduler = FrameScheduler()
+        self.__frame_stats = FrameStatsRecorder()
+        self.__metrics: Dict[str, metrics._Metric] = {}
+        self.init_skipped = skip_init
 
         self.set_config_attrs()
 
         self.construct_child_apps()
 
-        self.Init()
+        if not skip_init:
+            with startup_profiler.measure(self.name, startup_profiler.INIT):
+                self.Init()
 
     def Init(self) -> None:
         """Called at the end of `__init__`"""
@@ -214,7 +300,7 @@ class BaseApp(object):
         return self.__engine_config
 
     @property
-    def project_config(self) -> AttrDict:
+    def project_config(self) -> Optional[AttrDict]:
         return self.__project_config
 
     @property
@@ -233,9 +319,18 @@ class BaseApp(object):
             Whether the App is thread or process.
         - child_app_configs:
             Child app configs of the application.
+        - replica_index: int
+            The index among replicas.
+        - num_replicas: int
+            The number of replicas.
+        - construct_in_child: bool
+            Whether the subtree is constructed in child process.
         """
         self.module_name: str = self.config.path
         self.is_thread: bool = self.config.thread
+        self.replica_index: int = self.config.replica_index if hasattr(self.config, "replica_index") else 0
+        self.num_replicas: int = self.config.replicas if hasattr(self.config, "replicas") else 1
+        self.construct_in_child: bool = self.get_construct_in_child(self.config, self.engine_config)
 
         if hasattr(self.config, "apps"):
             self.child_app_configs = self.config.apps
@@ -251,19 +346,104 @@ class BaseApp(object):
         self.child_thread_apps = OrderedDict()
         self.child_process_apps = OrderedDict()
 
-        for child_name, child_conf in self.child_app_configs.items():
-            ch_path: str = child_conf.path
+        for config_name, config in self.child_app_configs.items():
+            for child_name, child_conf in self.expand_replicas(config_name, config):
+                ch_path: str = child_conf.path
+
+                full_child_name = name_tools.join(self.name, child_name)
+                with startup_profiler.measure(full_child_name, startup_profiler.IMPORT_APP):
+                    app_cls, mod = self.import_app(ch_path)
+                app_dir = os.path.dirname(mod.__file__)
+
+                # Apps constructed in child process are only for registering shared values here.
+                skip_init = self.init_skipped or self.get_construct_in_child(child_conf, self.engine_config)
+                child_app = app_cls(
+                    full_child_name, child_conf, self.engine_config, self.project_config, app_dir, skip_init
+                )
+                self.child_apps[child_name] = child_app
+                if child_app.is_thread:
+                    self.child_thread_apps[child_name] = child_app
+                else:
+                    self.child_process_apps[child_name] = child_app
 
-            full_child_name = name_tools.join(self.name, child_name)
-            app_cls, mod = self.import_app(ch_path)
-            app_dir = os.path.dirname(mod.__file__)
+    @staticmethod
+    def expand_replicas(name: str, config: AttrDict) -> List[Tuple[str, AttrDict]]:
+        """Expand the app config which has `replicas` field into
+        configs of replicas, named `<name>_<index>`.
+        `"replicas": "auto"` makes replicas as many as CPU cores.
 
-            child_app = app_cls(full_child_name, child_conf, self.engine_config, self.project_config, app_dir)
-            self.child_apps[child_name] = child_app
-            if child_app.is_thread:
-                self.child_thread_apps[child_name] = child_app
-            else:
-                self.child_process_apps[child_name] = child_app
+        return -> [(name, config), ...]
+        """
+        if not hasattr(config, "replicas"):
+            return [(name, config)]
+
+        num_replicas = config.replicas
+        if num_replicas == "auto":
+            num_replicas = os.cpu_count()
+        if not isinstance(num_replicas, int) or num_replicas < 1:
+            raise ValueError(f"replicas of {name} must be a positive integer or 'auto', but {config.replicas}.")
+
+        replicas = []
+        for index in range(num_replicas):
+            replica_conf = AttrDict(config)
+            replica_conf.replicas = num_replicas
+            replica_conf.replica_index = index
+            replicas.append((name_tools.replica(name, index), replica_conf))
+        return replicas
+
+    @staticmethod
+    def get_construct_in_child(config: AttrDict, engine_config: AttrDict) -> bool:
+        """Whether the app of `config` is constructed in its own process.
+        `construct_in_child` of `config` overrides `multiprocessing.construct_in_child`
+        of engine config. Thread apps are always constructed in their parent process.
+        """
+        if config.thread:
+            return False
+        if hasattr(config, "construct_in_child"):
+            return bool(config.construct_in_child)
+        mp_conf = engine_config.multiprocessing
+        return bool(mp_conf.construct_in_child) if hasattr(mp_conf, "construct_in_child") else False
+
+    @staticmethod
+    def get_log_level(config: AttrDict) -> Optional[str]:
+        """The log level of the app of `config`.
+        `log_level` of `config` overrides `logging.log_level` of engine config.
+        Returns None if not specified.
+        """
+        return config.log_level if hasattr(config, "log_level") else None
+
+    def get_launch_spec(self) -> Dict[str, Any]:
+        """Returns the spec to construct this app again in child process.
+        The spec contains only the name, the config of this subtree, the engine config
+        and the app directory, not apps, loggers and configs of other apps.
+        """
+        return {
+            "name": self.name,
+            "config": self.config,
+            "engine_config": self.engine_config,
+            "app_dir": self.app_dir,
+        }
+
+    @staticmethod
+    def launch_from_spec(spec: Dict[str, Any], process_shared_values: FolderDictWithLock) -> None:
+        """
+        Target of child process of `construct_in_child` app.
+        Imports and constructs the app subtree from `spec` (`Init` runs here),
+        and launches it.
+        """
+        startup_profiler.enable_shared(process_shared_values)
+        try:
+            with startup_profiler.measure(spec["name"], startup_profiler.IMPORT_APP):
+                app_cls, _ = BaseApp.import_app(spec["config"].path)
+            app = app_cls(spec["name"], spec["config"], spec["engine_config"], None, spec["app_dir"])
+        except Exception as e:
+            config = spec["config"]
+            logger = logging_tool.getAppLogger(
+                spec["name"], spec["engine_config"].logging, BaseApp.get_log_level(config), config
+            )
+            logger.exception(e)
+            return
+        app.launch(process_shared_values)
 
     @staticmethod
     def import_app(path: str) -> Tuple[type, ModuleType]:
@@ -297,6 +477,8 @@ class BaseApp(object):
     @process_shared_values.setter
     def process_shared_values(self, p_sv: FolderDictWithLock) -> None:
         self.__process_shared_values = p_sv
+        if p_sv is not None:
+            self.bind_metrics()
 
     def set_process_shared_values_to_all_apps(self, p_sv: FolderDictWithLock) -> None:
         """
@@ -307,6 +489,19 @@ class BaseApp(object):
         for app in self.child_apps.values():
             app.set_process_shared_values_to_all_apps(p_sv)
 
+    def get_all_app_names(self) -> List[str]:
+        """Returns full names of `self` and all descendant apps."""
+        names = [self.name]
+        for app in self.child_apps.values():
+            names.extend(app.get_all_app_names())
+        return names
+
+    def flush_loggers_of_all_apps(self) -> None:
+        """Send buffered logs of `self` and all descendant apps."""
+        logging_tool.flushLogger(self.logger)
+        for app in self.child_apps.values():
+            app.flush_loggers_of_all_apps()
+
     @property
     def thread_shared_values(self) -> FolderDictWithLock | None:
         return self.__thread_shared_values
@@ -362,13 +557,36 @@ class BaseApp(object):
             >>> value = mp.Value("i")
             >>> self.addProcessSharedValue("int_value", value)
 
+            `SharedArray` shares a numpy array without copying.
+            >>> array = SharedArray((480, 640, 3), np.uint8)
+            >>> self.addProcessSharedValue("frame", array)
+
         Args:
             - sync_manager
                 return value of `multiprocessing.Manager`.
                 Please use it for sharing values.
         """
         for app in self.child_apps.values():
-            app.RegisterProcessSharedValues(sync_manager)
+            with startup_profiler.measure(app.name, startup_profiler.REGISTER_PROCESS_SHARED_VALUES):
+                if app.init_skipped and not self.init_skipped:
+                    app.register_process_shared_values_before_init(sync_manager)
+                else:
+                    app.RegisterProcessSharedValues(sync_manager)
+
+    def register_process_shared_values_before_init(self, sync_manager: SyncManager) -> None:
+        """
+        Calls `RegisterProcessSharedValues` of this subtree constructed without `Init`
+        (`construct_in_child`). Attributes set in `Init` do not exist here, so
+        AttributeError is raised with the explanation if they are used.
+        """
+        try:
+            self.RegisterProcessSharedValues(sync_manager)
+        except AttributeError as e:
+            raise AttributeError(
+                f"{e}. RegisterProcessSharedValues of {self.name} and its child apps is called before Init, "
+                "because they are constructed in child process (construct_in_child). "
+                "Please register shared values by config and class attributes, not attributes set in Init."
+            ) from e
 
     def RegisterThreadSharedValues(self) -> None:
         """Override function.
@@ -390,7 +608,8 @@ class BaseApp(object):
         """
 
         for app in self.child_thread_apps.values():
-            app.RegisterThreadSharedValues()
+            with startup_profiler.measure(app.name, startup_profiler.REGISTER_THREAD_SHARED_VALUES):
+                app.RegisterThreadSharedValues()
 
     def _get_shared_value(self, name: str, for_thread: bool) -> Any:
         """
@@ -398,14 +617,19 @@ class BaseApp(object):
         by specifying a name.
         If name prefix is `.`, count dot and go upstream only its count number.
         And search and pickup shared value using `name`.
+        `SharedArray` is returned as its `np.ndarray` view.
         """
         if name_tools.count_head_sep(name) > 0:
             name = name_tools.join(self.name, name)
 
         if for_thread:
-            return self.thread_shared_values[name]
+            value = self.thread_shared_values[name]
         else:
-            return self.process_shared_values[name]
+            value = self.process_shared_values[name]
+
+        if isinstance(value, SharedArray):
+            return value.get_obj()
+        return value
 
     def getProcessSharedValue(self, name: str) -> Any:
         """Interface of `_get_shared_value(...,for_thread=False)`"""
@@ -415,24 +639,141 @@ class BaseApp(object):
         """Interface of `_get_shared_value(...,for_thread=True)`"""
         return self._get_shared_value(name, True)
 
+    def _bind_shared_value(self, attr_name: str, name: str, for_thread: bool) -> None:
+        """
+        Declare a shared value which is set to `self.<attr_name>`
+        before `Start`. The name is resolved only once,
+        so accessing the value is a plain attribute read.
+        """
+        self.__shared_value_bindings.append((attr_name, name, for_thread))
+
+    def bindProcessSharedValue(self, attr_name: str, name: str) -> None:
+        """Interface of `_bind_shared_value(...,for_thread=False)`
+
+        Ex:
+        >>> def Init(self):
+        ...     self.bindProcessSharedValue("frame", "..Camera.frame")
+        >>> def Update(self, delta_time):
+        ...     self.frame  # np.ndarray
+        """
+        return self._bind_shared_value(attr_name, name, False)
+
+    def bindThreadSharedValue(self, attr_name: str, name: str) -> None:
+        """Interface of `_bind_shared_value(...,for_thread=True)`"""
+        return self._bind_shared_value(attr_name, name, True)
+
+    def resolve_shared_value_bindings(self) -> None:
+        """Set all bound shared values to attributes of self."""
+        for attr_name, name, for_thread in self.__shared_value_bindings:
+            setattr(self, attr_name, self._get_shared_value(name, for_thread))
+
+    def _get_metric(
+        self, metric_class: Type[metrics.M], name: str, buckets: Sequence[float] = metrics.DEFAULT_BUCKETS
+    ) -> metrics.M:
+        """
+        Returns the metric `name` of this app, which is created at the first call.
+        Metrics are registered to the `MetricsRegistry` of `METRICS_NAME`,
+        and exported by the Launcher with the label `app` of the app name.
+        Metrics created before Process Shared Values are set (ex. in `Init` and `Awake`)
+        record values on process local memory, and are bound to the registry
+        by `bind_metrics` when Process Shared Values are set.
+        Raises ValueError if the name is invalid or used by another kind,
+        or all metric slots of the app are used.
+        """
+        metric = self.__metrics.get(name)
+        if metric is None:
+            registry = None if self.process_shared_values is None else self.getProcessSharedValue(METRICS_NAME)
+            if registry is None:
+                new_metric = metrics.create_local_metric(metric_class, name, buckets)
+            else:
+                new_metric = registry.get_metric(self.name, metric_class, name, buckets)
+            self.__metrics[name] = new_metric
+            return new_metric
+        if not isinstance(metric, metric_class):
+            raise ValueError(f"Metric {name} of {self.name} is a {metric.kind}, not a {metric_class.kind}.")
+        return metric
+
+    def bind_metrics(self) -> None:
+        """Binds metrics on process local memory to the `MetricsRegistry`
+        of Process Shared Values, with values recorded until now.
+        Does nothing if the registry does not exist.
+        """
+        registry = self.getProcessSharedValue(METRICS_NAME)
+        if registry is None:
+            return
+        for metric in self.__metrics.values():
+            if not metric.is_shared:
+                registry.bind(self.name, metric)
+
+    def getCounter(self, name: str) -> metrics.MetricCounter:
+        """Interface of `_get_metric(metrics.MetricCounter, name)`
+
+        Ex:
+        >>> def Start(self):
+        ...     self.processed = self.getCounter("processed_frames_total")
+        >>> def Update(self, delta_time):
+        ...     self.processed.inc()
+        """
+        return self._get_metric(metrics.MetricCounter, name)
+
+    def getGauge(self, name: str) -> metrics.MetricGauge:
+        """Interface of `_get_metric(metrics.MetricGauge, name)`"""
+        return self._get_metric(metrics.MetricGauge, name)
+
+    def getHistogram(self, name: str, buckets: Sequence[float] = metrics.DEFAULT_BUCKETS) -> metrics.MetricHistogram:
+        """Interface of `_get_metric(metrics.MetricHistogram, name, buckets)`
+        `buckets` are upper bounds of buckets, used only when the histogram is created.
+        """
+        return self._get_metric(metrics.MetricHistogram, name, buckets)
+
+    def record_log_metrics(self) -> None:
+        """
+        Records the numbers of log records suppressed by the limiter of the logger,
+        and dropped by the process handler (only by process apps,
+        because thread apps share it), to built-in metrics.
+        """
+        limiter = getattr(self.logger, "limiter", None)
+        if limiter is not None:
+            counter = self.getCounter(metrics.LOG_SUPPRESSED_RECORDS)
+            counter.inc(max(limiter.suppressed_records - counter.value, 0))
+        if not self.is_thread and isinstance(self.logger, logging_tool.Logger):
+            dropped = getattr(self.logger.process_handler, "dropped_records", 0)
+            counter = self.getCounter(metrics.LOG_DROPPED_RECORDS)
+            counter.inc(max(dropped - counter.value, 0))
+
     def prepare_for_launching_thread_apps(self):
         """
         Prepare for launching thread applications.
-        Set thread shared values among self and child thread apps.
+        Set thread shared values among self and child thread apps,
+        and freeze them after registering.
         """
         if not self.is_thread:  # Only *head* of threads.
             t_sv = FolderDictWithLock(sep=name_tools.SEP)
             self.set_thread_shared_values_to_all_apps(t_sv)
-            self.RegisterThreadSharedValues()
+            with startup_profiler.measure(self.name, startup_profiler.REGISTER_THREAD_SHARED_VALUES):
+                self.RegisterThreadSharedValues()
+            t_sv.freeze()
+
+    is_async = False
 
     def launch_child_apps(self) -> None:
         """
         launch all child thread/process applications.
+        Async thread applications are not threads, they are
+        run on the event loop shared in this process.
         """
         threads: List[threading.Thread] = []
         processes: List[mp.Process] = []
+        async_futures: List[Future] = []
 
         for thread_app in self.child_thread_apps.values():
+            if thread_app.is_async:
+                future = asyncio.run_coroutine_threadsafe(
+                    thread_app.launch_async(self.process_shared_values), get_process_event_loop()
+                )
+                async_futures.append(future)
+                continue
+
             thread = threading.Thread(
                 target=thread_app.launch, name=thread_app.name, args=(self.process_shared_values,)
             )
@@ -440,12 +781,21 @@ class BaseApp(object):
             threads.append(thread)
 
         for process_app in self.child_process_apps.values():
-            process = mp.Process(target=process_app.launch, name=process_app.name, args=(self.process_shared_values,))
-            process.start()
+            args: tuple
+            if process_app.construct_in_child:
+                # Sends the small spec instead of pickling the app subtree.
+                target, args = BaseApp.launch_from_spec, (process_app.get_launch_spec(), self.process_shared_values)
+            else:
+                target, args = process_app.launch, (self.process_shared_values,)
+            process = mp.Process(target=target, name=process_app.name, args=args)
+            process_app.flush_loggers_of_all_apps()  # buffered logs of this process are sent once.
+            with startup_profiler.measure(process_app.name, startup_profiler.SPAWN):
+                process.start()
             processes.append(process)
 
         self.threads = threads
         self.processes = processes
+        self.async_futures = async_futures
 
     def join_child_apps(self) -> None:
         """
@@ -454,6 +804,9 @@ class BaseApp(object):
         for thread in self.threads:
             thread.join()
 
+        for future in self.async_futures:
+            future.result()
+
         for process in self.processes:
             process.join()
 
@@ -462,22 +815,51 @@ class BaseApp(object):
         Launch all applications as other threads or processes.
         """
         self.logger.info("launch")
-        self.Awake()
+        if not self.is_thread:
+            # The profiler is shared to app processes by process shared values.
+            startup_profiler.enable_shared(process_shared_values)
+        self.apply_scheduling_settings()
+        with startup_profiler.measure(self.name, startup_profiler.AWAKE):
+            self.Awake()
 
         self.process_shared_values = process_shared_values
         self.prepare_for_launching_thread_apps()
         self.launch_child_apps()
+        self.resolve_shared_value_bindings()
 
         self.Start()
 
         self.periodic_update()
 
         self.End()
+        logging_tool.flushLogger(self.logger)
 
         self.join_child_apps()
 
         self.Terminate()
         self.logger.debug("terminate")
+        logging_tool.flushLogger(self.logger)
+
+    def get_scheduling_settings(self) -> Dict[str, Any]:
+        """Returns OS scheduling settings of this app.
+        `scheduling` of engine config, overridden by the same keys of app config.
+        Please see `JarvisEngine.core.scheduling`.
+        """
+        settings = dict(self.engine_config.scheduling)
+        for key in scheduling.SETTING_KEYS:
+            if hasattr(self.config, key):
+                settings[key] = self.config[key]
+        return settings
+
+    def apply_scheduling_settings(self) -> None:
+        """Apply OS scheduling settings to the current thread,
+        and log the effective settings.
+        """
+        errors = scheduling.apply_settings(self.get_scheduling_settings())
+        for key, error in errors.items():
+            self.logger.warning("Failed to set %s: %s", key, error)
+        effective = ", ".join(f"{key}={value}" for key, value in scheduling.get_settings().items())
+        self.logger.info("scheduling: %s", effective)
 
     def launch(self, process_shared_values: FolderDictWithLock) -> None:
         """
@@ -487,6 +869,7 @@ class BaseApp(object):
             self._launch(process_shared_values)
         except Exception as e:
             self.logger.exception(e)
+            logging_tool.flushLogger(self.logger)
 
     def Awake(self) -> None:
         """Called at begin of process/thread."""
@@ -495,42 +878,150 @@ class BaseApp(object):
         """Called at all applications are launched."""
 
     frame_rate = 0.0
-    __start_time = float("-inf")
+    overrun_policy = SKIP
+    update_trigger: Optional[str] = None
+    trigger_timeout: Optional[float] = None
+    precise_timing: Optional[bool] = None
+    spin_threshold: Optional[float] = None
+
+    @property
+    def frame_scheduler(self) -> FrameScheduler:
+        return self.__frame_scheduler
+
+    @property
+    def frame_stats(self) -> FrameStatsRecorder:
+        return self.__frame_stats
 
     @property
     def _update_start_time(self) -> float:
-        return self.__start_time
+        return self.__frame_scheduler.start_time
 
     def adjust_update_frame_rate(self):
-        """Adjusting frame rate of `Update` call."""
-        wait_time = 1 / self.frame_rate - (time.time() - self.__start_time)
-        if wait_time > 0:
-            time.sleep(wait_time)
-        self.__start_time = time.time()
+        """Adjusting frame rate of `Update` call.
+        Sleeps until the absolute deadline of next frame.
+        """
+        self.__frame_scheduler.wait(1 / self.frame_rate, self.overrun_policy)
+
+    def get_spin_threshold(self) -> float:
+        """Returns seconds of spinning before deadlines.
+        0.0 if precise timing is disabled.
+        """
+        timing = self.engine_config.timing
+        precise = timing.precise if self.precise_timing is None else self.precise_timing
+        if not precise:
+            return 0.0
+        return timing.spin_threshold if self.spin_threshold is None else self.spin_threshold
+
+    def get_update_trigger(self) -> Optional[Trigger]:
+        """Returns the trigger of `update_trigger`, or None."""
+        if self.update_trigger is None:
+            return None
+        obj = self.getProcessSharedValue(self.update_trigger)
+        if not isinstance(obj, Trigger):
+            obj = getattr(obj, "trigger", None)
+        if obj is None:
+            raise ValueError(f"{self.update_trigger} is neither a Trigger nor an object which has a trigger.")
+        return obj
+
+    def start_frames(self) -> Tuple[Any, Optional[Trigger]]:
+        """
+        Prepares the bookkeeping of frames for the frame loop,
+        and returns the shutdown flag and the update trigger.
+        Timings of frames are recorded by `record_frame`, and
+        their summary is logged by `finish_frames`.
+        """
+        stats_table = self.getProcessSharedValue(FRAME_STATS_NAME)
+        self.__stats_table = stats_table
+        self.__stats_row = stats_table.index(self.name) if stats_table is not None else None
+        self.__update_seconds = self.getHistogram(metrics.UPDATE_SECONDS)
+        self.__next_log_metrics_time = 0.0
+        self.__first_update = True
+
+        self.logger.debug("periodic update")
+        self.__frame_scheduler.reset(time.perf_counter())
+        return self.getProcessSharedValue(SHUTDOWN_NAME), self.get_update_trigger()
+
+    def measure_update(self) -> ContextManager:
+        """Returns the context which measures the first `Update` by the startup profiler."""
+        if self.__first_update:
+            self.__first_update = False
+            return startup_profiler.measure(self.name, startup_profiler.FIRST_UPDATE)
+        return nullcontext()
+
+    def record_frame(self, start_time: float, update_end_time: float) -> None:
+        """
+        Records timings of the frame to `frame_stats` and publishes them to
+        the frame stats table. Update durations and log drops are also
+        recorded to built-in metrics.
+        Args:
+        - start_time: float
+            The time when `Update` was called.
+        - update_end_time: float
+            The time when `Update` returned.
+        """
+        end_time = time.perf_counter()
+        scheduler = self.__frame_scheduler
+        self.__frame_stats.record(update_end_time - start_time, end_time - update_end_time, end_time - start_time)
+        if self.__stats_table is not None:
+            stats = self.__frame_stats.stats(scheduler.late_frames, scheduler.skipped_frames)
+            self.__stats_table.write(self.__stats_row, stats)
+        self.__update_seconds.observe(update_end_time - start_time)
+        if end_time >= self.__next_log_metrics_time:
+            self.record_log_metrics()
+            self.__next_log_metrics_time = end_time + metrics.LOG_METRICS_INTERVAL
+
+    def finish_frames(self) -> None:
+        """Records log metrics and logs the summary of frame stats."""
+        scheduler = self.__frame_scheduler
+        self.record_log_metrics()
+        self.logger.info(
+            "frame stats: %s; %d frames were late, %d frames were skipped.",
+            self.__frame_stats.summary(),
+            scheduler.late_frames,
+            scheduler.skipped_frames,
+        )
 
     def periodic_update(self):
         """
         Calls override method `Update` at intervals determined by
         `frame_rate`, until shutdown.
+        Timings of frames are recorded to `frame_stats` and published to
+        the frame stats table, and their summary is logged at the end.
+        Update durations and log drops are also recorded to built-in metrics.
         """
-        shutdown = self.getProcessSharedValue(SHUTDOWN_NAME)
-        self.logger.debug("periodic update")
-        previous_time = time.time()
-        self.__start_time = previous_time
-        while not shutdown.value:
-            current_time = time.time()
-            self.Update(current_time - previous_time)
+        shutdown, trigger = self.start_frames()
+        scheduler = self.__frame_scheduler
+        scheduler.spin_threshold = self.get_spin_threshold()
+        if isinstance(shutdown, ShutdownFlag):
+            scheduler.sleep = shutdown.sleep  # shutdown interrupts sleeping.
+
+        previous_time = time.perf_counter()
+        while True:
+            if trigger is not None:
+                generation = trigger.generation
+            # Checked after reading the generation, so the notification at shutdown always wakes the wait.
+            if shutdown.value:
+                break
+            current_time = time.perf_counter()
+            with self.measure_update():
+                self.Update(current_time - previous_time)
             previous_time = current_time
+            update_end_time = time.perf_counter()
 
-            if self.frame_rate == 0.0:
-                # call `Update` once only when frame_rate is 0.
-                break
+            if trigger is not None:
+                # Notifications during `Update` wake up immediately.
+                trigger.wait(generation, self.trigger_timeout)
             elif self.frame_rate > 0.0:
                 self.adjust_update_frame_rate()
-            else:
-                # If the frame_rate is negative value,
-                # the next `Update` method is called immediately.
-                pass
+            # If the frame_rate is negative value,
+            # the next `Update` method is called immediately.
+
+            self.record_frame(current_time, update_end_time)
+            if self.frame_rate == 0.0 and trigger is None:
+                # call `Update` once only when frame_rate is 0.
+                break
+
+        self.finish_frames()
 
     def Update(self, delta_time: float) -> None:
         """
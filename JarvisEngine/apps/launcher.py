@@ -4,7 +4,11 @@ import threading
 from multiprocessing.managers import SyncManager
 from typing import *
 
+from ..constants import FRAME_STATS_NAME, METRICS_NAME
+from ..core import metrics
 from ..core import name as name_tools
+from ..core import startup_profiler
+from ..core.frame_stats import FrameStatsTable
 from ..core.value_sharing import FolderDictWithLock
 from .base_app import AttrDict, BaseApp
 
@@ -45,19 +49,58 @@ class Launcher(BaseApp):
     def prepare_for_launching(self, sync_manager: SyncManager) -> FolderDictWithLock:
         """Prepare for launching.
         Returns Process Shared Values after registering shared values,
+        the metrics registry and the frame stats table of all apps,
         and set None to Process Shared Values.
+        The metrics registry is registered first, so apps can
+        create metrics in `RegisterProcessSharedValues`.
         """
         p_sv = FolderDictWithLock(sep=name_tools.SEP, lock=mp.RLock())
+        p_sv[METRICS_NAME] = metrics.MetricsRegistry(self.get_all_app_names(), self.get_metrics_slots_per_app())
         self.set_process_shared_values_to_all_apps(p_sv)
-        self.RegisterProcessSharedValues(sync_manager)
+        with startup_profiler.measure(self.name, startup_profiler.REGISTER_PROCESS_SHARED_VALUES):
+            self.RegisterProcessSharedValues(sync_manager)
+        p_sv[FRAME_STATS_NAME] = FrameStatsTable(self.get_all_app_names())
         self.set_process_shared_values_to_all_apps(None)
         return p_sv
 
     def launch(self, process_shared_values: FolderDictWithLock) -> None:
-        """Launches all application processes/threads in background."""
+        """Launches all application processes/threads in background.
+        Process Shared Values are frozen before launching.
+        """
+        process_shared_values.freeze()
         self.launcher_thread = threading.Thread(target=super().launch, name=self.name, args=(process_shared_values,))
         self.launcher_thread.start()
 
+    def get_frame_stats(self) -> Dict[str, Dict[str, float]]:
+        """Returns the latest frame stats of all apps.
+        Please see `JarvisEngine.core.frame_stats.FIELDS`.
+        """
+        return self.getProcessSharedValue(FRAME_STATS_NAME).read_all()
+
+    def get_metrics_slots_per_app(self) -> int:
+        """Returns `metrics.slots_per_app` of engine config."""
+        metrics_conf = getattr(self.engine_config, "metrics", None)
+        return getattr(metrics_conf, "slots_per_app", 32)
+
+    def get_metrics(self) -> List[metrics.MetricValue]:
+        """Returns metrics of all apps, built-in metrics of their frame stats,
+        and metrics of queues in Process Shared Values.
+        Returns an empty list before launching.
+        Please see `JarvisEngine.core.metrics`.
+        """
+        p_sv = self.process_shared_values
+        if p_sv is None:
+            return []
+        values: List[metrics.MetricValue] = []
+        registry = cast(Optional[metrics.MetricsRegistry], p_sv[METRICS_NAME])
+        if registry is not None:
+            values.extend(registry.read_all())
+        stats_table = cast(Optional[FrameStatsTable], p_sv[FRAME_STATS_NAME])
+        if stats_table is not None:
+            values.extend(metrics.frame_stats_metrics(stats_table.read_all()))
+        values.extend(metrics.queue_metrics(p_sv))
+        return values
+
     def join(self):
         """Joins all application threads/processes."""
         self.launcher_thread.join()
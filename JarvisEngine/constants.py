@@ -11,3 +11,12 @@ DEFAULT_CONFIG_FILE_NAME = "config.json"
 
 # The name of value that tells `shutdown` of JarvisEngine to all apps.
 SHUTDOWN_NAME = "shutdown"
+
+# The name of table of frame timing stats of all apps.
+FRAME_STATS_NAME = "frame_stats"
+
+# The name of the startup profiler shared with all apps at `run --profile_startup`.
+STARTUP_PROFILER_NAME = "startup_profiler"
+
+# The name of the registry of metrics of all apps.
+METRICS_NAME = "metrics"
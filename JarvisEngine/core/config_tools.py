@@ -1,10 +1,22 @@
 import collections.abc
-from typing import Mapping
+import hashlib
+import json
+import os
+import pickle
+from typing import *
 
 import json5
 import toml
 from attr_dict import AttrDict
 
+# The key of include directives in json configs.
+INCLUDE_KEY = "include"
+# The key of child app configs, whose values are app configs.
+APPS_KEY = "apps"
+
+# The cache directory of parsed configs, relative to the project directory.
+CACHE_DIR_NAME = os.path.join("__pycache__", "config_cache")
+
 
 def read_toml(file_path: str, mode: str = "r", encoding: str = "utf-8", **kwds) -> dict:
     """read toml file."""
@@ -13,9 +25,15 @@ def read_toml(file_path: str, mode: str = "r", encoding: str = "utf-8", **kwds)
 
 
 def read_json(file_path: str, mode: str = "r", encoding: str = "utf-8", **kwds) -> dict:
-    """read json and json5 files."""
+    """read json and json5 files.
+    Plain json is parsed by the C `json` module, and falls back to `json5`.
+    """
     with open(file_path, mode, encoding=encoding, **kwds) as f:
-        return json5.load(f)
+        text = f.read()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return json5.loads(text)
 
 
 def dict2attr(d: dict) -> AttrDict:
@@ -32,3 +50,162 @@ def deep_update(d: dict, u: Mapping) -> dict:
             d[k] = v
 
     return d
+
+
+Stamp = Tuple[str, int, int]
+
+
+def file_stamp(file_path: str) -> Stamp:
+    """Returns (absolute path, mtime [ns], size) of file."""
+    stat = os.stat(file_path)
+    return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+class ConfigCache(object):
+    """
+    Cache of parsed configs, stored by pickle in `cache_dir`.
+    Each entry is valid while all files which it was made from
+    have the same path, mtime and size.
+    Broken or unwritable cache files are ignored.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir = cache_dir
+
+    def _cache_file(self, key: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".pickle")
+
+    def get(self, key: str) -> Optional[Tuple[Any, List[Stamp]]]:
+        """Returns (value, stamps) of key, or None if missing or outdated."""
+        try:
+            with open(self._cache_file(key), "rb") as f:
+                cached_key, stamps, value = pickle.load(f)
+            if cached_key != key or any(file_stamp(stamp[0]) != stamp for stamp in stamps):
+                return None
+        except Exception:
+            return None
+        return value, stamps
+
+    def set(self, key: str, value: Any, stamps: List[Stamp]) -> None:
+        """Store value of key made from files of `stamps`."""
+        cache_file = self._cache_file(key)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                pickle.dump((key, stamps, value), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+
+def _read_cached(
+    key: str, cache: Optional[ConfigCache], read: Callable[[], Tuple[Any, List[Stamp]]]
+) -> Tuple[Any, List[Stamp]]:
+    """Returns (value, stamps) from cache, or by `read` and stores it."""
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    value, stamps = read()
+    if cache is not None:
+        cache.set(key, value, stamps)
+    return value, stamps
+
+
+def _read_json_stamped(file_path: str, cache: Optional[ConfigCache]) -> Tuple[Any, List[Stamp]]:
+    """Parses a json file without resolving includes. Cached by file."""
+    file_path = os.path.abspath(file_path)
+
+    def read() -> Tuple[Any, List[Stamp]]:
+        stamp = file_stamp(file_path)
+        return read_json(file_path), [stamp]
+
+    return _read_cached(f"json:{file_path}", cache, read)
+
+
+def _resolve_apps_includes(
+    apps: Any, base_dir: str, cache: Optional[ConfigCache], stamps: List[Stamp], including: Tuple[str, ...]
+) -> Any:
+    """Resolve include directives of app configs in `apps` (`{name: app config}`)."""
+    if not isinstance(apps, dict):
+        return apps
+    return {name: _resolve_app_includes(conf, base_dir, cache, stamps, including) for name, conf in apps.items()}
+
+
+def _resolve_app_includes(
+    conf: Any, base_dir: str, cache: Optional[ConfigCache], stamps: List[Stamp], including: Tuple[str, ...]
+) -> Any:
+    """Replace the include directive of the app config, and of its child apps recursively.
+    Only app configs have include directives, so `include` keys in other objects are kept.
+    """
+    if not isinstance(conf, dict):
+        return conf
+
+    conf = dict(conf)
+    if APPS_KEY in conf:
+        conf[APPS_KEY] = _resolve_apps_includes(conf[APPS_KEY], base_dir, cache, stamps, including)
+    if INCLUDE_KEY not in conf:
+        return conf
+
+    paths = conf.pop(INCLUDE_KEY)
+    if isinstance(paths, str):
+        paths = [paths]
+    merged: Dict[str, Any] = {}
+    for path in paths:
+        included = _read_app_config(os.path.join(base_dir, path), cache, stamps, including)
+        if not isinstance(included, dict):
+            raise ValueError(f"Included config {path} must be an object, but {type(included).__name__}.")
+        deep_update(merged, included)
+    return deep_update(merged, conf)
+
+
+def _read_app_config(
+    file_path: str, cache: Optional[ConfigCache], stamps: List[Stamp], including: Tuple[str, ...]
+) -> Any:
+    """Read the included app config, and resolve its include directives."""
+    file_path = os.path.abspath(file_path)
+    if file_path in including:
+        raise ValueError(f"Circular include of {file_path}.")
+    value, file_stamps = _read_json_stamped(file_path, cache)
+    stamps.extend(file_stamps)
+    return _resolve_app_includes(value, os.path.dirname(file_path), cache, stamps, including + (file_path,))
+
+
+def read_project_config(file_path: str, cache: ConfigCache = None) -> dict:
+    """read the project config (`config.json`) and resolve include directives.
+
+    An app config which has `"include": "<path>"` (or a list of paths) is
+    merged into the included json configs. The paths are relative to
+    the including file, and keys of the app config override included ones.
+    >>> "MyApp": {"include": "MyApp/config.json", "thread": false}
+    Only app configs (values of the project config and of `apps`) have
+    include directives, so `include` keys in other objects are kept.
+
+    If `cache` is given, parsed configs are cached, and only changed
+    files are parsed again.
+    """
+    file_path = os.path.abspath(file_path)
+
+    def read() -> Tuple[Any, List[Stamp]]:
+        config, stamps = _read_json_stamped(file_path, cache)
+        stamps = list(stamps)
+        config = _resolve_apps_includes(config, os.path.dirname(file_path), cache, stamps, (file_path,))
+        return config, stamps
+
+    return _read_cached(f"project:{file_path}", cache, read)[0]
+
+
+def read_engine_config(file_path: str, default_file_path: str, cache: ConfigCache = None) -> dict:
+    """read the engine config and merge it into the default engine config.
+    If `cache` is given, the merged config is cached.
+    """
+    file_path = os.path.abspath(file_path)
+    default_file_path = os.path.abspath(default_file_path)
+
+    def read() -> Tuple[Any, List[Stamp]]:
+        stamps = [file_stamp(default_file_path), file_stamp(file_path)]
+        config = deep_update(read_toml(default_file_path), read_toml(file_path))
+        return config, stamps
+
+    return _read_cached(f"engine:{default_file_path}:{file_path}", cache, read)[0]
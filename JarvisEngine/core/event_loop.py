@@ -0,0 +1,31 @@
+"""
+The asyncio event loop shared among async apps in a process.
+
+The loop runs forever in a daemon thread, which is started at the first
+call of `get_process_event_loop` in each process.
+"""
+import asyncio
+import os
+import threading
+from typing import *
+
+EVENT_LOOP_THREAD_NAME = "JarvisEngine.event_loop"
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_pid: Optional[int] = None
+_lock = threading.Lock()
+
+
+def get_process_event_loop() -> asyncio.AbstractEventLoop:
+    """Returns the running event loop of this process.
+    A forked process does not inherit the loop of its parent,
+    and starts a new one.
+    """
+    global _loop, _loop_pid
+    with _lock:
+        if _loop is None or _loop_pid != os.getpid():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name=EVENT_LOOP_THREAD_NAME, daemon=True)
+            thread.start()
+            _loop, _loop_pid = loop, os.getpid()
+        return _loop
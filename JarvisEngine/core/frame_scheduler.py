@@ -0,0 +1,114 @@
+"""
+Deadline-based frame scheduling.
+
+Deadlines are absolute times on a monotonic clock (`time.perf_counter`),
+so errors of sleeping do not accumulate and the frame rate does not drift.
+
+Overrun policies decide the next deadline when a frame is late.
+- CATCH_UP
+    Keep every deadline. Missed frames are called immediately
+    until the schedule is caught up.
+- SKIP
+    Drop missed frames and wait for the next deadline on the original grid.
+- REPHASE
+    Start a new grid of deadlines from the late frame.
+
+`time.sleep` overshoots by tens of microseconds or more. For high frame rates,
+set `spin_threshold` to sleep coarsely until that many seconds before
+the deadline and spin for the rest. Larger thresholds are more accurate
+and use more CPU.
+"""
+import math
+import time
+from typing import *
+
+CATCH_UP = "catch_up"
+SKIP = "skip"
+REPHASE = "rephase"
+OVERRUN_POLICIES = (CATCH_UP, SKIP, REPHASE)
+
+
+class FrameScheduler(object):
+    """
+    Computes absolute deadlines of frames and sleeps until them.
+
+    Attrs:
+    - start_time: float
+        The deadline (start time) of current frame.
+        `-inf` until the first frame.
+    - late_frames: int
+        The number of frames which were late for their deadlines.
+    - skipped_frames: int
+        The number of frames dropped by `SKIP` policy.
+    - spin_threshold: float
+        Seconds of spinning before deadlines. If 0, never spins.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], Any] = time.sleep,
+        spin_threshold: float = 0.0,
+    ) -> None:
+        """
+        Args:
+        - clock
+            Monotonic clock returns seconds.
+        - sleep
+            The function sleeps given seconds.
+            If it returns True, sleeping was interrupted and spinning is skipped.
+            (ex. `ShutdownFlag.sleep`)
+        - spin_threshold
+            Seconds of spinning before deadlines.
+        """
+        self.clock = clock
+        self.sleep = sleep
+        self.spin_threshold = spin_threshold
+        self.reset()
+
+    def reset(self, start_time: float = float("-inf")) -> None:
+        """Reset the start time of frame and statistics."""
+        self.start_time = start_time
+        self.late_frames = 0
+        self.skipped_frames = 0
+
+    def next_deadline(self, period: float, overrun_policy: str = SKIP) -> float:
+        """
+        Advance to the next frame and returns its deadline.
+        The first call returns the current time.
+        """
+        now = self.clock()
+        if self.start_time == float("-inf"):
+            self.start_time = now
+            return now
+
+        deadline = self.start_time + period
+        if now > deadline:
+            self.late_frames += 1
+            if overrun_policy == CATCH_UP:
+                pass
+            elif overrun_policy == SKIP:
+                missed = math.ceil((now - deadline) / period)
+                self.skipped_frames += missed
+                deadline += missed * period
+            elif overrun_policy == REPHASE:
+                deadline = now
+            else:
+                raise ValueError(f"Unknown overrun policy {overrun_policy}. Please {OVERRUN_POLICIES}.")
+
+        self.start_time = deadline
+        return deadline
+
+    def wait(self, period: float, overrun_policy: str = SKIP) -> None:
+        """Sleep until the deadline of next frame."""
+        self.sleep_until(self.next_deadline(period, overrun_policy))
+
+    def sleep_until(self, deadline: float) -> None:
+        """Sleep until `deadline`, and spin for the last `spin_threshold` seconds."""
+        clock = self.clock
+        wait_time = deadline - clock() - self.spin_threshold
+        if wait_time > 0 and self.sleep(wait_time) is True:
+            return  # interrupted.
+        if self.spin_threshold > 0:
+            while clock() < deadline:
+                pass
@@ -0,0 +1,160 @@
+"""
+Per-app frame timing statistics.
+
+Each app records timings of its frames into `FrameStatsRecorder`, and
+publishes them to its row of `FrameStatsTable`, which is shared
+among all app processes. So the Launcher can read stats of every app.
+"""
+from typing import *
+
+import numpy as np
+
+from .value_sharing import SharedMemoryObject
+
+# Fields of a row of `FrameStatsTable`.
+FIELDS = (
+    "frames",
+    "update_time",
+    "mean_update_time",
+    "max_update_time",
+    "mean_sleep_time",
+    "fps",
+    "late_frames",
+    "skipped_frames",
+)
+
+
+class FrameStatsRecorder(object):
+    """
+    Records update durations, sleep times and frame periods
+    into fixed-size ring buffers. Recording a frame is O(1).
+
+    Attrs:
+    - frames: int
+        The number of recorded frames.
+    - max_update_time: float
+        The longest update duration of all frames.
+    """
+
+    def __init__(self, window: int = 256) -> None:
+        """
+        Args:
+        - window
+            The number of latest frames used for means and percentiles.
+        """
+        self.window = window
+        self.update_times = [0.0] * window
+        self.sleep_times = [0.0] * window
+        self.periods = [0.0] * window
+        self.frames = 0
+        self.max_update_time = 0.0
+        self._sum_update_time = 0.0
+        self._sum_sleep_time = 0.0
+        self._sum_period = 0.0
+
+    def record(self, update_time: float, sleep_time: float, period: float) -> None:
+        """Record timings of a frame."""
+        i = self.frames % self.window
+        # Running sums of the window.
+        self._sum_update_time += update_time - self.update_times[i]
+        self._sum_sleep_time += sleep_time - self.sleep_times[i]
+        self._sum_period += period - self.periods[i]
+        self.update_times[i] = update_time
+        self.sleep_times[i] = sleep_time
+        self.periods[i] = period
+        self.frames += 1
+        if update_time > self.max_update_time:
+            self.max_update_time = update_time
+
+    def _latest(self, values: List[float]) -> np.ndarray:
+        return np.asarray(values[: min(self.frames, self.window)])
+
+    def stats(self, late_frames: int = 0, skipped_frames: int = 0) -> Tuple[float, ...]:
+        """Returns a row of `FrameStatsTable`, in order of `FIELDS`."""
+        n = min(self.frames, self.window)
+        if n == 0:
+            return (0.0,) * len(FIELDS)
+        last = self.update_times[(self.frames - 1) % self.window]
+        mean_period = self._sum_period / n
+        return (
+            self.frames,
+            last,
+            self._sum_update_time / n,
+            self.max_update_time,
+            self._sum_sleep_time / n,
+            1 / mean_period if mean_period > 0 else 0.0,
+            late_frames,
+            skipped_frames,
+        )
+
+    def summary(self) -> str:
+        """Returns a summary text of the latest frames."""
+        if self.frames == 0:
+            return "no frames."
+        update_times = self._latest(self.update_times) * 1e3
+        p50, p99 = np.percentile(update_times, [50, 99])
+        periods = self._latest(self.periods)
+        mean_period = periods.mean()
+        fps = 1 / mean_period if mean_period > 0 else 0.0
+        return (
+            f"{self.frames} frames, {fps:.1f} fps, update time [ms] "
+            f"p50 {p50:.3f}, p99 {p99:.3f}, max {self.max_update_time * 1e3:.3f}, "
+            f"mean sleep time [ms] {self._latest(self.sleep_times).mean() * 1e3:.3f}"
+        )
+
+
+class FrameStatsTable(SharedMemoryObject):
+    """
+    Table of frame stats of all apps on shared memory.
+    Each row is written by one app only, in order of `FIELDS`.
+
+    Rows are written without locks, so a row read during writing
+    may mix values of two successive frames.
+
+    Ex:
+    >>> table = FrameStatsTable(["Launcher", "Launcher.App"])
+    >>> table.write("Launcher.App", recorder.stats())  # app
+    >>> table.read_all()  # Launcher
+    {"Launcher": {"frames": 0.0, ...}, "Launcher.App": {"frames": 120.0, ...}}
+    """
+
+    _shm_views = ("_rows",)
+
+    def __init__(self, app_names: Iterable[str]) -> None:
+        """
+        Args:
+        - app_names
+            Full names of apps which have rows.
+        """
+        self._app_names = tuple(app_names)
+        self._indices = {n: i for i, n in enumerate(self._app_names)}
+        super().__init__(max(len(self._app_names), 1) * len(FIELDS) * 8)
+
+    def _attach(self) -> None:
+        self._rows: np.ndarray = np.ndarray((len(self._app_names), len(FIELDS)), np.float64, buffer=self.buf)
+
+    @property
+    def app_names(self) -> Tuple[str, ...]:
+        return self._app_names
+
+    def index(self, app_name: str) -> int:
+        """Returns the row index of `app_name`."""
+        return self._indices[app_name]
+
+    def write(self, app: Union[str, int], stats: Sequence[float]) -> None:
+        """Write stats to the row of app name or row index."""
+        if isinstance(app, str):
+            app = self._indices[app]
+        self._rows[app] = stats
+
+    def read(self, app_name: str) -> Dict[str, float]:
+        """Returns stats of `app_name` as a dict of `FIELDS`."""
+        return dict(zip(FIELDS, self._rows[self._indices[app_name]].tolist()))
+
+    def read_all(self) -> Dict[str, Dict[str, float]]:
+        """Returns stats of all apps."""
+        rows = self._rows.tolist()
+        return {n: dict(zip(FIELDS, row)) for n, row in zip(self._app_names, rows)}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(app_names={self.app_names}, name={self.name!r})"
@@ -0,0 +1,184 @@
+"""
+Buffered log shipping.
+
+`BufferedHandler` queues log records in memory instead of sending
+each of them at the log call, and a background thread sends them to
+the target `SocketHandler` in batches, with one socket write per batch.
+The thread flushes when `flush_size` records are queued, or every
+`flush_interval` seconds.
+
+When the buffer is full, a record which repeats the last queued one
+is coalesced into it ("(repeated N times)"), and the others are dropped.
+The numbers of dropped records are reported by warnings in the next batch.
+"""
+import logging
+import logging.handlers
+import os
+import threading
+from typing import *
+
+FLUSH_THREAD_NAME = "JarvisEngine.log_flusher"
+
+
+def _is_repeat(last: logging.LogRecord, record: logging.LogRecord) -> bool:
+    """Whether `record` is the same log call as `last`."""
+    if last.name != record.name or last.levelno != record.levelno or last.msg != record.msg:
+        return False
+    try:
+        return bool(last.args == record.args)
+    except Exception:  # ex. numpy arrays in args.
+        return False
+
+
+class BufferedHandler(logging.Handler):
+    """
+    Queues records and sends them to `target` in batches
+    from a background thread.
+
+    Attrs:
+    - target: SocketHandler
+        The handler which sends batches.
+    - dropped_records: int
+        The total number of dropped records.
+    """
+
+    def __init__(
+        self,
+        target: logging.handlers.SocketHandler,
+        capacity: int = 10000,
+        flush_size: int = 100,
+        flush_interval: float = 0.1,
+    ) -> None:
+        """
+        Args:
+        - target
+            The handler which sends batches. It must have
+            `makePickle` and `send` methods.
+        - capacity
+            The max number of queued records.
+        - flush_size
+            Flushes when this number of records are queued.
+        - flush_interval
+            Flushes at least every this seconds.
+        """
+        super().__init__()
+        self.target = target
+        self.capacity = capacity
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.dropped_records = 0
+        self._init_buffer()
+
+    def _init_buffer(self) -> None:
+        """Initialize the buffer, locks and flush thread of this process.
+        Called again in forked processes.
+        """
+        self._pid = os.getpid()
+        self._records: List[logging.LogRecord] = []
+        self._dropped: Dict[str, int] = {}
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def _reinit_after_fork(self) -> None:
+        if getattr(self.target, "sock", None) is not None:
+            self.target.sock = None  # do not write to the connection of parent process.
+        self._init_buffer()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue the record. Never blocks on sending."""
+        if self._pid != os.getpid():
+            self._reinit_after_fork()
+
+        with self._condition:
+            records = self._records
+            if len(records) >= self.capacity:
+                last = records[-1]
+                if _is_repeat(last, record):
+                    setattr(last, "repeats", getattr(last, "repeats", 1) + 1)
+                else:
+                    self._dropped[record.name] = self._dropped.get(record.name, 0) + 1
+                    self.dropped_records += 1
+                return
+            records.append(record)
+            if len(records) >= self.flush_size:
+                self._condition.notify()
+
+        if self._thread is None:
+            self._start_thread()
+
+    def _start_thread(self) -> None:
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name=FLUSH_THREAD_NAME, daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            with self._condition:
+                self._condition.wait_for(self._should_flush, self.flush_interval)
+            self.flush()
+
+    def _should_flush(self) -> bool:
+        return len(self._records) >= self.flush_size or self._closed
+
+    @staticmethod
+    def _prepare(record: logging.LogRecord) -> logging.LogRecord:
+        repeats = getattr(record, "repeats", 1)
+        if repeats > 1:
+            record.msg = f"{record.getMessage()} (repeated {repeats} times)"
+            record.args = None
+            setattr(record, "repeats", 1)
+        return record
+
+    def _take(self) -> List[logging.LogRecord]:
+        """Take queued records and warnings of dropped records."""
+        with self._condition:
+            records, self._records = self._records, []
+            dropped, self._dropped = self._dropped, {}
+        for name, num in dropped.items():
+            records.append(
+                logging.makeLogRecord(
+                    {
+                        "name": name,
+                        "levelno": logging.WARNING,
+                        "levelname": logging.getLevelName(logging.WARNING),
+                        "msg": f"{num} log records were dropped because the log buffer was full.",
+                    }
+                )
+            )
+        return records
+
+    def flush(self) -> None:
+        """Send all queued records as a batch. Blocks until sent."""
+        if self._pid != os.getpid():
+            self._reinit_after_fork()
+
+        with self._flush_lock:  # keeps the order of batches.
+            records = self._take()
+            if not records:
+                return
+            chunks = []
+            for record in records:
+                try:
+                    chunks.append(self.target.makePickle(self._prepare(record)))
+                except Exception:
+                    self.handleError(record)
+            try:
+                self.target.send(b"".join(chunks))
+            except Exception:
+                self.handleError(records[0])
+
+    def close(self) -> None:
+        """Stop the flush thread, and send all queued records."""
+        self._closed = True
+        with self._condition:
+            self._condition.notify()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread() and self._pid == os.getpid():
+            thread.join()
+        self.flush()
+        self.target.close()
+        super().close()
@@ -0,0 +1,112 @@
+"""
+Rate limiting and sampling of app logs.
+
+`LogLimiter` decides whether each record of an app logger is sent,
+in the app process, so a flooding app does not saturate the LoggingServer.
+
+- Sampling: Only 1 in `sample_repeats` consecutive repeats of the same
+  message (the same level and format string) is logged.
+- Rate limit: A token bucket allows `rate_limit` records per second
+  on average, and bursts of `rate_burst` records.
+
+The numbers of suppressed records are appended to the message of the
+next logged record, so they never cost a record over the rate limit,
+and logged by a warning when the logger is flushed.
+"""
+import logging
+import time
+from typing import *
+
+
+class LogLimiter(object):
+    """
+    Rate limit and sampling of a logger.
+    Not locked: concurrent log calls from threads may be counted inexactly.
+
+    Attrs:
+    - suppressed_records: int
+        The total number of suppressed records which were reported.
+    """
+
+    def __init__(self, rate_limit: float = 0.0, rate_burst: int = 100, sample_repeats: int = 0) -> None:
+        """
+        Args:
+        - rate_limit
+            Records per second. 0 disables the rate limit.
+        - rate_burst
+            The max number of records logged at once over the rate limit.
+        - sample_repeats
+            Logs 1 in this number of consecutive repeats. 0 or 1 disables sampling.
+        """
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.sample_repeats = sample_repeats
+        self.suppressed_records = 0
+
+        self._tokens = float(rate_burst)
+        self._last_time = time.monotonic()
+        self._last_levelno: Optional[int] = None
+        self._last_msg: Optional[str] = None
+        self._repeats = 0
+        self._sampled = 0
+        self._rate_limited = 0
+
+    def _is_repeat(self, record: logging.LogRecord) -> bool:
+        msg = record.msg
+        repeat = record.levelno == self._last_levelno and type(msg) is str and msg == self._last_msg
+        self._last_levelno = record.levelno
+        self._last_msg = msg if type(msg) is str else None
+        return repeat
+
+    def allow(self, record: logging.LogRecord) -> bool:
+        """Whether record is logged. Counts suppressed records."""
+        if self.sample_repeats > 1:
+            self._repeats = self._repeats + 1 if self._is_repeat(record) else 0
+            if self._repeats % self.sample_repeats != 0:
+                self._sampled += 1
+                return False
+
+        if self.rate_limit > 0:
+            now = time.monotonic()
+            self._tokens = min(self.rate_burst, self._tokens + (now - self._last_time) * self.rate_limit)
+            self._last_time = now
+            if self._tokens < 1.0:
+                self._rate_limited += 1
+                return False
+            self._tokens -= 1.0
+        return True
+
+    def _take_summary_message(self) -> Optional[str]:
+        """Returns the message of records suppressed since the last summary,
+        or None if no records were suppressed.
+        """
+        suppressed = self._rate_limited + self._sampled
+        if suppressed == 0:
+            return None
+        msg = (
+            f"{suppressed} log records were suppressed "
+            f"({self._rate_limited} by the rate limit, {self._sampled} by sampling)."
+        )
+        self.suppressed_records += suppressed
+        self._rate_limited = self._sampled = 0
+        return msg
+
+    def append_summary(self, record: logging.LogRecord) -> None:
+        """Appends the number of records suppressed since the last summary
+        to the message of the allowed record.
+        """
+        msg = self._take_summary_message()
+        if msg is not None:
+            record.msg = f"{record.getMessage()} [{msg}]"
+            record.args = None
+
+    def take_summary(self, name: str) -> Optional[logging.LogRecord]:
+        """Returns the warning record of records suppressed since the last summary,
+        or None if no records were suppressed.
+        """
+        msg = self._take_summary_message()
+        if msg is None:
+            return None
+        return logging.makeLogRecord(
+            {"name": name, "levelno": logging.WARNING, "levelname": logging.getLevelName(logging.WARNING), "msg": msg}
+        )
@@ -0,0 +1,247 @@
+"""
+LoggingServer which runs in its own process.
+
+The server receives log records from `Logger`s of all apps (the protocol
+of `logging.handlers.SocketHandler`), and puts them into a bounded queue.
+One writer thread takes records from the queue and handles them by
+the loggers of the server process (root logger components).
+So heavy log traffic does not compete with apps in the main process for the GIL.
+
+When the queue is full, the overflow policy decides:
+- "block": Receiving waits, so senders are slowed down by TCP backpressure.
+- "drop": The record is dropped and counted. The number of dropped
+  records is logged as a warning.
+
+At `shutdown`, the server stops accepting, receives records until
+all connections are closed or idle, and handles all queued records.
+"""
+import logging
+import multiprocessing as mp
+import multiprocessing.synchronize
+import pickle
+import queue
+import signal
+import socket
+import socketserver
+import struct
+import threading
+from typing import *
+
+from attr_dict import AttrDict
+
+BLOCK = "block"
+DROP = "drop"
+OVERFLOW_POLICIES = (BLOCK, DROP)
+
+SERVER_PROCESS_NAME = "JarvisEngine.LoggingServer"
+
+# Seconds to check stopping in receiving threads.
+POLL_INTERVAL = 0.1
+
+_LENGTH = struct.Struct(">L")
+
+
+class _RecordStreamHandler(socketserver.BaseRequestHandler):
+    """Receives length-prefixed pickled records from a connection."""
+
+    server: "QueueingLogServer"
+
+    def handle(self) -> None:
+        conn: socket.socket = self.request
+        conn.settimeout(POLL_INTERVAL)
+        buf = bytearray()
+        while True:
+            try:
+                chunk = conn.recv(65536)
+            except socket.timeout:
+                if self.server.stopping.is_set():
+                    break
+                continue
+            except OSError:
+                break
+            if not chunk:
+                break
+            buf += chunk
+
+            offset = 0
+            while len(buf) - offset >= _LENGTH.size:
+                (length,) = _LENGTH.unpack_from(buf, offset)
+                end = offset + _LENGTH.size + length
+                if len(buf) < end:
+                    break
+                self.server.put(pickle.loads(buf[offset + _LENGTH.size : end]))
+                offset = end
+            del buf[:offset]
+
+
+class QueueingLogServer(socketserver.ThreadingTCPServer):
+    """
+    TCP log server with a bounded record queue and a writer thread.
+
+    Attrs:
+    - handled_records: int
+    - dropped_records: int
+    """
+
+    allow_reuse_address = True
+    daemon_threads = False
+    block_on_close = True
+    request_queue_size = 128  # many app processes connect at once.
+
+    def __init__(self, host: str, port: int, queue_size: int = 10000, overflow: str = BLOCK) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow}. Please {OVERFLOW_POLICIES}.")
+        super().__init__((host, port), _RecordStreamHandler)
+        self.queue: queue.Queue = queue.Queue(queue_size)
+        self.overflow = overflow
+        self.stopping = threading.Event()
+        self.handled_records = 0
+        self.dropped_records = 0
+        self._reported_drops = 0
+        self._drop_lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+
+    def put(self, record_dict: Dict[str, Any]) -> None:
+        """Put a received record into the queue by the overflow policy."""
+        if self.overflow == BLOCK:
+            self.queue.put(record_dict)
+            return
+        try:
+            self.queue.put_nowait(record_dict)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped_records += 1
+
+    def start_writer(self) -> None:
+        self._writer = threading.Thread(target=self._write, name=f"{SERVER_PROCESS_NAME}.writer")
+        self._writer.start()
+
+    def _write(self) -> None:
+        while (record_dict := self.queue.get()) is not None:
+            record = logging.makeLogRecord(record_dict)
+            logging.getLogger(record.name).handle(record)
+            self.handled_records += 1
+            if self.queue.empty():
+                self.report_drops()
+        self.report_drops()
+
+    def report_drops(self) -> None:
+        """Log the number of dropped records since the last report."""
+        dropped = self.dropped_records - self._reported_drops
+        if dropped > 0:
+            self._reported_drops += dropped
+            logging.getLogger(SERVER_PROCESS_NAME).warning(
+                f"{dropped} log records were dropped because the queue of LoggingServer was full."
+            )
+
+    def stop(self) -> None:
+        """Stop accepting, wait for receiving threads, and handle all queued records.
+        Call from other thread than `serve_forever`.
+        """
+        self.stopping.set()
+        self.shutdown()
+        self.server_close()  # joins receiving threads.
+        if self._writer is not None:
+            self.queue.put(None)
+            self._writer.join()
+
+
+def _serve(
+    host: str,
+    port: int,
+    queue_size: int,
+    overflow: str,
+    log_conf: Optional[AttrDict],
+    ready: multiprocessing.synchronize.Event,
+    stop: multiprocessing.synchronize.Event,
+    counts: Any,
+) -> None:
+    """Target of the server process."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # stopped by `shutdown` of the main process.
+    if log_conf is not None:
+        from .logging_tool import setRootLoggerComponents
+
+        logging.getLogger().handlers.clear()  # inherited by fork.
+        setRootLoggerComponents(log_conf)
+
+    server = QueueingLogServer(host, port, queue_size, overflow)
+    server.start_writer()
+    serve_thread = threading.Thread(target=server.serve_forever, args=(POLL_INTERVAL,), name=SERVER_PROCESS_NAME)
+    serve_thread.start()
+    ready.set()
+
+    while not stop.wait(POLL_INTERVAL):
+        counts[0], counts[1] = server.handled_records, server.dropped_records
+    server.stop()
+    serve_thread.join()
+    counts[0], counts[1] = server.handled_records, server.dropped_records
+    for handler in logging.getLogger().handlers:
+        handler.close()  # forked processes exit without `logging.shutdown`.
+
+
+class LoggingServerProcess(object):
+    """
+    Runs `QueueingLogServer` in a dedicated process.
+    The interface is same as `LoggingServer` (`start` and `shutdown`).
+
+    Attrs:
+    - handled_records: int
+        The property. The number of handled records, updated periodically.
+    - dropped_records: int
+        The property. The number of dropped records, updated periodically.
+    """
+
+    def __init__(
+        self, host: str, port: int, queue_size: int = 10000, overflow: str = BLOCK, log_conf: AttrDict = None
+    ) -> None:
+        """
+        Args:
+        - host, port
+            The address of the server.
+        - queue_size
+            The max number of queued records.
+        - overflow
+            "block" or "drop". Please see `JarvisEngine.core.log_server`.
+        - log_conf (optional)
+            If given, root logger components of the server process are set by it.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow}. Please {OVERFLOW_POLICIES}.")
+        self.server_address = (host, port)
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.log_conf = log_conf
+        self._ready = mp.Event()
+        self._stop = mp.Event()
+        self._counts = mp.RawArray("Q", 2)
+        self._process: Optional[mp.Process] = None
+
+    def start(self) -> None:
+        """Start the server process, and wait until it accepts connections."""
+        host, port = self.server_address
+        self._process = mp.Process(
+            target=_serve,
+            args=(host, port, self.queue_size, self.overflow, self.log_conf, self._ready, self._stop, self._counts),
+            name=SERVER_PROCESS_NAME,
+            daemon=True,
+        )
+        self._process.start()
+        while not self._ready.wait(POLL_INTERVAL):
+            if not self._process.is_alive():
+                raise RuntimeError(f"LoggingServer process could not start on {host}:{port}.")
+
+    def shutdown(self) -> None:
+        """Handle all received records and stop the server process."""
+        if self._process is None:
+            return
+        self._stop.set()
+        self._process.join()
+        self._process = None
+
+    @property
+    def handled_records(self) -> int:
+        return self._counts[0]
+
+    @property
+    def dropped_records(self) -> int:
+        return self._counts[1]
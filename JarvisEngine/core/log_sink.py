@@ -0,0 +1,361 @@
+"""
+Binary log sink of the LoggingServer.
+
+`BinaryLogHandler` writes records to compact binary files instead of
+formatted text, so heavy logs are written fast and can be queried
+afterwards by `read_entries` (`python -m JarvisEngine logs`).
+
+File format (`*.jelog`):
+    MAGIC, and records of
+    [length: u32][created: f64][levelno: u8][name length: u16][message length: u32][name][message][extras]
+    Integers are little endian and strings are utf-8. `extras` is JSON of
+    non-standard attributes of the record (ex. `extra=` of log calls), or empty.
+
+Records are buffered and written in blocks. Each block is indexed in
+`*.jelog.idx` by
+    [min created: f64][max created: f64][offset: u64][length: u32][max levelno: u8]
+so readers seek only the blocks which can match their filters.
+
+Files are rotated by size and time, and named by their opening time,
+so the sorted file names are chronological.
+"""
+import fnmatch
+import heapq
+import json
+import logging
+import os
+import struct
+import threading
+import time
+from typing import *
+
+MAGIC = b"JELOG\x01\n"
+FILE_SUFFIX = ".jelog"
+INDEX_SUFFIX = ".idx"
+FLUSH_THREAD_NAME = "JarvisEngine.log_sink_flusher"
+
+_LENGTH = struct.Struct("<I")
+_HEADER = struct.Struct("<dBHI")
+_INDEX = struct.Struct("<ddQIB")
+# (min_created, max_created, offset, length, max_levelno) of a block.
+_IndexEntry = Tuple[float, float, int, int, int]
+
+# Attributes of records which are not written as extras.
+_STANDARD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime", "repeats"}
+
+_FORMATTER = logging.Formatter()
+
+
+class LogEntry(NamedTuple):
+    """A record read from log files."""
+
+    created: float
+    levelno: int
+    name: str
+    message: str
+    extras: Dict[str, Any]
+
+    @property
+    def levelname(self) -> str:
+        return logging.getLevelName(self.levelno)
+
+    def to_record(self) -> logging.LogRecord:
+        """Returns `LogRecord` to format by `logging.Formatter`."""
+        record = logging.makeLogRecord(self.extras)
+        record.name = self.name
+        record.levelno = self.levelno
+        record.levelname = self.levelname
+        record.msg = self.message
+        record.created = self.created
+        record.msecs = int((self.created - int(self.created)) * 1000) + 0.0
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "created": self.created,
+            "levelname": self.levelname,
+            "name": self.name,
+            "message": self.message,
+            **self.extras,
+        }
+
+
+def encode_record(record: logging.LogRecord) -> bytes:
+    """Encodes record into a length-prefixed binary record."""
+    message = record.getMessage()
+    if record.exc_text:
+        message = f"{message}\n{record.exc_text}"
+    if record.stack_info:
+        message = f"{message}\n{record.stack_info}"
+    attrs = record.__dict__
+    extra_keys = attrs.keys() - _STANDARD_ATTRS
+    if extra_keys:
+        extras_bytes = json.dumps({k: attrs[k] for k in sorted(extra_keys)}, default=repr).encode()
+    else:
+        extras_bytes = b""
+
+    name = record.name.encode()
+    msg = message.encode()
+    header = _HEADER.pack(record.created, min(record.levelno, 255), len(name), len(msg))
+    return _LENGTH.pack(len(header) + len(name) + len(msg) + len(extras_bytes)) + header + name + msg + extras_bytes
+
+
+class BinaryLogHandler(logging.Handler):
+    """
+    Writes records to binary log files in `log_dir`.
+
+    Records are buffered in memory, and written as a block when
+    `buffer_size` bytes are buffered or every `flush_interval` seconds.
+    Records of forked processes are ignored, because their apps send
+    records to the LoggingServer.
+    """
+
+    def __init__(
+        self,
+        log_dir: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        rotate_interval: float = 3600.0,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        max_files: int = 0,
+    ) -> None:
+        """
+        Args:
+        - log_dir
+            The directory of log files. It is made if not exists.
+        - max_bytes
+            Rotates to a new file when a file exceeds this size. 0 disables.
+        - rotate_interval
+            Rotates to a new file every this seconds. 0 disables.
+        - buffer_size
+            Writes a block when this number of bytes are buffered.
+        - flush_interval
+            Writes a block at least every this seconds.
+        - max_files
+            Removes the oldest files when there are more files. 0 keeps all.
+        """
+        super().__init__()
+        self.log_dir = os.path.abspath(log_dir)
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_files = max_files
+        os.makedirs(self.log_dir, exist_ok=True)
+
+        self._pid = os.getpid()
+        self._file: Optional[BinaryIO] = None
+        self._index: Optional[BinaryIO] = None
+        self._file_size = 0
+        self._opened_at = 0.0
+        self._sequence = 0
+        self._buffer = bytearray()
+        self._block: Optional[List[float]] = None  # [min created, max created, max levelno]
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=FLUSH_THREAD_NAME, daemon=True)
+        self._thread.start()
+
+    @property
+    def file_path(self) -> Optional[str]:
+        """The path to the current log file, or None before the first write."""
+        return None if self._file is None else self._file.name
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._pid != os.getpid():
+            return
+        try:
+            if record.exc_info and not record.exc_text:
+                record.exc_text = _FORMATTER.formatException(record.exc_info)
+            data = encode_record(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        created, levelno = record.created, record.levelno
+        block = self._block
+        if block is None:
+            self._block = [created, created, levelno]
+        else:
+            if created < block[0]:
+                block[0] = created
+            if created > block[1]:
+                block[1] = created
+            if levelno > block[2]:
+                block[2] = levelno
+        self._buffer += data
+        if len(self._buffer) >= self.buffer_size:
+            self._write_block()
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records as a block."""
+        if self._pid != os.getpid():
+            return
+        with self.lock:
+            self._write_block()
+
+    def _write_block(self) -> None:
+        if not self._buffer:
+            return
+        self._rotate_if_needed(len(self._buffer))
+        min_created, max_created, max_levelno = self._block
+        offset = self._file_size
+        self._file.write(self._buffer)
+        self._file.flush()
+        self._index.write(_INDEX.pack(min_created, max_created, offset, len(self._buffer), min(int(max_levelno), 255)))
+        self._index.flush()
+        self._file_size += len(self._buffer)
+        self._buffer = bytearray()
+        self._block = None
+
+    def _rotate_if_needed(self, size: int) -> None:
+        now = time.time()
+        if self._file is not None:
+            too_large = self.max_bytes > 0 and self._file_size + size > self.max_bytes and self._file_size > len(MAGIC)
+            too_old = self.rotate_interval > 0 and now - self._opened_at >= self.rotate_interval
+            if not (too_large or too_old):
+                return
+            self._close_file()
+        self._open_file(now)
+        self._remove_old_files()
+
+    def _open_file(self, now: float) -> None:
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now))
+        while True:
+            file_path = os.path.join(self.log_dir, f"{stamp}-{self._sequence:04d}{FILE_SUFFIX}")
+            self._sequence += 1
+            try:
+                self._file = open(file_path, "xb")
+                break
+            except FileExistsError:
+                continue
+        self._index = open(file_path + INDEX_SUFFIX, "wb")
+        self._file.write(MAGIC)
+        self._file_size = len(MAGIC)
+        self._opened_at = now
+
+    def _close_file(self) -> None:
+        for f in (self._file, self._index):
+            if f is not None:
+                f.close()
+        self._file = self._index = None
+
+    def _remove_old_files(self) -> None:
+        if self.max_files <= 0:
+            return
+        for file_path in log_files(self.log_dir)[: -self.max_files]:
+            for path in (file_path, file_path + INDEX_SUFFIX):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def close(self) -> None:
+        """Stop the flush thread, and write all buffered records."""
+        self._stopping.set()
+        if self._pid == os.getpid():
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            with self.lock:
+                self._write_block()
+                self._close_file()
+        super().close()
+
+
+def log_files(path: str) -> List[str]:
+    """Returns sorted log files in the directory `path`, or `[path]` if it is a file."""
+    if os.path.isdir(path):
+        return sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(FILE_SUFFIX))
+    return [path]
+
+
+def _read_index(file_path: str) -> List[_IndexEntry]:
+    try:
+        with open(file_path + INDEX_SUFFIX, "rb") as f:
+            data = f.read()
+    except OSError:
+        return []
+    return [cast(_IndexEntry, _INDEX.unpack_from(data, i)) for i in range(0, len(data) - _INDEX.size + 1, _INDEX.size)]
+
+
+def _match_app(name: str, apps: Sequence[str]) -> bool:
+    """Whether the logger name is one of `apps` (glob patterns) or their child apps."""
+    for app in apps:
+        if name == app or name.startswith(app + ".") or fnmatch.fnmatchcase(name, app):
+            return True
+    return False
+
+
+def _decode_records(
+    data: bytes, apps: Optional[Sequence[str]], level: int, since: Optional[float], until: Optional[float]
+) -> Iterator[LogEntry]:
+    """Decodes records in data which match filters. A truncated record at the end is ignored."""
+    view = memoryview(data)
+    pos = 0
+    end = len(data)
+    while pos + _LENGTH.size <= end:
+        (length,) = _LENGTH.unpack_from(view, pos)
+        start = pos + _LENGTH.size
+        pos = start + length
+        if pos > end:
+            break
+        created, levelno, name_len, msg_len = _HEADER.unpack_from(view, start)
+        if levelno < level or (since is not None and created < since) or (until is not None and created > until):
+            continue
+        name_start = start + _HEADER.size
+        name = bytes(view[name_start : name_start + name_len]).decode()
+        if apps and not _match_app(name, apps):
+            continue
+        msg_start = name_start + name_len
+        message = bytes(view[msg_start : msg_start + msg_len]).decode()
+        extras_start = msg_start + msg_len
+        extras = json.loads(bytes(view[extras_start:pos])) if extras_start < pos else {}
+        yield LogEntry(created, levelno, name, message, extras)
+
+
+def _read_file(
+    file_path: str, apps: Optional[Sequence[str]], level: int, since: Optional[float], until: Optional[float]
+) -> Iterator[LogEntry]:
+    with open(file_path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{file_path} is not a JarvisEngine log file.")
+        indexed_end = len(MAGIC)
+        for min_created, max_created, offset, length, max_levelno in _read_index(file_path):
+            indexed_end = offset + length
+            if max_levelno < level:
+                continue
+            if (since is not None and max_created < since) or (until is not None and min_created > until):
+                continue
+            f.seek(offset)
+            yield from _decode_records(f.read(length), apps, level, since, until)
+
+        # records which are not indexed yet (the file is being written, or the writer crashed).
+        f.seek(indexed_end)
+        yield from _decode_records(f.read(), apps, level, since, until)
+
+
+def read_entries(
+    path: str,
+    apps: Sequence[str] = None,
+    level: int = logging.NOTSET,
+    since: float = None,
+    until: float = None,
+) -> Iterator[LogEntry]:
+    """Reads log entries which match all filters.
+    Entries of files are merged in order of time.
+
+    Args:
+    - path
+        A log file or a directory of log files.
+    - apps (optional)
+        Logger names of apps. Child apps and glob patterns (ex. "*.Worker_*") also match.
+    - level (optional)
+        The minimum level.
+    - since, until (optional)
+        The time range (unix time).
+    """
+    iterators = [_read_file(file_path, apps, level, since, until) for file_path in log_files(path)]
+    return iter(heapq.merge(*iterators, key=lambda entry: entry.created))
@@ -3,22 +3,63 @@ This module provides useful tools for logging.
 
 - LoggingServer
     Build a thread that manages log messages on the multiprocessing.
-    The log messages are sent from SocketLogger.
+    The log messages are sent from Logger.
+
+- LoggingServerProcess
+    LoggingServer in a dedicated process, with a bounded queue.
+    Please see `JarvisEngine.core.log_server`.
 
 - Logger
-    SocketLogger, send log to LoggingServer.
-    The name is changed to `Logger` in consideration of the case where
-    SocketLogger will no longer be used in the future.
+    The logger of apps, send log to LoggingServer.
+    All loggers in a process share one connection to the LoggingServer
+    (the process handler), which is created lazily in the process.
+    Records are tagged by logger name.
+    Levels are checked in the app process, so disabled log calls
+    build and send nothing. `%`-style arguments of plain values are
+    sent unformatted and formatted by the LoggingServer.
+    If buffered, records are sent in batches from a background thread.
+    Please see `JarvisEngine.core.log_buffer`.
+    Records can be rate limited and sampled before sending.
+    Please see `JarvisEngine.core.log_limiter`.
+
+- BinaryLogHandler
+    Writes records handled by the LoggingServer to binary log files.
+    Please see `JarvisEngine.core.log_sink`.
 """
 import logging
+import logging.handlers
+import os
+import pickle
+import struct
 import sys
+import threading
+from typing import *
 
 from attr_dict import AttrDict
 from logging_server import LoggingServer
-from logging_server import SocketLogger as Logger
+
+from .log_buffer import BufferedHandler
+from .log_limiter import LogLimiter
+from .log_server import LoggingServerProcess
+from .log_sink import BinaryLogHandler
 
 MAIN_LOGGER_NAME = "MAIN"
 
+# Arguments of `BufferedHandler`: (capacity, flush_size, flush_interval).
+BufferArgs = Tuple[int, int, float]
+
+# Arguments of `LogLimiter`: (rate_limit, rate_burst, sample_repeats).
+LimitArgs = Tuple[float, int, int]
+
+# Types of `%`-style arguments which are sent unformatted.
+# Values of other types are formatted in the app process,
+# because the LoggingServer may not be able to unpickle them.
+LAZY_ARG_TYPES = frozenset((str, int, float, bool, type(None)))
+
+_process_handlers: Dict[Tuple[str, int, Optional[BufferArgs]], logging.Handler] = {}
+_process_handlers_pid: Optional[int] = None
+_process_handlers_lock = threading.Lock()
+
 
 def getLogger(name: str = None) -> logging.Logger:
     """Return `logging.Logger`.
@@ -28,8 +69,150 @@ def getLogger(name: str = None) -> logging.Logger:
     return logging.getLogger(name)
 
 
-def getAppLogger(name: str, log_conf: AttrDict) -> Logger:
-    """Get Socketlogger for Applications.
+def _has_lazy_args(record: logging.LogRecord) -> bool:
+    """Whether the message of record can be formatted by the LoggingServer."""
+    if type(record.msg) is not str:
+        return False
+    args = record.args
+    values: Iterable[object]
+    if type(args) is tuple:
+        values = args
+    elif type(args) is dict:
+        values = args.values()
+    else:
+        return False
+    for v in values:
+        if type(v) not in LAZY_ARG_TYPES:
+            return False
+    return True
+
+
+class RecordSocketHandler(logging.handlers.SocketHandler):
+    """
+    SocketHandler which sends `msg` and `args` of records unformatted
+    if all args are plain values (`LAZY_ARG_TYPES`).
+    The LoggingServer formats them by `LogRecord.getMessage`.
+    """
+
+    def makePickle(self, record: logging.LogRecord) -> bytes:
+        if record.exc_info:
+            self.format(record)  # caches exc_text.
+        d = dict(record.__dict__)
+        if not _has_lazy_args(record):
+            d["msg"] = record.getMessage()
+            d["args"] = None
+        d["exc_info"] = None
+        d.pop("message", None)
+        s = pickle.dumps(d, pickle.HIGHEST_PROTOCOL)  # the LoggingServer runs on the same python.
+        return struct.pack(">L", len(s)) + s
+
+
+def getProcessHandler(host: str, port: int, buffer_args: BufferArgs = None) -> logging.Handler:
+    """Returns the handler which sends records of all loggers in this process
+    to the LoggingServer of `host:port`. It is created at the first call
+    in each process, so connections are never shared with the parent process.
+    If `buffer_args` is given, the handler is `BufferedHandler`.
+    """
+    global _process_handlers_pid
+    key = (host, port, buffer_args)
+    with _process_handlers_lock:
+        if _process_handlers_pid != os.getpid():
+            # Handlers inherited by fork belong to the parent process.
+            _process_handlers.clear()
+            _process_handlers_pid = os.getpid()
+        handler = _process_handlers.get(key)
+        if handler is None:
+            handler = RecordSocketHandler(host, port)
+            if buffer_args is not None:
+                handler = BufferedHandler(handler, *buffer_args)
+            _process_handlers[key] = handler
+        return handler
+
+
+class Logger(logging.Logger):
+    """
+    The logger of apps, sends records to the LoggingServer
+    through the process handler (`getProcessHandler`).
+    Handlers added to the logger are also called.
+    The level is checked before a record is made, so
+    >>> logger.debug("position: %s", position)
+    costs only the level check when DEBUG is disabled.
+    If `limit_args` is given, records are rate limited and sampled
+    by `LogLimiter` before sending.
+    Pickled by name, level, connection and limit settings.
+    """
+
+    _cache: Dict[int, bool]  # the level cache of `logging.Logger`.
+
+    def __init__(
+        self,
+        name: str,
+        level: Union[int, str] = logging.NOTSET,
+        host: str = "127.0.0.1",
+        port: int = logging.handlers.DEFAULT_TCP_LOGGING_PORT,
+        buffer_args: BufferArgs = None,
+        limit_args: LimitArgs = None,
+    ) -> None:
+        super().__init__(name, level)
+        self.host = host
+        self.port = port
+        self.buffer_args = buffer_args
+        self.limit_args = limit_args
+        self.limiter = None if limit_args is None else LogLimiter(*limit_args)
+
+    def setLevel(self, level: Union[int, str]) -> None:
+        super().setLevel(level)
+        self._cache.clear()  # not cleared by the manager, because app loggers are not registered.
+
+    @property
+    def process_handler(self) -> logging.Handler:
+        return getProcessHandler(self.host, self.port, self.buffer_args)
+
+    def callHandlers(self, record: logging.LogRecord) -> None:
+        limiter = self.limiter
+        if limiter is not None:
+            if not limiter.allow(record):
+                return
+            limiter.append_summary(record)
+        self._send(record)
+
+    def _send(self, record: logging.LogRecord) -> None:
+        handler = self.process_handler
+        if record.levelno >= handler.level:
+            handler.handle(record)
+        if self.handlers:
+            super().callHandlers(record)
+
+    def reportSuppressed(self) -> None:
+        """Log the number of records suppressed by the limiter since the last report."""
+        if self.limiter is not None:
+            summary = self.limiter.take_summary(self.name)
+            if summary is not None:
+                self._send(summary)
+
+    def __reduce__(self):
+        return self.__class__, (self.name, self.level, self.host, self.port, self.buffer_args, self.limit_args)
+
+
+def getLimitArgs(log_conf: AttrDict, app_conf: AttrDict = None) -> Optional[LimitArgs]:
+    """Returns (rate_limit, rate_burst, sample_repeats) of an app logger,
+    or None if both of rate limit and sampling are disabled.
+    The keys of `app_conf` (ex. app config) override `log_conf`.
+    """
+    args = []
+    for key, default in (("rate_limit", 0.0), ("rate_burst", 100), ("sample_repeats", 0)):
+        if app_conf is not None and hasattr(app_conf, key):
+            args.append(getattr(app_conf, key))
+        else:
+            args.append(getattr(log_conf, key, default))
+    rate_limit, rate_burst, sample_repeats = args
+    if rate_limit <= 0 and sample_repeats <= 1:
+        return None
+    return (float(rate_limit), int(rate_burst), int(sample_repeats))
+
+
+def getAppLogger(name: str, log_conf: AttrDict, log_level: str = None, app_conf: AttrDict = None) -> Logger:
+    """Get Logger for Applications.
     Args:
     - name
         logger name.
@@ -39,14 +222,53 @@ def getAppLogger(name: str, log_conf: AttrDict) -> Logger:
             - log_level:str
             - host:str
             - port:int
+        If `buffered` is true, records are buffered by
+            - buffer_capacity:int
+            - flush_size:int
+            - flush_interval:float
+        Records are rate limited and sampled by (see `getLimitArgs`)
+            - rate_limit:float
+            - rate_burst:int
+            - sample_repeats:int
+    - log_level (optional)
+        Overrides `log_conf.log_level`. (ex. `log_level` in app config)
+    - app_conf (optional)
+        The app config, which overrides `rate_limit`, `rate_burst` and `sample_repeats`.
     """
-    log_level = log_conf.log_level
+    if log_level is None:
+        log_level = log_conf.log_level
     host = log_conf.host
     port = log_conf.port
-    return Logger(name, log_level, host, port)
+    buffer_args = None
+    if getattr(log_conf, "buffered", False):
+        buffer_args = (log_conf.buffer_capacity, log_conf.flush_size, log_conf.flush_interval)
+    return Logger(name, log_level, host, port, buffer_args, getLimitArgs(log_conf, app_conf))
+
 
+def flushLogger(logger: logging.Logger) -> None:
+    """Send all buffered records of logger, and the number of suppressed records.
+    The process handler of `Logger` is shared, so records of
+    the other loggers in this process are also sent.
+    """
+    if isinstance(logger, Logger):
+        logger.reportSuppressed()
+        logger.process_handler.flush()
+    for handler in logger.handlers:
+        handler.flush()
 
-def setRootLoggerComponents(log_conf: AttrDict) -> None:
+
+def closeProcessHandlers() -> None:
+    """Send buffered records and close connections of all loggers in this process.
+    Loggers connect again at the next log.
+    """
+    with _process_handlers_lock:
+        handlers = list(_process_handlers.values())
+        _process_handlers.clear()
+    for handler in handlers:
+        handler.close()
+
+
+def setRootLoggerComponents(log_conf: AttrDict, sink: bool = True) -> None:
     """Set components to root logger.
     Args:
     - log_conf:
@@ -55,9 +277,16 @@ def setRootLoggerComponents(log_conf: AttrDict) -> None:
             - log_level:str
             - message_format:str
             - date_format:str
+        If `console` is false, StreamHandler is not added.
+        If `sink_dir` is given, BinaryLogHandler is added. (see `getBinaryLogHandler`)
+    - sink:
+        If false, BinaryLogHandler is not added. Only the process which
+        handles records of the LoggingServer writes the sink, because
+        handlers of other processes would write and rotate files of the same directory.
 
     Componentns:
     - StreamHandler (stdout)
+    - BinaryLogHandler (optional)
     - set level.
     """
     log_level = log_conf.log_level
@@ -65,15 +294,42 @@ def setRootLoggerComponents(log_conf: AttrDict) -> None:
     dt_fmt = log_conf.date_format
 
     root_logger = logging.getLogger()
-    sh = logging.StreamHandler(sys.stdout)
-    fmtter = logging.Formatter(msg_fmt, datefmt=dt_fmt)
+    if getattr(log_conf, "console", True):
+        sh = logging.StreamHandler(sys.stdout)
+        fmtter = logging.Formatter(msg_fmt, datefmt=dt_fmt)
 
-    sh.setFormatter(fmtter)
-    root_logger.addHandler(sh)
+        sh.setFormatter(fmtter)
+        root_logger.addHandler(sh)
+    sink_dir: str = getattr(log_conf, "sink_dir", "")
+    if sink and sink_dir:
+        root_logger.addHandler(getBinaryLogHandler(log_conf))
     root_logger.setLevel(log_level)
 
 
-def getLoggingServer(log_conf: AttrDict) -> LoggingServer:
+def getBinaryLogHandler(log_conf: AttrDict) -> BinaryLogHandler:
+    """Constructs BinaryLogHandler using log_conf
+    Args:
+    - log_conf:
+        The config of logging (actually, `engine_config.logging`)
+        This must have the followings.
+            - sink_dir:str
+            - sink_max_bytes:int
+            - sink_rotate_interval:float
+            - sink_buffer_size:int
+            - sink_flush_interval:float
+            - sink_max_files:int
+    """
+    return BinaryLogHandler(
+        log_conf.sink_dir,
+        log_conf.sink_max_bytes,
+        log_conf.sink_rotate_interval,
+        log_conf.sink_buffer_size,
+        log_conf.sink_flush_interval,
+        log_conf.sink_max_files,
+    )
+
+
+def getLoggingServer(log_conf: AttrDict) -> Union[LoggingServer, LoggingServerProcess]:
     """Constructs LoggingServer using log_conf
     Args:
     - log_conf:
@@ -81,8 +337,14 @@ def getLoggingServer(log_conf: AttrDict) -> LoggingServer:
         This must have the followings.
             - host:str
             - port:int
+        If `server` is "process", returns `LoggingServerProcess` configured by
+            - server_queue_size:int
+            - server_overflow:str
+        and root logger components of the server process are set by `log_conf`.
     """
     host = log_conf.host
     port = log_conf.port
 
+    if getattr(log_conf, "server", "thread") == "process":
+        return LoggingServerProcess(host, port, log_conf.server_queue_size, log_conf.server_overflow, log_conf)
     return LoggingServer(host, port)
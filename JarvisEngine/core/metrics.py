@@ -0,0 +1,446 @@
+"""
+Metrics of apps on shared memory.
+
+Apps record counters, gauges and histograms (`BaseApp.getCounter`, ...)
+into their slots of `MetricsRegistry`, which is shared among all app
+processes. Recording a value writes shared memory directly, without
+locks or IPC. The Launcher reads all slots, and they are exported
+in the Prometheus text format by `render_prometheus`.
+
+Each slot is written by the threads of one app only. Values read
+during writing may mix two successive records, like rows of
+`FrameStatsTable`.
+"""
+import bisect
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import *
+
+import numpy as np
+from folder_dict import FolderDict
+
+from .value_sharing import LatestValueMailbox, RingBuffer, ShardedChannel, SharedMemoryObject
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+MAX_NAME_BYTES = 64
+MAX_BUCKETS = 16
+
+# Upper bounds [seconds] of histogram buckets of durations.
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Built-in metrics of each app.
+UPDATE_SECONDS = "jarvis_update_seconds"
+LOG_SUPPRESSED_RECORDS = "jarvis_log_suppressed_records_total"
+LOG_DROPPED_RECORDS = "jarvis_log_dropped_records_total"
+BUILTIN_METRICS = (
+    (HISTOGRAM, UPDATE_SECONDS, DEFAULT_BUCKETS),
+    (COUNTER, LOG_SUPPRESSED_RECORDS, ()),
+    (COUNTER, LOG_DROPPED_RECORDS, ()),
+)
+# Seconds between recordings of built-in log metrics in frame loops.
+LOG_METRICS_INTERVAL = 1.0
+
+_NAME_PATTERN = re.compile(r"[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_KIND_CODES = {COUNTER: 1, GAUGE: 2, HISTOGRAM: 3}
+_KINDS = {code: kind for kind, code in _KIND_CODES.items()}
+
+# values: the value of counters and gauges, or counts of buckets (and +Inf) and the sum of histograms.
+_NUM_VALUES = MAX_BUCKETS + 2
+_SLOT = np.dtype(
+    [
+        ("name", f"S{MAX_NAME_BYTES}"),
+        ("kind", np.uint64),
+        ("num_buckets", np.uint64),
+        ("bounds", np.float64, (MAX_BUCKETS,)),
+        ("values", np.float64, (_NUM_VALUES,)),
+    ]
+)
+_VALUES_OFFSET = _SLOT.fields["values"][1]
+
+_allocation_lock = threading.Lock()
+
+
+def check_name(name: str) -> None:
+    """Raises ValueError if `name` is not a valid metric name."""
+    if not _NAME_PATTERN.match(name):
+        raise ValueError(f"Invalid metric name {name!r}. It must match {_NAME_PATTERN.pattern}")
+    if len(name.encode()) > MAX_NAME_BYTES:
+        raise ValueError(f"Metric name {name!r} is longer than {MAX_NAME_BYTES} bytes.")
+
+
+def check_buckets(buckets: Sequence[float]) -> Tuple[float, ...]:
+    """Returns upper bounds of histogram buckets.
+    Raises ValueError if they are not finite and increasing, or too many.
+    """
+    bounds = tuple(float(b) for b in buckets)
+    if not 0 < len(bounds) <= MAX_BUCKETS:
+        raise ValueError(f"Histograms have 1 to {MAX_BUCKETS} buckets, but got {len(bounds)}.")
+    if not all(math.isfinite(b) for b in bounds) or any(a >= b for a, b in zip(bounds, bounds[1:])):
+        raise ValueError(f"Bucket bounds must be finite and increasing, but got {bounds}.")
+    return bounds
+
+
+class _Metric(object):
+    """
+    The base class of metrics.
+    Values are written through a memoryview of the slot in `MetricsRegistry`,
+    or of process local memory if the metric is not registered.
+    """
+
+    kind: str
+    _values: Any  # memoryview of float64 values.
+
+    def __init__(self, name: str, registry: "MetricsRegistry" = None, slot: Tuple[int, int] = None) -> None:
+        self.name = name
+        self._registry = registry
+        self._slot = slot
+        if registry is None:
+            self._values = memoryview(bytearray(8 * _NUM_VALUES)).cast("d")
+        else:
+            self._values = registry._values_view(*slot)
+
+    @property
+    def is_shared(self) -> bool:
+        """Whether values are on shared memory, and exported."""
+        return self._registry is not None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        values = state.pop("_values")
+        if self._registry is None:
+            state["_local_values"] = values.tolist()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        local_values = state.pop("_local_values", None)
+        self.__dict__.update(state)
+        if local_values is None:
+            self._values = self._registry._values_view(*self._slot)
+        else:
+            self._values = memoryview(bytearray(np.asarray(local_values, np.float64).tobytes())).cast("d")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r})"
+
+
+class MetricCounter(_Metric):
+    """A value which only increases. Ex: the number of processed items."""
+
+    kind = COUNTER
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError(f"Counters only increase, but got {amount}.")
+        self._values[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._values[0]
+
+
+class MetricGauge(_Metric):
+    """A value which goes up and down. Ex: the number of connected clients."""
+
+    kind = GAUGE
+
+    def set(self, value: float) -> None:
+        self._values[0] = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._values[0] += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._values[0] -= amount
+
+    @property
+    def value(self) -> float:
+        return self._values[0]
+
+
+class MetricHistogram(_Metric):
+    """
+    Counts of observed values in buckets, and their sum. Ex: durations.
+    A value is counted in the first bucket whose upper bound is not less than it.
+    """
+
+    kind = HISTOGRAM
+
+    def __init__(
+        self,
+        name: str,
+        registry: "MetricsRegistry" = None,
+        slot: Tuple[int, int] = None,
+        bounds: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, registry, slot)
+        self.bounds = check_buckets(bounds)
+        self._sum_index = len(self.bounds) + 1
+
+    def observe(self, value: float) -> None:
+        values = self._values
+        values[bisect.bisect_left(self.bounds, value)] += 1
+        values[self._sum_index] += value
+
+    @property
+    def buckets(self) -> Tuple[float, ...]:
+        """Counts of each bucket and +Inf (not cumulative)."""
+        return tuple(self._values[: self._sum_index])
+
+    @property
+    def count(self) -> float:
+        return sum(self.buckets)
+
+    @property
+    def sum(self) -> float:
+        return self._values[self._sum_index]
+
+
+M = TypeVar("M", bound=_Metric)
+
+METRIC_CLASSES: Dict[str, Type[_Metric]] = {COUNTER: MetricCounter, GAUGE: MetricGauge, HISTOGRAM: MetricHistogram}
+
+
+def create_local_metric(metric_class: Type[M], name: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> M:
+    """Creates a metric on process local memory, which is not exported
+    until it is bound by `MetricsRegistry.bind`."""
+    check_name(name)
+    if issubclass(metric_class, MetricHistogram):
+        return cast(M, metric_class(name, bounds=buckets))
+    return metric_class(name)
+
+
+class MetricValue(NamedTuple):
+    """A read value of a metric."""
+
+    name: str
+    kind: str
+    labels: Dict[str, str]
+    value: float  # The count of histograms.
+    bounds: Tuple[float, ...] = ()
+    buckets: Tuple[float, ...] = ()  # Counts of each bucket and +Inf (not cumulative).
+    sum: float = 0.0
+
+
+class MetricsRegistry(SharedMemoryObject):
+    """
+    Slots of metrics of all apps on shared memory.
+    Each app has `slots_per_app` slots, and built-in metrics
+    (`BUILTIN_METRICS`) are registered to them at the creation.
+
+    Ex:
+    >>> registry = MetricsRegistry(["Launcher", "Launcher.App"])
+    >>> registry.get_metric("Launcher.App", MetricCounter, "items_total").inc()  # app
+    >>> registry.read_all()  # Launcher
+    [MetricValue(name="jarvis_update_seconds", ...), ..., MetricValue(name="items_total", ...)]
+    """
+
+    _shm_views = ("_slots", "_counts")
+
+    def __init__(self, app_names: Iterable[str], slots_per_app: int = 32) -> None:
+        """
+        Args:
+        - app_names
+            Full names of apps which have slots.
+        - slots_per_app
+            The max number of metrics of each app, including built-in metrics.
+        """
+        if slots_per_app < len(BUILTIN_METRICS):
+            raise ValueError(f"slots_per_app must be at least {len(BUILTIN_METRICS)}, but got {slots_per_app}.")
+        self._app_names = tuple(app_names)
+        self._indices = {n: i for i, n in enumerate(self._app_names)}
+        self.slots_per_app = slots_per_app
+        num_apps = max(len(self._app_names), 1)
+        super().__init__(num_apps * slots_per_app * _SLOT.itemsize + num_apps * 8)
+        for app_name in self._app_names:
+            for kind, name, buckets in BUILTIN_METRICS:
+                self.get_metric(app_name, METRIC_CLASSES[kind], name, buckets)
+
+    def _attach(self) -> None:
+        num_apps = max(len(self._app_names), 1)
+        self._slots: np.ndarray = np.ndarray((num_apps, self.slots_per_app), _SLOT, buffer=self.buf)
+        self._counts: np.ndarray = np.ndarray((num_apps,), np.uint64, buffer=self.buf, offset=self._slots.nbytes)
+
+    @property
+    def app_names(self) -> Tuple[str, ...]:
+        return self._app_names
+
+    def _values_view(self, app_index: int, slot_index: int) -> Any:
+        """Returns the memoryview of float64 values of the slot."""
+        offset = (app_index * self.slots_per_app + slot_index) * _SLOT.itemsize + _VALUES_OFFSET
+        return self.buf[offset : offset + 8 * _NUM_VALUES].cast("d")
+
+    def _make_metric(self, app_index: int, slot_index: int) -> _Metric:
+        name = self._slots["name"][app_index, slot_index].decode()
+        kind = _KINDS[int(self._slots["kind"][app_index, slot_index])]
+        if kind == HISTOGRAM:
+            num_buckets = int(self._slots["num_buckets"][app_index, slot_index])
+            bounds = self._slots["bounds"][app_index, slot_index, :num_buckets].tolist()
+            return MetricHistogram(name, self, (app_index, slot_index), bounds)
+        return METRIC_CLASSES[kind](name, self, (app_index, slot_index))
+
+    def get_metric(
+        self, app_name: str, metric_class: Type[M], name: str, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> M:
+        """Returns the metric of app, which is registered to a new slot if not exists.
+        `buckets` are used only for new histograms.
+        Raises ValueError if the name is invalid or registered as another kind,
+        or all slots of the app are used.
+        """
+        check_name(name)
+        encoded = name.encode()
+        kind = metric_class.kind
+        code = _KIND_CODES[kind]
+        a = self._indices[app_name]
+        with _allocation_lock:
+            count = int(self._counts[a])
+            for i in range(count):
+                if self._slots["name"][a, i] == encoded:
+                    if int(self._slots["kind"][a, i]) != code:
+                        registered = _KINDS[int(self._slots["kind"][a, i])]
+                        raise ValueError(f"Metric {name} of {app_name} is a {registered}, not a {kind}.")
+                    return cast(M, self._make_metric(a, i))
+
+            if count >= self.slots_per_app:
+                raise ValueError(
+                    f"{app_name} has no free slot for metric {name}. "
+                    f"Please increase `metrics.slots_per_app` ({self.slots_per_app}) of the engine config."
+                )
+            bounds = check_buckets(buckets) if kind == HISTOGRAM else ()
+            self._slots["name"][a, count] = encoded
+            self._slots["num_buckets"][a, count] = len(bounds)
+            self._slots["bounds"][a, count, : len(bounds)] = bounds
+            self._slots["values"][a, count] = 0.0
+            self._slots["kind"][a, count] = code
+            self._counts[a] = count + 1
+            return cast(M, self._make_metric(a, count))
+
+    def bind(self, app_name: str, metric: _Metric) -> None:
+        """Moves values of the process local metric to its slot of app,
+        and the metric records values into the slot after that.
+        Raises ValueError like `get_metric`, or if the histogram is
+        registered with other buckets.
+        """
+        bounds = getattr(metric, "bounds", DEFAULT_BUCKETS)
+        shared = self.get_metric(app_name, type(metric), metric.name, bounds)
+        if isinstance(shared, MetricHistogram) and shared.bounds != bounds:
+            raise ValueError(f"Histogram {metric.name} of {app_name} is registered with buckets {shared.bounds}.")
+        for i in range(_NUM_VALUES):
+            shared._values[i] += metric._values[i]
+        metric._registry, metric._slot, metric._values = self, shared._slot, shared._values
+
+    def read_all(self) -> List[MetricValue]:
+        """Returns values of all metrics of all apps, labeled by `app`."""
+        metrics = []
+        for a, app_name in enumerate(self._app_names):
+            labels = {"app": app_name}
+            for i in range(int(self._counts[a])):
+                metric = self._make_metric(a, i)
+                if isinstance(metric, MetricHistogram):
+                    buckets = metric.buckets
+                    metrics.append(
+                        MetricValue(metric.name, HISTOGRAM, labels, sum(buckets), metric.bounds, buckets, metric.sum)
+                    )
+                else:
+                    metrics.append(MetricValue(metric.name, metric.kind, labels, metric._values[0]))
+        return metrics
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(app_names={self.app_names}, name={self.name!r})"
+
+
+# Metric names and kinds of frame stats. Please see `JarvisEngine.core.frame_stats.FIELDS`.
+FRAME_STATS_METRICS = (
+    ("frames", "jarvis_frames_total", COUNTER),
+    ("late_frames", "jarvis_late_frames_total", COUNTER),
+    ("skipped_frames", "jarvis_skipped_frames_total", COUNTER),
+    ("fps", "jarvis_fps", GAUGE),
+    ("mean_update_time", "jarvis_mean_update_seconds", GAUGE),
+    ("max_update_time", "jarvis_max_update_seconds", GAUGE),
+    ("mean_sleep_time", "jarvis_mean_sleep_seconds", GAUGE),
+)
+
+
+def frame_stats_metrics(frame_stats: Dict[str, Dict[str, float]]) -> List[MetricValue]:
+    """Converts frame stats of all apps (`FrameStatsTable.read_all`) to metrics."""
+    metrics = []
+    for field, name, kind in FRAME_STATS_METRICS:
+        for app_name, stats in frame_stats.items():
+            metrics.append(MetricValue(name, kind, {"app": app_name}, stats[field]))
+    return metrics
+
+
+def queue_metrics(shared_values: FolderDict) -> List[MetricValue]:
+    """Returns metrics of queues in shared values, labeled by `queue` (the shared value name).
+    - `RingBuffer`: `jarvis_queue_depth` and `jarvis_queue_capacity`.
+    - `ShardedChannel`: them of each shard, also labeled by `shard`.
+    - `LatestValueMailbox`: `jarvis_mailbox_overwritten_total` and `jarvis_mailbox_dropped_total`.
+    """
+    metrics = []
+    for path, obj in zip(shared_values.paths, shared_values[shared_values.paths]):
+        path = path.lstrip(shared_values.sep)
+        if isinstance(obj, RingBuffer):
+            metrics.append(MetricValue("jarvis_queue_depth", GAUGE, {"queue": path}, len(obj)))
+            metrics.append(MetricValue("jarvis_queue_capacity", GAUGE, {"queue": path}, obj.capacity))
+        elif isinstance(obj, ShardedChannel):
+            for i, shard in enumerate(obj.shards):
+                labels = {"queue": path, "shard": str(i)}
+                metrics.append(MetricValue("jarvis_queue_depth", GAUGE, labels, len(shard)))
+                metrics.append(MetricValue("jarvis_queue_capacity", GAUGE, labels, shard.capacity))
+        elif isinstance(obj, LatestValueMailbox):
+            metrics.append(MetricValue("jarvis_mailbox_overwritten_total", COUNTER, {"queue": path}, obj.overwritten))
+            metrics.append(MetricValue("jarvis_mailbox_dropped_total", COUNTER, {"queue": path}, obj.dropped))
+    return metrics
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def render_prometheus(metrics: Iterable[MetricValue]) -> str:
+    """Renders metrics in the Prometheus text exposition format (version 0.0.4).
+    Metrics of the same name are grouped under a TYPE line.
+    """
+    groups: Dict[str, List[MetricValue]] = OrderedDict()
+    for metric in metrics:
+        groups.setdefault(metric.name, []).append(metric)
+
+    lines = []
+    for name, group in groups.items():
+        kind = group[0].kind
+        lines.append(f"# TYPE {name} {kind}")
+        for metric in group:
+            if metric.kind != kind:
+                continue
+            if kind != HISTOGRAM:
+                lines.append(f"{name}{_format_labels(metric.labels)} {_format_value(metric.value)}")
+                continue
+            cumulative = 0.0
+            for bound, count in zip(metric.bounds + (math.inf,), metric.buckets):
+                cumulative += count
+                labels = _format_labels({**metric.labels, "le": _format_value(bound)})
+                lines.append(f"{name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(metric.labels)
+            lines.append(f"{name}_sum{labels} {_format_value(metric.sum)}")
+            lines.append(f"{name}_count{labels} {_format_value(cumulative)}")
+    return "\n".join(lines) + "\n" if lines else ""
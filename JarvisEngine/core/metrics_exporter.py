@@ -0,0 +1,149 @@
+"""
+Exporter of metrics in the Prometheus text format.
+
+`MetricsExporter` serves metrics at `http://<http_host>:<http_port>/metrics`
+and/or writes them to a textfile periodically (ex. for the textfile
+collector of the node_exporter). Metrics are collected on each request
+or write, in the main process.
+"""
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import *
+
+from .metrics import MetricValue, render_prometheus
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_PATH = "/metrics"
+TEXTFILE_THREAD_NAME = "JarvisEngine.metrics_textfile_writer"
+HTTP_THREAD_NAME = "JarvisEngine.metrics_http_server"
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    server: "_MetricsHTTPServer"
+
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != METRICS_PATH:
+            self.send_error(404)
+            return
+        try:
+            body = self.server.exporter.render().encode()
+        except Exception as e:
+            self.send_error(500, explain=repr(e))
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # Scrapes are not logged.
+
+
+class _MetricsHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, server_address: Tuple[str, int], exporter: "MetricsExporter") -> None:
+        self.exporter = exporter
+        super().__init__(server_address, _MetricsRequestHandler)
+
+
+class MetricsExporter(object):
+    """
+    Serves and writes metrics returned by `collect`.
+
+    Ex:
+    >>> exporter = MetricsExporter(launcher.get_metrics, http_port=9464)
+    >>> exporter.start()
+    >>> ...
+    >>> exporter.shutdown()
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[], Iterable[MetricValue]],
+        http_host: str = "127.0.0.1",
+        http_port: int = 0,
+        textfile: str = "",
+        textfile_interval: float = 5.0,
+    ) -> None:
+        """
+        Args:
+        - collect
+            Returns current metrics.
+        - http_host, http_port
+            The address of the HTTP endpoint. The port 0 disables it.
+        - textfile
+            The path to the textfile. Empty disables it.
+        - textfile_interval
+            Seconds between writes of the textfile.
+        """
+        self.collect = collect
+        self.http_host = http_host
+        self.http_port = http_port
+        self.textfile = os.path.abspath(textfile) if textfile else ""
+        self.textfile_interval = textfile_interval
+
+        self._http_server: Optional[_MetricsHTTPServer] = None
+        self._threads: List[threading.Thread] = []
+        self._stopping = threading.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return self.http_port != 0 or bool(self.textfile)
+
+    @property
+    def server_address(self) -> Optional[Tuple[str, int]]:
+        """The address of the running HTTP endpoint, or None."""
+        if self._http_server is None:
+            return None
+        host, port = self._http_server.server_address[:2]
+        return str(host), int(port)
+
+    def render(self) -> str:
+        """Returns current metrics in the Prometheus text format."""
+        return render_prometheus(self.collect())
+
+    def write_textfile(self) -> None:
+        """Writes current metrics to the textfile atomically."""
+        text = self.render()
+        tmp_path = f"{self.textfile}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, self.textfile)
+
+    def _write_textfile_periodically(self) -> None:
+        while not self._stopping.wait(self.textfile_interval):
+            self.write_textfile()
+
+    def start(self) -> None:
+        """Starts the HTTP endpoint and the textfile writer in background threads.
+        Raises OSError if the HTTP port is not available.
+        """
+        self._stopping.clear()
+        if self.http_port != 0:
+            self._http_server = _MetricsHTTPServer((self.http_host, self.http_port), self)
+            self._threads.append(
+                threading.Thread(target=self._http_server.serve_forever, name=HTTP_THREAD_NAME, daemon=True)
+            )
+        if self.textfile:
+            self.write_textfile()
+            self._threads.append(
+                threading.Thread(target=self._write_textfile_periodically, name=TEXTFILE_THREAD_NAME, daemon=True)
+            )
+        for thread in self._threads:
+            thread.start()
+
+    def shutdown(self) -> None:
+        """Stops background threads, and writes the final metrics to the textfile."""
+        self._stopping.set()
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        if self.textfile:
+            self.write_textfile()
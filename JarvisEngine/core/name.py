@@ -1,6 +1,15 @@
+from functools import lru_cache
+
 SEP = "."
 
+# The separator between the name and the index of replicated apps.
+REPLICA_SEP = "_"
+
+# The max number of memoized names.
+CACHE_SIZE = 4096
 
+
+@lru_cache(maxsize=CACHE_SIZE)
 def clean(name: str) -> str:
     """clean name.
     Erase all SEP's at the head and tail of name.
@@ -21,6 +30,7 @@ def clean(name: str) -> str:
     return name[start:end]
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def count_head_sep(name: str) -> int:
     """count number of head separator of name.
     Ex:
@@ -36,6 +46,7 @@ def count_head_sep(name: str) -> int:
     return num
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def join_relatively(name: str, another: str) -> str:
     """Join another to name.
     Ex:
@@ -54,6 +65,7 @@ def join_relatively(name: str, another: str) -> str:
         return f"{name}{SEP}{another}"
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def join(name: str, *others: str) -> str:
     """join names. Supported relative join.
     Ex:
@@ -64,3 +76,11 @@ def join(name: str, *others: str) -> str:
     for n in others:
         name = join_relatively(name, n)
     return name
+
+
+def replica(name: str, index: int) -> str:
+    """Returns the name of replicated app.
+    Ex:
+        replica("Worker", 2) -> "Worker_2"
+    """
+    return f"{name}{REPLICA_SEP}{index}"
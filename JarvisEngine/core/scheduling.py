@@ -0,0 +1,100 @@
+"""
+OS scheduling settings of apps: CPU affinity, nice value and scheduling policy.
+
+The settings are applied to the calling thread (on Linux, threads are
+scheduled independently), so apply them at the beginning of
+each app thread/process.
+
+Settings:
+- cpu_affinity: List[int]
+    CPU numbers which the app runs on. Empty list keeps the current CPUs.
+- nice: int | "inherit"
+    Niceness (-20 ~ 19). Lower than current needs privileges.
+- sched_policy: str
+    "other", "batch", "idle", "fifo", "rr" or "inherit".
+    "fifo" and "rr" are real-time policies and need privileges.
+- sched_priority: int
+    Priority of real-time policies (1 ~ 99). Must be 0 for other policies.
+"""
+import os
+import threading
+from typing import *
+
+INHERIT = "inherit"
+
+SETTING_KEYS = ("cpu_affinity", "nice", "sched_policy", "sched_priority")
+
+# Policy names and attribute names of `os` module.
+SCHED_POLICIES = {
+    "other": "SCHED_OTHER",
+    "batch": "SCHED_BATCH",
+    "idle": "SCHED_IDLE",
+    "fifo": "SCHED_FIFO",
+    "rr": "SCHED_RR",
+}
+
+
+def set_cpu_affinity(cpus: Iterable[int]) -> None:
+    """Pin the calling thread to `cpus`. Empty keeps the current CPUs."""
+    cpus = set(cpus)
+    if not cpus:
+        return
+    if not hasattr(os, "sched_setaffinity"):
+        raise NotImplementedError("cpu_affinity is not supported on this platform.")
+    os.sched_setaffinity(0, cpus)
+
+
+def set_nice(nice: Union[int, str]) -> None:
+    """Set niceness of the calling thread."""
+    if nice == INHERIT:
+        return
+    os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), int(nice))
+
+
+def set_sched_policy(policy: str, priority: int = 0) -> None:
+    """Set scheduling policy and priority of the calling thread."""
+    if policy == INHERIT:
+        return
+    if policy not in SCHED_POLICIES:
+        raise ValueError(f"Unknown sched_policy {policy}. Please {INHERIT} or {tuple(SCHED_POLICIES)}.")
+    if not hasattr(os, "sched_setscheduler"):
+        raise NotImplementedError("sched_policy is not supported on this platform.")
+    os.sched_setscheduler(0, getattr(os, SCHED_POLICIES[policy]), os.sched_param(priority))
+
+
+def apply_settings(settings: Mapping[str, Any]) -> Dict[str, Exception]:
+    """Apply scheduling settings to the calling thread.
+    Missing keys are not changed. A failed setting does not stop the others.
+    Returns errors of failed settings by key.
+    """
+    errors: Dict[str, Exception] = {}
+    appliers = {
+        "cpu_affinity": lambda: set_cpu_affinity(settings["cpu_affinity"]),
+        "nice": lambda: set_nice(settings["nice"]),
+        "sched_policy": lambda: set_sched_policy(settings["sched_policy"], settings.get("sched_priority", 0)),
+    }
+    for key, apply in appliers.items():
+        if key not in settings:
+            continue
+        try:
+            apply()
+        except (OSError, ValueError, NotImplementedError) as e:
+            errors[key] = e
+    return errors
+
+
+def get_settings() -> Dict[str, Any]:
+    """Returns effective scheduling settings of the calling thread.
+    Settings not supported on this platform are omitted.
+    """
+    settings: Dict[str, Any] = {}
+    if hasattr(os, "sched_getaffinity"):
+        settings["cpu_affinity"] = sorted(os.sched_getaffinity(0))
+    if hasattr(os, "getpriority"):
+        settings["nice"] = os.getpriority(os.PRIO_PROCESS, threading.get_native_id())
+    if hasattr(os, "sched_getscheduler"):
+        policy = os.sched_getscheduler(0)
+        names = {getattr(os, attr): name for name, attr in SCHED_POLICIES.items() if hasattr(os, attr)}
+        settings["sched_policy"] = names.get(policy, policy)
+        settings["sched_priority"] = os.sched_getparam(0).sched_priority
+    return settings
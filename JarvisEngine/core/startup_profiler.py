@@ -0,0 +1,218 @@
+"""
+Startup profiler of apps.
+
+Records how long each app spends in every startup phase, in all
+app processes. Events of child processes are sent to the main process
+through `multiprocessing.Queue`, and collected by a thread.
+
+Phases:
+- import_app: Importing the app module in its parent app.
+- Init: Override method `Init`.
+- RegisterProcessSharedValues: Including child apps.
+- spawn: Pickling the app and starting its process, in its parent app.
+- Awake: Override method `Awake`.
+- RegisterThreadSharedValues: Including child thread apps.
+- first_Update: The first call of `Update`.
+  The start of it is the time to be ready.
+
+Profiling is enabled in a process by `enable` (or `enable_shared`), and `measure` / `record`
+do nothing when it is disabled.
+
+Ex:
+>>> profiler = StartupProfiler()
+>>> enable(profiler)
+>>> profiler.start()
+>>> with measure("Launcher.App", INIT):
+...     app.Init()
+>>> profiler.stop()
+>>> print(profiler.report())
+>>> profiler.write_chrome_trace("startup_profile.json")
+"""
+import json
+import multiprocessing as mp
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import *
+
+from folder_dict import FolderDict
+
+from ..constants import STARTUP_PROFILER_NAME
+
+IMPORT_APP = "import_app"
+INIT = "Init"
+REGISTER_PROCESS_SHARED_VALUES = "RegisterProcessSharedValues"
+SPAWN = "spawn"
+AWAKE = "Awake"
+REGISTER_THREAD_SHARED_VALUES = "RegisterThreadSharedValues"
+FIRST_UPDATE = "first_Update"
+
+PHASES = (IMPORT_APP, INIT, REGISTER_PROCESS_SHARED_VALUES, SPAWN, AWAKE, REGISTER_THREAD_SHARED_VALUES, FIRST_UPDATE)
+
+# The default path of the Chrome trace file.
+DEFAULT_TRACE_FILE = "startup_profile.json"
+
+
+class Event(NamedTuple):
+    """A startup phase of an app. Times are `time.time()` seconds."""
+
+    app_name: str
+    phase: str
+    start: float
+    end: float
+    pid: int
+    tid: int
+
+
+class StartupProfiler(object):
+    """
+    Collects startup events of apps in all processes.
+    Share it to child processes through process shared values,
+    which are pickled at process spawning.
+
+    Attrs:
+    - origin: float
+        `time.time()` at construction. Event times are reported from it.
+    """
+
+    def __init__(self) -> None:
+        self.origin = time.time()
+        self._pid = os.getpid()
+        self._queue: "mp.Queue[Optional[Event]]" = mp.Queue()
+        self._events: List[Event] = []
+        self._collector: Optional[threading.Thread] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Child processes only send events by the queue."""
+        state = self.__dict__.copy()
+        state["_events"] = []
+        state["_collector"] = None
+        return state
+
+    def record(self, app_name: str, phase: str, start: float, end: float) -> None:
+        """Record an event. Events of child processes are sent to the main process."""
+        event = Event(app_name, phase, start, end, os.getpid(), threading.get_ident())
+        if event.pid == self._pid:
+            self._events.append(event)
+        else:
+            self._queue.put(event)
+
+    def start(self) -> None:
+        """Start collecting events of child processes in the main process."""
+        self._collector = threading.Thread(target=self._collect, name="JarvisEngine.startup_profiler", daemon=True)
+        self._collector.start()
+
+    def _collect(self) -> None:
+        while (event := self._queue.get()) is not None:
+            self._events.append(event)
+
+    def stop(self) -> None:
+        """Stop collecting after all child processes are joined."""
+        if self._collector is not None:
+            self._queue.put(None)
+            self._collector.join()
+            self._collector = None
+
+    @property
+    def events(self) -> List[Event]:
+        return list(self._events)
+
+    def get_phase_times(self) -> Dict[str, Dict[str, float]]:
+        """Returns seconds of each phase by app name.
+        Times of the same phase are summed.
+        """
+        times: Dict[str, Dict[str, float]] = {}
+        for event in self._events:
+            phases = times.setdefault(event.app_name, {})
+            phases[event.phase] = phases.get(event.phase, 0.0) + event.end - event.start
+        return times
+
+    def get_ready_times(self) -> Dict[str, float]:
+        """Returns seconds from `origin` to the first `Update` by app name."""
+        return {e.app_name: e.start - self.origin for e in self._events if e.phase == FIRST_UPDATE}
+
+    def report(self) -> str:
+        """Returns the table of phase times [ms] of all apps,
+        sorted by the time to be ready (slowest first).
+        """
+        times = self.get_phase_times()
+        ready = self.get_ready_times()
+        names = sorted(times, key=lambda name: (name not in ready, -ready.get(name, 0.0)))
+
+        name_width = max([len("app")] + [len(name) for name in names])
+        header = f"{'app':<{name_width}}" + "".join(f"{p:>{len(p) + 2}}" for p in PHASES) + f"{'ready':>10}"
+        lines = ["startup profile [ms]", header]
+        for name in names:
+            line = f"{name:<{name_width}}"
+            for phase in PHASES:
+                value = times[name].get(phase)
+                line += f"{value * 1000:>{len(phase) + 2}.1f}" if value is not None else f"{'-':>{len(phase) + 2}}"
+            line += f"{ready[name] * 1000:>10.1f}" if name in ready else f"{'-':>10}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Returns events in Chrome trace event format.
+        Open it in `chrome://tracing` or Perfetto.
+        """
+        trace_events = []
+        for event in self._events:
+            trace_events.append(
+                {
+                    "name": f"{event.phase} {event.app_name}",
+                    "cat": event.phase,
+                    "ph": "X",
+                    "ts": (event.start - self.origin) * 1e6,
+                    "dur": (event.end - event.start) * 1e6,
+                    "pid": event.pid,
+                    "tid": event.tid,
+                    "args": {"app": event.app_name},
+                }
+            )
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write events to `path` as Chrome trace JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+_profiler: Optional[StartupProfiler] = None
+
+
+def enable(profiler: Optional[StartupProfiler]) -> None:
+    """Set the profiler of this process. None disables profiling."""
+    global _profiler
+    _profiler = profiler
+
+
+def enable_shared(shared_values: FolderDict) -> None:
+    """Set the profiler registered to process shared values (`STARTUP_PROFILER_NAME`)
+    as the profiler of this process. Profiling is disabled if it is not registered.
+    """
+    profiler = shared_values[STARTUP_PROFILER_NAME]
+    enable(profiler if isinstance(profiler, StartupProfiler) else None)
+
+
+def get_profiler() -> Optional[StartupProfiler]:
+    return _profiler
+
+
+def record(app_name: str, phase: str, start: float, end: float = None) -> None:
+    """Record an event if enabled. `end` is now if None."""
+    if _profiler is not None:
+        _profiler.record(app_name, phase, start, time.time() if end is None else end)
+
+
+@contextmanager
+def measure(app_name: str, phase: str) -> Iterator[None]:
+    """Record the duration of the with block if enabled."""
+    if _profiler is None:
+        yield
+        return
+    start = time.time()
+    try:
+        yield
+    finally:
+        record(app_name, phase, start)
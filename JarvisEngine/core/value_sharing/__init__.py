@@ -1,2 +1,19 @@
 from .folder_dict_with_lock import FolderDictWithLock
-from .read_only_objects import ReadOnly, ReadOnlyArray, ReadOnlyError, ReadOnlyString, ReadOnlyValue, make_read_only
+from .latest_value_mailbox import LatestValueMailbox
+from .read_only_objects import (
+    ReadOnly,
+    ReadOnlyArray,
+    ReadOnlyError,
+    ReadOnlySeqLockValue,
+    ReadOnlyShutdownFlag,
+    ReadOnlyString,
+    ReadOnlyValue,
+    make_read_only,
+)
+from .ring_buffer import RingBuffer
+from .seqlock_value import SeqLockValue
+from .sharded_channel import ShardedChannel
+from .shared_array import ReadOnlySharedArray, SharedArray
+from .shared_memory_object import SharedMemoryObject, unlink_shared_memory_objects
+from .shutdown_flag import ShutdownFlag
+from .trigger import Trigger, notify_triggers
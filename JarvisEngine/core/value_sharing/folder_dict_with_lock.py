@@ -4,14 +4,20 @@ from typing import *
 from folder_dict import FolderDict
 
 from ..name import SEP
+from .read_only_objects import ReadOnlyError
 
 
 class FolderDictWithLock(FolderDict):
     """
     Protects FolderDict with Lock to prevent multiple threads
-    from reading and writing at the same time
+    from reading and writing at the same time.
+
+    After `freeze`, the FolderDict becomes immutable and
+    the lookups are lock-free dict accesses.
     """
 
+    _frozen: Optional[Dict[str, Any]] = None
+
     def __init__(
         self,
         data=None,
@@ -31,10 +37,38 @@ class FolderDictWithLock(FolderDict):
         """returns lock object."""
         return self._lock
 
+    def freeze(self) -> None:
+        """Make immutable and index all paths for lock-free lookups.
+        Writing after freezing raises `ReadOnlyError`.
+        """
+        with self._lock:
+            index = {}
+            for path in self.paths:
+                value = super().__getitem__(path)
+                index[path] = value
+                index[path[len(self.sep) :]] = value  # without head separator.
+            self._frozen = index
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._frozen is not None
+
     def __getitem__(self, path: Union[str, Iterable[str]]) -> Union[Any, List[str]]:
+        frozen = self._frozen
+        if frozen is not None:
+            if not isinstance(path, str):
+                return [self[p] for p in path]
+            if path in frozen:
+                return frozen[path]
+            # folders and missing paths are resolved as before freezing.
+            return super().__getitem__(path)
+
         with self._lock:
             return super().__getitem__(path)
 
     def __setitem__(self, path: Union[str, Iterable[str]], value: Union[Any, Iterable[Any]]) -> None:
+        if self._frozen is not None:
+            raise ReadOnlyError(f"Can not set {path}, FolderDictWithLock is frozen.")
+
         with self._lock:
             return super().__setitem__(path, value)
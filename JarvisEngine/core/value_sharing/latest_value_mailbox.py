@@ -0,0 +1,183 @@
+from typing import *
+
+import numpy as np
+
+from .shared_memory_object import SharedMemoryObject
+from .trigger import Trigger
+
+_CACHE_LINE = 64
+
+# Writer owned header words.
+_LATEST_SLOT = 0
+_PUBLISHED = 1
+_OVERWRITTEN = 2
+_WRITER_WORDS = 3
+
+# Reader owned header words. (on the next cache line.)
+_READING_SLOT = 0
+_READ_FRAME = 1
+_DROPPED = 2
+_READER_WORDS = 3
+
+
+class LatestValueMailbox(SharedMemoryObject):
+    """
+    N-slot (triple buffer by default) mailbox which always holds
+    the newest complete value, on shared memory.
+
+    The single writer publishes into a free slot without blocking, and the
+    single reader picks up the most recently published slot in O(1).
+    Every slot is guarded by a sequence counter, so the reader never returns
+    a half-written value. Values which are overwritten before being read
+    are counted by `overwritten` (writer side) and `dropped` (reader side).
+
+    Ex:
+    >>> mailbox = LatestValueMailbox((480, 640, 3), np.uint8)
+    >>> self.addProcessSharedValue("frame", mailbox)
+    ...
+    >>> mailbox.publish(frame)  # writer
+    >>> frame, frame_id = mailbox.read()  # reader
+    """
+
+    _shm_views = ("_writer", "_reader", "_slot_sequences", "_slot_frames", "_slots")
+
+    def __init__(
+        self,
+        shape: Union[int, Tuple[int, ...]] = (),
+        dtype: Any = np.float64,
+        num_slots: int = 3,
+        trigger: Optional[Trigger] = None,
+    ) -> None:
+        """
+        Args:
+        - shape
+            The shape of value.
+        - dtype
+            The data type of value.
+        - num_slots
+            The number of slots. At least 3.
+        - trigger (optional)
+            Notified whenever a value is published.
+        """
+        if num_slots < 3:
+            raise ValueError(f"num_slots must be 3 or more, but {num_slots}.")
+        if isinstance(shape, int):
+            shape = (shape,)
+        self._shape = tuple(shape)
+        self._dtype = np.dtype(dtype)
+        self._num_slots = num_slots
+        self._trigger = trigger
+
+        self._slots_offset = 2 * _CACHE_LINE + 16 * num_slots
+        slot_size = int(np.prod(self._shape)) * self._dtype.itemsize
+        super().__init__(self._slots_offset + num_slots * slot_size)
+        self._reader[_READING_SLOT] = num_slots  # no slot.
+
+    def _attach(self) -> None:
+        buf, n = self.buf, self._num_slots
+        self._writer: np.ndarray = np.ndarray((_WRITER_WORDS,), np.uint64, buffer=buf)
+        self._reader: np.ndarray = np.ndarray((_READER_WORDS,), np.uint64, buffer=buf, offset=_CACHE_LINE)
+        self._slot_sequences: np.ndarray = np.ndarray((n,), np.uint64, buffer=buf, offset=2 * _CACHE_LINE)
+        self._slot_frames: np.ndarray = np.ndarray((n,), np.uint64, buffer=buf, offset=2 * _CACHE_LINE + 8 * n)
+        self._slots: np.ndarray = np.ndarray((n, *self._shape), self._dtype, buffer=buf, offset=self._slots_offset)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def num_slots(self) -> int:
+        return self._num_slots
+
+    @property
+    def trigger(self) -> Optional[Trigger]:
+        return self._trigger
+
+    @property
+    def published(self) -> int:
+        """The number of published values. This is also the newest frame id."""
+        return int(self._writer[_PUBLISHED])
+
+    @property
+    def overwritten(self) -> int:
+        """The number of values overwritten before being read."""
+        return int(self._writer[_OVERWRITTEN])
+
+    @property
+    def dropped(self) -> int:
+        """The number of values the reader skipped."""
+        return int(self._reader[_DROPPED])
+
+    @property
+    def last_read_frame(self) -> int:
+        """The frame id which the reader read last."""
+        return int(self._reader[_READ_FRAME])
+
+    def has_new(self) -> bool:
+        """Whether a value newer than the last read one is published."""
+        return self.published > self.last_read_frame
+
+    def publish(self, value: Any) -> int:
+        """Write value into a free slot and publish it.
+        Never blocks. Do not call from multiple writers.
+        Returns the frame id of value.
+        """
+        # converted before writing, so an invalid value never leaves the slot sequence odd.
+        data = np.broadcast_to(np.asarray(value, self._dtype), self._shape)
+        latest = int(self._writer[_LATEST_SLOT])
+        reading = int(self._reader[_READING_SLOT])
+        slot = (latest + 1) % self._num_slots
+        while slot == reading:
+            slot = (slot + 1) % self._num_slots
+
+        frame = int(self._writer[_PUBLISHED]) + 1
+        sequence = int(self._slot_sequences[slot])
+        self._slot_sequences[slot] = sequence + 1
+        self._slots[slot] = data
+        self._slot_frames[slot] = frame
+        self._slot_sequences[slot] = sequence + 2
+
+        if frame > 1 and int(self._reader[_READ_FRAME]) < frame - 1:
+            self._writer[_OVERWRITTEN] += 1
+        self._writer[_PUBLISHED] = frame
+        self._writer[_LATEST_SLOT] = slot
+        if self._trigger is not None:
+            self._trigger.notify()
+        return frame
+
+    def read(self) -> Tuple[Optional[np.ndarray], int]:
+        """Read a copy of the newest value. Never returns a half-written value.
+        Returns (value, frame id). If nothing is published, returns (None, 0).
+        """
+        if self.published == 0:
+            return None, 0
+
+        while True:
+            slot = int(self._writer[_LATEST_SLOT])
+            self._reader[_READING_SLOT] = slot
+            if int(self._writer[_LATEST_SLOT]) != slot:
+                continue  # published during claiming.
+            sequence = int(self._slot_sequences[slot])
+            if sequence & 1:
+                continue
+            frame = int(self._slot_frames[slot])
+            value = self._slots[slot].copy()
+            if int(self._slot_sequences[slot]) == sequence:
+                break
+        self._reader[_READING_SLOT] = self._num_slots
+
+        last_frame = int(self._reader[_READ_FRAME])
+        if frame > last_frame:
+            self._reader[_DROPPED] += frame - last_frame - 1
+            self._reader[_READ_FRAME] = frame
+        return value, frame
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(shape={self.shape}, dtype={self.dtype}, "
+            f"num_slots={self.num_slots}, name={self.name!r})"
+        )
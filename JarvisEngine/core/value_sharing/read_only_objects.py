@@ -1,6 +1,11 @@
 from multiprocessing.sharedctypes import Synchronized, SynchronizedArray, SynchronizedBase, SynchronizedString
 from typing import *
 
+from .seqlock_value import SeqLockValue
+from .shared_array import ReadOnlySharedArray, SharedArray
+from .shared_memory_object import SharedMemoryObject
+from .shutdown_flag import ShutdownFlag
+
 
 class ReadOnlyError(Exception):
     pass
@@ -96,10 +101,52 @@ class ReadOnlyString(ReadOnlyArray):
         raise ReadOnlyError
 
 
+class ReadOnlySeqLockValue(SeqLockValue):
+    """Read only view of `SeqLockValue`. Reading never takes a lock."""
+
+    def __init__(self, value: SeqLockValue) -> None:
+        self._dtype = value.dtype
+        self._shape = value.shape
+        self._trigger = value.trigger
+        SharedMemoryObject.__init__(self, 0, value.name)
+
+    def write(self, *args):
+        raise ReadOnlyError
+
+    @property
+    def value(self):
+        return self.read()[0]
+
+    @value.setter
+    def value(self, *args):
+        raise ReadOnlyError
+
+
+class ReadOnlyShutdownFlag(ShutdownFlag):
+    """Read only view of `ShutdownFlag`. Apps can check and wait for it."""
+
+    def __init__(self, flag: ShutdownFlag) -> None:
+        self._event = flag._event
+        SharedMemoryObject.__init__(self, 0, flag.name)
+
+    def set(self, *args):
+        raise ReadOnlyError
+
+    @property
+    def value(self) -> bool:
+        return bool(self._flag[0])
+
+    @value.setter
+    def value(self, *args):
+        raise ReadOnlyError
+
+
 def make_read_only(
-    value: Union[Synchronized, SynchronizedArray, SynchronizedString]
-) -> Union[ReadOnlyValue, ReadOnlyArray, ReadOnlyString]:
-    """Make synchronized objects readonly."""
+    value: Union[Synchronized, SynchronizedArray, SynchronizedString, SharedArray, SeqLockValue, ShutdownFlag]
+) -> Union[
+    ReadOnlyValue, ReadOnlyArray, ReadOnlyString, ReadOnlySharedArray, ReadOnlySeqLockValue, ReadOnlyShutdownFlag
+]:
+    """Make synchronized objects and shared memory objects readonly."""
 
     if isinstance(value, Synchronized):
         return ReadOnlyValue(value)
@@ -107,7 +154,14 @@ def make_read_only(
         return ReadOnlyString(value)
     elif isinstance(value, SynchronizedArray):
         return ReadOnlyArray(value)
+    elif isinstance(value, SharedArray):
+        return ReadOnlySharedArray(value)
+    elif isinstance(value, SeqLockValue):
+        return ReadOnlySeqLockValue(value)
+    elif isinstance(value, ShutdownFlag):
+        return ReadOnlyShutdownFlag(value)
     else:
         raise ValueError(
-            f"Unknown type {type(value)}. " "Please Synchronized, SynchronizedArray or SynchronizedString."
+            f"Unknown type {type(value)}. "
+            "Please Synchronized, SynchronizedArray, SynchronizedString, SharedArray, SeqLockValue or ShutdownFlag."
         )
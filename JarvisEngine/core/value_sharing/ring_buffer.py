@@ -0,0 +1,225 @@
+import multiprocessing as mp
+import time
+from typing import *
+
+import numpy as np
+
+from .shared_memory_object import SharedMemoryObject
+from .trigger import Trigger
+
+# Head and tail counters are placed on different cache lines.
+_CACHE_LINE = 64
+_HEAD_OFFSET = 0
+_TAIL_OFFSET = _CACHE_LINE
+_FLAGS_OFFSET = 2 * _CACHE_LINE
+_HEADER_SIZE = 3 * _CACHE_LINE
+
+
+class RingBuffer(SharedMemoryObject):
+    """
+    Lock-free single-producer/single-consumer ring buffer channel
+    of fixed-size records on shared memory.
+
+    Only one app can put records and only one app can get records.
+    The producer owns the `head` counter and the consumer owns the `tail`
+    counter, so non-blocking operations never take a lock.
+    Blocking operations sleep on `multiprocessing.Event` instead of spinning,
+    and the events are touched only when the other side is waiting.
+
+    Ex:
+    >>> channel = RingBuffer(1024, (16,), np.float32)
+    >>> self.addProcessSharedValue("channel", channel)
+    ...
+    >>> channel.try_put(np.zeros(16))  # producer
+    >>> record = channel.try_get()  # consumer
+    """
+
+    _shm_views = ("_head", "_tail", "_consumer_waiting", "_producer_waiting", "_records")
+
+    # Upper bound of one sleep in blocking operations.
+    # Guards against a wake-up lost by reordered memory access.
+    wait_slice: float = 0.05
+
+    def __init__(
+        self,
+        capacity: int,
+        shape: Union[int, Tuple[int, ...]] = (),
+        dtype: Any = np.float64,
+        trigger: Optional[Trigger] = None,
+    ) -> None:
+        """
+        Args:
+        - capacity
+            The max number of records in the buffer.
+        - shape
+            The shape of one record.
+        - dtype
+            The data type of record.
+        - trigger (optional)
+            Notified whenever records are put.
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, but {capacity}.")
+        if isinstance(shape, int):
+            shape = (shape,)
+        self._capacity = capacity
+        self._shape = tuple(shape)
+        self._dtype = np.dtype(dtype)
+        self._not_empty = mp.Event()
+        self._not_full = mp.Event()
+        self._trigger = trigger
+
+        record_size = int(np.prod(self._shape)) * self._dtype.itemsize
+        super().__init__(_HEADER_SIZE + capacity * record_size)
+
+    def _attach(self) -> None:
+        buf = self.buf
+        self._head: np.ndarray = np.ndarray((1,), np.uint64, buffer=buf, offset=_HEAD_OFFSET)
+        self._tail: np.ndarray = np.ndarray((1,), np.uint64, buffer=buf, offset=_TAIL_OFFSET)
+        self._consumer_waiting: np.ndarray = np.ndarray((1,), np.uint8, buffer=buf, offset=_FLAGS_OFFSET)
+        self._producer_waiting: np.ndarray = np.ndarray((1,), np.uint8, buffer=buf, offset=_FLAGS_OFFSET + 1)
+        self._records: np.ndarray = np.ndarray(
+            (self._capacity, *self._shape), self._dtype, buffer=buf, offset=_HEADER_SIZE
+        )
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """The shape of one record."""
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def trigger(self) -> Optional[Trigger]:
+        return self._trigger
+
+    def __len__(self) -> int:
+        return int(self._head[0]) - int(self._tail[0])
+
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    def full(self) -> bool:
+        return len(self) >= self._capacity
+
+    def try_put(self, record: Any) -> bool:
+        """Put a record without blocking.
+        Returns False if the buffer is full.
+        """
+        head = int(self._head[0])
+        if head - int(self._tail[0]) >= self._capacity:
+            return False
+        self._records[head % self._capacity] = record
+        self._head[0] = head + 1
+        if self._consumer_waiting[0]:
+            self._not_empty.set()
+        if self._trigger is not None:
+            self._trigger.notify()
+        return True
+
+    def try_get(self) -> Optional[np.ndarray]:
+        """Get a copy of the oldest record without blocking.
+        Returns None if the buffer is empty.
+        """
+        tail = int(self._tail[0])
+        if tail == int(self._head[0]):
+            return None
+        record = self._records[tail % self._capacity].copy()
+        self._tail[0] = tail + 1
+        if self._producer_waiting[0]:
+            self._not_full.set()
+        return record
+
+    def put_many(self, records: Any) -> int:
+        """Put records as many as possible without blocking.
+        Returns the number of records put into the buffer.
+        """
+        records = np.asarray(records, self._dtype)
+        head = int(self._head[0])
+        num = min(len(records), self._capacity - (head - int(self._tail[0])))
+        if num <= 0:
+            return 0
+        start = head % self._capacity
+        first = min(num, self._capacity - start)
+        self._records[start : start + first] = records[:first]
+        self._records[: num - first] = records[first:num]
+        self._head[0] = head + num
+        if self._consumer_waiting[0]:
+            self._not_empty.set()
+        if self._trigger is not None:
+            self._trigger.notify()
+        return num
+
+    def get_many(self, max_records: int = None) -> np.ndarray:
+        """Get copies of records without blocking.
+        Returns an array of shape `(num, *shape)`. `num` may be zero.
+        """
+        tail = int(self._tail[0])
+        num = int(self._head[0]) - tail
+        if max_records is not None:
+            num = min(num, max_records)
+        start = tail % self._capacity
+        first = min(num, self._capacity - start)
+        records = np.concatenate([self._records[start : start + first], self._records[: num - first]])
+        self._tail[0] = tail + num
+        if num > 0 and self._producer_waiting[0]:
+            self._not_full.set()
+        return records
+
+    def put(self, record: Any, timeout: float = None) -> bool:
+        """Put a record. Sleeps while the buffer is full.
+        Returns False if timeout expired.
+        """
+        return self._blocking(lambda: self.try_put(record), self.full, self._not_full, self._producer_waiting, timeout)
+
+    def get(self, timeout: float = None) -> Optional[np.ndarray]:
+        """Get a record. Sleeps while the buffer is empty.
+        Returns None if timeout expired.
+        """
+        record = None
+
+        def try_get() -> bool:
+            nonlocal record
+            record = self.try_get()
+            return record is not None
+
+        self._blocking(try_get, self.empty, self._not_empty, self._consumer_waiting, timeout)
+        return record
+
+    def _blocking(
+        self,
+        attempt: Callable[[], bool],
+        unavailable: Callable[[], bool],
+        event: Any,
+        waiting: np.ndarray,
+        timeout: Optional[float],
+    ) -> bool:
+        """Retry `attempt` until success, sleeping on `event` between attempts."""
+        if timeout is not None:
+            deadline = time.perf_counter() + timeout
+        while not attempt():
+            wait_time = self.wait_slice
+            if timeout is not None:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return False
+                wait_time = min(wait_time, remaining)
+
+            waiting[0] = 1
+            event.clear()
+            if unavailable():
+                event.wait(wait_time)
+            waiting[0] = 0
+        return True
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(capacity={self.capacity}, shape={self.shape}, "
+            f"dtype={self.dtype}, name={self.name!r})"
+        )
@@ -0,0 +1,115 @@
+from typing import *
+
+import numpy as np
+
+from .shared_memory_object import SharedMemoryObject
+from .trigger import Trigger
+
+# The data is placed on the next cache line of the sequence counter.
+_DATA_OFFSET = 64
+
+
+class SeqLockValue(SharedMemoryObject):
+    """
+    Shared value protected by a sequence lock.
+
+    The single writer makes the sequence counter odd while writing, and
+    readers retry if the counter is odd or changed during reading.
+    So readers never block the writer and never take a lock.
+    Only one app must write the value.
+
+    The version is incremented by every write, so readers can cheaply check
+    whether the value has changed since they last read it.
+
+    Ex:
+    >>> position = SeqLockValue(np.float64, np.zeros(3))
+    >>> self.addProcessSharedValue("position", position)
+    ...
+    >>> position.value = [1.0, 2.0, 3.0]  # writer
+    >>> value, version = position.read()  # reader
+    >>> position.changed_since(version)
+    False
+    """
+
+    _shm_views = ("_sequence", "_data")
+
+    def __init__(self, dtype: Any = np.float64, value: Any = 0, trigger: Optional[Trigger] = None) -> None:
+        """
+        Args:
+        - dtype
+            The data type of value.
+        - value
+            The initial value. The shape of value is fixed by it.
+        - trigger (optional)
+            Notified whenever the value is written.
+        """
+        self._trigger = trigger
+        initial = np.asarray(value, dtype)
+        self._dtype = initial.dtype
+        self._shape = initial.shape
+        super().__init__(_DATA_OFFSET + max(initial.nbytes, 1))
+        self._data[...] = initial
+
+    def _attach(self) -> None:
+        buf = self.buf
+        self._sequence: np.ndarray = np.ndarray((1,), np.uint64, buffer=buf)
+        self._data: np.ndarray = np.ndarray(self._shape, self._dtype, buffer=buf, offset=_DATA_OFFSET)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._shape
+
+    @property
+    def trigger(self) -> Optional[Trigger]:
+        return self._trigger
+
+    @property
+    def version(self) -> int:
+        """The number of completed writes."""
+        return int(self._sequence[0]) >> 1
+
+    def changed_since(self, version: int) -> bool:
+        """Whether the value has been written since `version`."""
+        return self.version != version
+
+    def read(self) -> Tuple[Any, int]:
+        """Read a consistent value.
+        Returns (value, version).
+        Array values are copied, scalar values are python objects.
+        """
+        while True:
+            sequence = int(self._sequence[0])
+            if sequence & 1:
+                continue  # writing.
+            if self._shape:
+                value = self._data.copy()
+            else:
+                value = self._data.item()
+            if int(self._sequence[0]) == sequence:
+                return value, sequence >> 1
+
+    def write(self, value: Any) -> None:
+        """Write value. Do not call from multiple writers."""
+        # converted before writing, so an invalid value never leaves the counter odd.
+        data = np.broadcast_to(np.asarray(value, self._dtype), self._shape)
+        sequence = int(self._sequence[0])
+        self._sequence[0] = sequence + 1
+        self._data[...] = data
+        self._sequence[0] = sequence + 2
+        if self._trigger is not None:
+            self._trigger.notify()
+
+    @property
+    def value(self) -> Any:
+        return self.read()[0]
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self.write(value)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(dtype={self.dtype}, shape={self.shape}, name={self.name!r})"
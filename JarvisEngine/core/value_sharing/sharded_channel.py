@@ -0,0 +1,168 @@
+import zlib
+from typing import *
+
+import numpy as np
+
+from .ring_buffer import RingBuffer
+from .shared_memory_object import SharedMemoryObject
+from .trigger import Trigger
+
+# Scatter and gather cursors are placed on different cache lines.
+_CACHE_LINE = 64
+_SCATTER_OFFSET = 0
+_GATHER_OFFSET = _CACHE_LINE
+
+
+class ShardedChannel(SharedMemoryObject):
+    """
+    Channel of one `RingBuffer` per shard, for replicated apps.
+
+    Scatter: One producer puts records, and they are distributed to
+    shards round-robin or by hash of key. The replica `i` gets records
+    from `shard(i)`.
+
+    Gather: The replica `i` puts records into `shard(i)`, and one
+    consumer gets records from all shards in turn.
+
+    Every shard is a single-producer/single-consumer ring buffer,
+    so no operation takes a lock. Scatter and gather cursors are
+    on shared memory.
+
+    Ex:
+    >>> inputs = ShardedChannel(self.num_replicas, 1024, (16,), np.float32)
+    >>> inputs.put(record)  # producer
+    >>> inputs.put(record, key=user_id)  # same key goes to same shard.
+    >>> record = inputs.shard(self.replica_index).get(timeout=1.0)  # replica
+    """
+
+    _shm_views = ("_scatter_cursor", "_gather_cursor")
+
+    def __init__(
+        self,
+        num_shards: int,
+        capacity: int,
+        shape: Union[int, Tuple[int, ...]] = (),
+        dtype: Any = np.float64,
+        trigger: Optional[Trigger] = None,
+    ) -> None:
+        """
+        Args:
+        - num_shards
+            The number of shards. Usually the number of replicas.
+        - capacity
+            The max number of records in each shard.
+        - shape
+            The shape of one record.
+        - dtype
+            The data type of record.
+        - trigger (optional)
+            Notified whenever records are put into any shard.
+        """
+        if num_shards <= 0:
+            raise ValueError(f"num_shards must be positive, but {num_shards}.")
+        self._shards = tuple(RingBuffer(capacity, shape, dtype, trigger) for _ in range(num_shards))
+        self._trigger = trigger
+        super().__init__(2 * _CACHE_LINE)
+
+    def _attach(self) -> None:
+        buf = self.buf
+        self._scatter_cursor: np.ndarray = np.ndarray((1,), np.uint64, buffer=buf, offset=_SCATTER_OFFSET)
+        self._gather_cursor: np.ndarray = np.ndarray((1,), np.uint64, buffer=buf, offset=_GATHER_OFFSET)
+
+    @property
+    def num_shards(self) -> int:
+        return len(self._shards)
+
+    @property
+    def shards(self) -> Tuple[RingBuffer, ...]:
+        return self._shards
+
+    @property
+    def trigger(self) -> Optional[Trigger]:
+        return self._trigger
+
+    def shard(self, index: int) -> RingBuffer:
+        """Returns the shard of replica `index`."""
+        return self._shards[index]
+
+    def shard_index(self, key: Union[None, int, str, bytes] = None) -> int:
+        """Returns the shard index of key.
+        If key is None, returns the next shard of round-robin.
+        Keys are hashed by crc32, so the index is same among processes.
+        """
+        if key is None:
+            cursor = int(self._scatter_cursor[0])
+            self._scatter_cursor[0] = cursor + 1
+            return cursor % len(self._shards)
+        if isinstance(key, int):
+            return key % len(self._shards)
+        if isinstance(key, str):
+            key = key.encode()
+        return zlib.crc32(key) % len(self._shards)
+
+    def try_put(self, record: Any, key: Union[None, int, str, bytes] = None) -> bool:
+        """Scatter a record without blocking.
+        Returns False if the shard is full.
+        """
+        return self._shards[self.shard_index(key)].try_put(record)
+
+    def put(self, record: Any, key: Union[None, int, str, bytes] = None, timeout: float = None) -> bool:
+        """Scatter a record. Sleeps while the shard is full.
+        Returns False if timeout expired.
+        """
+        return self._shards[self.shard_index(key)].put(record, timeout)
+
+    def try_get(self) -> Optional[np.ndarray]:
+        """Gather a record from the shards in turn without blocking.
+        Returns None if all shards are empty.
+        """
+        cursor = int(self._gather_cursor[0])
+        num_shards = len(self._shards)
+        for i in range(num_shards):
+            record = self._shards[(cursor + i) % num_shards].try_get()
+            if record is not None:
+                self._gather_cursor[0] = cursor + i + 1
+                return record
+        return None
+
+    def get_many(self, max_records: int = None) -> np.ndarray:
+        """Gather records from all shards without blocking.
+        The first shard is advanced round-robin on each call,
+        so no shard starves when `max_records` is given.
+        Returns an array of shape `(num, *shape)`. `num` may be zero.
+        """
+        cursor = int(self._gather_cursor[0])
+        self._gather_cursor[0] = cursor + 1
+        num_shards = len(self._shards)
+        records: List[np.ndarray] = []
+        num = 0
+        for i in range(num_shards):
+            if max_records is not None and num >= max_records:
+                break
+            shard = self._shards[(cursor + i) % num_shards]
+            shard_records = shard.get_many(None if max_records is None else max_records - num)
+            if len(shard_records) > 0:
+                records.append(shard_records)
+                num += len(shard_records)
+        if not records:
+            shard = self._shards[0]
+            return np.empty((0, *shard.shape), shard.dtype)
+        if len(records) == 1:
+            return records[0]
+        return np.concatenate(records)
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def unlink(self) -> None:
+        """Destroy memory blocks of this and all shards."""
+        for shard in self._shards:
+            shard.unlink()
+        super().unlink()
+
+    def __repr__(self) -> str:
+        shard = self._shards[0]
+        return (
+            f"{self.__class__.__name__}(num_shards={self.num_shards}, capacity={shard.capacity}, "
+            f"shape={shard.shape}, dtype={shard.dtype}, name={self.name!r})"
+        )
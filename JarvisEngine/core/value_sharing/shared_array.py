@@ -0,0 +1,67 @@
+from typing import *
+
+import numpy as np
+
+from .shared_memory_object import SharedMemoryObject
+
+
+class SharedArray(SharedMemoryObject):
+    """
+    Numpy array placed on shared memory.
+    The array is shared between processes without copying and
+    without locking, so please synchronize writing by yourself if needed.
+
+    `getProcessSharedValue` returns the `np.ndarray` view of this object.
+
+    Ex:
+    >>> frame = SharedArray((480, 640, 3), np.uint8)
+    >>> self.addProcessSharedValue("frame", frame)
+    """
+
+    _shm_views = ("_array",)
+
+    def __init__(self, shape: Union[int, Tuple[int, ...]], dtype: Any = np.float64, name: str = None) -> None:
+        """
+        Args:
+        - shape
+            The shape of array.
+        - dtype
+            The data type of array.
+        - name (optional)
+            The name of existing shared memory block.
+        """
+        if isinstance(shape, int):
+            shape = (shape,)
+        self._shape = tuple(shape)
+        self._dtype = np.dtype(dtype)
+        nbytes = max(int(np.prod(self._shape)) * self._dtype.itemsize, 1)
+        super().__init__(nbytes, name)
+
+    def _attach(self) -> None:
+        self._array: np.ndarray = np.ndarray(self._shape, self._dtype, buffer=self.buf)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    def get_obj(self) -> np.ndarray:
+        """Returns the `np.ndarray` view of shared memory."""
+        return self._array
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(shape={self.shape}, dtype={self.dtype}, name={self.name!r})"
+
+
+class ReadOnlySharedArray(SharedArray):
+    """Read only view of `SharedArray`."""
+
+    def __init__(self, array: SharedArray) -> None:
+        super().__init__(array.shape, array.dtype, array.name)
+
+    def _attach(self) -> None:
+        super()._attach()
+        self._array.flags.writeable = False
@@ -0,0 +1,100 @@
+from multiprocessing import shared_memory
+from typing import *
+
+from folder_dict import FolderDict
+
+
+class _SharedMemory(shared_memory.SharedMemory):
+    """`SharedMemory` that tolerates views outliving it.
+    `SharedMemory.__del__` raises `BufferError` if numpy views of `buf`
+    are still alive. The mapping is kept by the views in that case,
+    so the error is ignored.
+    """
+
+    def __del__(self):
+        try:
+            self.close()
+        except (OSError, BufferError):
+            pass
+
+
+class SharedMemoryObject(object):
+    """
+    The base class of objects placed on `multiprocessing.shared_memory`.
+    The object is pickled by the name of its shared memory block,
+    so every process attaches the same memory without copying.
+
+    Override methods:
+    - _attach(self)
+        Called after the memory block is created or attached.
+        Build views of `self.buf` here.
+
+    Attrs:
+    - _shm_views: Tuple[str, ...]
+        Attribute names which are views of the memory block.
+        They are not pickled and rebuilt by `_attach`.
+    """
+
+    _shm_views: Tuple[str, ...] = ()
+
+    def __init__(self, size: int, name: str = None) -> None:
+        """
+        Args:
+        - size
+            The byte size of memory block.
+        - name (optional)
+            The name of existing memory block.
+            If None, a new memory block is created.
+        """
+        if name is None:
+            self._shm = _SharedMemory(create=True, size=size)
+        else:
+            self._shm = _SharedMemory(name=name)
+        self._attach()
+
+    def _attach(self) -> None:
+        """Called after the memory block is created or attached."""
+
+    @property
+    def name(self) -> str:
+        """The name of shared memory block."""
+        return self._shm.name
+
+    @property
+    def buf(self) -> memoryview:
+        return self._shm.buf
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_shm"] = self._shm.name
+        for view in self._shm_views:
+            state.pop(view, None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._shm = _SharedMemory(name=state["_shm"])
+        self._attach()
+
+    def unlink(self) -> None:
+        """
+        Destroy the memory block.
+        Call only once among all processes.
+        """
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r})"
+
+
+def unlink_shared_memory_objects(shared_values: FolderDict) -> None:
+    """Unlink all `SharedMemoryObject` in `shared_values`, and their triggers."""
+    for obj in shared_values[shared_values.paths]:
+        if isinstance(obj, SharedMemoryObject):
+            obj.unlink()
+            trigger = getattr(obj, "trigger", None)
+            if isinstance(trigger, SharedMemoryObject):
+                trigger.unlink()
@@ -0,0 +1,66 @@
+import multiprocessing as mp
+from typing import *
+
+import numpy as np
+
+from .shared_memory_object import SharedMemoryObject
+
+
+class ShutdownFlag(SharedMemoryObject):
+    """
+    Shutdown signal of JarvisEngine, shared among all app processes.
+
+    The flag is a byte on shared memory, so checking it never takes a lock.
+    Setting the flag also sets `multiprocessing.Event`, so apps sleeping
+    in `wait` or `sleep` wake up immediately.
+
+    Ex:
+    >>> shutdown = ShutdownFlag()
+    >>> shutdown.value  # or shutdown.is_set()
+    False
+    >>> shutdown.sleep(1.0)  # returns True at once if shutdown is set during sleeping.
+    >>> shutdown.set()
+    """
+
+    _shm_views = ("_flag",)
+
+    def __init__(self) -> None:
+        self._event = mp.Event()
+        super().__init__(1)
+
+    def _attach(self) -> None:
+        self._flag: np.ndarray = np.ndarray((1,), np.uint8, buffer=self.buf)
+
+    def is_set(self) -> bool:
+        return bool(self._flag[0])
+
+    def set(self) -> None:
+        """Set the flag and wake all sleeping apps."""
+        self._flag[0] = 1
+        self._event.set()
+
+    @property
+    def value(self) -> bool:
+        return bool(self._flag[0])
+
+    @value.setter
+    def value(self, value: bool) -> None:
+        """Only setting True is allowed. Shutdown can not be canceled."""
+        if not value:
+            raise ValueError("Shutdown can not be canceled.")
+        self.set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Sleep until the flag is set.
+        Returns False if timeout expired.
+        """
+        return self._event.wait(timeout)
+
+    def sleep(self, seconds: float) -> bool:
+        """Sleep for `seconds`, or until the flag is set.
+        Returns True if interrupted by shutdown.
+        """
+        return self._event.wait(seconds)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(value={self.value}, name={self.name!r})"
@@ -0,0 +1,77 @@
+import multiprocessing as mp
+from typing import *
+
+import numpy as np
+from folder_dict import FolderDict
+
+from .shared_memory_object import SharedMemoryObject
+
+
+class Trigger(SharedMemoryObject):
+    """
+    Wakes apps waiting for a publish, across processes.
+
+    The generation counter on shared memory is incremented by every
+    `notify`, and waiting apps sleep on `multiprocessing.Condition`
+    (an OS semaphore) until the generation is changed. Checking the
+    generation never takes a lock, but `notify` takes the lock of
+    the condition briefly.
+
+    Shared value primitives (`RingBuffer`, `SeqLockValue`,
+    `LatestValueMailbox`) take a trigger and notify it on every publish.
+
+    Ex:
+    >>> trigger = Trigger()
+    >>> mailbox = LatestValueMailbox((480, 640, 3), np.uint8, trigger=trigger)
+    ...
+    >>> mailbox.publish(frame)  # producer, notifies the trigger.
+    >>> generation = trigger.generation  # consumer
+    >>> trigger.wait(generation, timeout=1.0)
+    """
+
+    _shm_views = ("_generation",)
+
+    def __init__(self) -> None:
+        self._condition = mp.Condition()
+        super().__init__(8)
+
+    def _attach(self) -> None:
+        self._generation: np.ndarray = np.ndarray((1,), np.uint64, buffer=self.buf)
+
+    @property
+    def generation(self) -> int:
+        """The number of notifications."""
+        return int(self._generation[0])
+
+    def notify(self) -> None:
+        """Increment the generation and wake all waiting apps."""
+        with self._condition:
+            self._generation[0] += 1
+            self._condition.notify_all()
+
+    def wait(self, generation: int, timeout: float = None) -> bool:
+        """Sleep until notified after `generation`.
+        Returns immediately if already notified.
+        Returns False if timeout expired.
+        """
+        if self.generation != generation:
+            return True
+        with self._condition:
+            return self._condition.wait_for(lambda: self.generation != generation, timeout)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(generation={self.generation}, name={self.name!r})"
+
+
+def notify_triggers(shared_values: FolderDict) -> None:
+    """Notify all `Trigger`s in `shared_values` and triggers of
+    shared memory objects to wake waiting apps. Called at shutdown.
+    """
+    triggers = {}
+    for obj in shared_values[shared_values.paths]:
+        if not isinstance(obj, Trigger) and isinstance(obj, SharedMemoryObject):
+            obj = getattr(obj, "trigger", None)
+        if isinstance(obj, Trigger):
+            triggers[obj.name] = obj
+    for trigger in triggers.values():
+        trigger.notify()
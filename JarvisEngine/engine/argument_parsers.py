@@ -1,10 +1,15 @@
 import logging
 from argparse import ArgumentParser
+from datetime import datetime
 
 from ..constants import DEFAULT_CONFIG_FILE_NAME, DEFAULT_ENGINE_CONFIG_FILE
+from ..core.startup_profiler import DEFAULT_TRACE_FILE
 
 CREATE = "create"
 RUN = "run"
+LOGS = "logs"
+
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
 
 def at_launching() -> ArgumentParser:
@@ -15,19 +20,21 @@ def at_launching() -> ArgumentParser:
             The running mode of JarvisEngine.
             If "create", Engine creates a project according to the template.
             If "run", Engine runs your project.
+            If "logs", Engine reads binary log files.
 
         - `-ll`,`--log_level`
             The log level when running JarvisEngine processes.
             The level names follow the standard python library logging.
+            Default is "INFO". Apps override it by `log_level` in `config.json`.
     """
     parser = ArgumentParser()
-    parser.add_argument("command", type=str, choices=[CREATE, RUN], help="Running mode of JarvisEngine")
+    parser.add_argument("command", type=str, choices=[CREATE, RUN, LOGS], help="Running mode of JarvisEngine")
     parser.add_argument(
         "-ll",
         "--log_level",
         type=str,
-        default="DEBUG",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="INFO",
+        choices=LOG_LEVELS,
         help="The log level when running JarvisEngine processes.",
     )
 
@@ -62,6 +69,9 @@ def at_running() -> ArgumentParser:
             The project config file name.
         - `-ec`, `--engine_config_file`
             The path to the engine config file.
+        - `--profile_startup`, `--profile-startup` [PATH]
+            Profiles the startup of all apps. The report is printed at shutdown,
+            and Chrome trace JSON is written to PATH (default: `startup_profile.json`).
     """
     parser = at_launching()
     parser.add_argument("-d", "--project_dir", type=str, default="./", help="The path to your project directory.")
@@ -77,4 +87,53 @@ def at_running() -> ArgumentParser:
         default=DEFAULT_ENGINE_CONFIG_FILE,
         help="The path to the engine config file.",
     )
+
+    parser.add_argument(
+        "--profile_startup",
+        "--profile-startup",
+        type=str,
+        nargs="?",
+        const=DEFAULT_TRACE_FILE,
+        default=None,
+        metavar="PATH",
+        help="Profile the startup of apps, and write Chrome trace JSON to PATH.",
+    )
+    return parser
+
+
+def to_timestamp(value: str) -> float:
+    """Converts unix time or ISO format time (local time if no timezone) to unix time.
+    Ex:
+        "1700000000.5" -> 1700000000.5
+        "2023-11-15T07:13:20" -> unix time of the local time.
+    """
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def at_reading_logs() -> ArgumentParser:
+    """
+    The parser used at reading binary log files.
+    This returns an Argument Parser inherited
+    `at_launching` and with the following options.
+        - log_path
+            A log file or a directory of log files (`sink_dir` of engine config).
+        - `-a`, `--app`
+            Shows only logs of the app (or its child apps, glob patterns). Can be given multiple times.
+        - `--level`
+            Shows only logs of this level or higher.
+        - `--since`, `--until`
+            Shows only logs in the time range. Unix time or ISO format.
+        - `--json`
+            Prints logs as JSON lines.
+    """
+    parser = at_launching()
+    parser.add_argument("log_path", type=str, help="A log file or a directory of log files.")
+    parser.add_argument("-a", "--app", type=str, action="append", default=None, help="Logger name of the app.")
+    parser.add_argument("--level", type=str, default=None, choices=LOG_LEVELS, help="The minimum level of logs.")
+    parser.add_argument("--since", type=to_timestamp, default=None, help="Unix time or ISO format time.")
+    parser.add_argument("--until", type=to_timestamp, default=None, help="Unix time or ISO format time.")
+    parser.add_argument("--json", action="store_true", help="Print logs as JSON lines.")
     return parser
@@ -0,0 +1,47 @@
+import json
+import logging
+import sys
+from typing import *
+
+from ..constants import DEFAULT_ENGINE_CONFIG_FILE
+from ..core.config_tools import dict2attr, read_toml
+from ..core.log_sink import read_entries
+from . import argument_parsers
+
+
+def read():
+    """reads binary log files of JE project."""
+    parser = argument_parsers.at_reading_logs()
+    args = parser.parse_args()
+
+    level = logging.NOTSET if args.level is None else logging.getLevelName(args.level)
+    try:
+        print_entries(args.log_path, args.app, level, args.since, args.until, args.json)
+    except BrokenPipeError:  # ex. piped to `head`.
+        sys.stderr.close()
+
+
+def print_entries(
+    path: str,
+    apps: Sequence[str] = None,
+    level: int = logging.NOTSET,
+    since: float = None,
+    until: float = None,
+    as_json: bool = False,
+    file: TextIO = None,
+) -> None:
+    """Prints log entries which match filters.
+    Entries are formatted by `message_format` and `date_format` of
+    the default engine config, or JSON lines if `as_json`.
+    """
+    if file is None:
+        file = sys.stdout
+    log_conf = dict2attr(read_toml(DEFAULT_ENGINE_CONFIG_FILE)).logging
+    formatter = logging.Formatter(log_conf.message_format, datefmt=log_conf.date_format)
+
+    for entry in read_entries(path, apps, level, since, until):
+        if as_json:
+            line = json.dumps(entry.to_dict(), default=repr)
+        else:
+            line = formatter.format(entry.to_record())
+        print(line, file=file)
@@ -1,17 +1,22 @@
-import ctypes
 import multiprocessing as mp
 import os
 import sys
-from multiprocessing.sharedctypes import Synchronized
 from typing import *
 
 from attr_dict import AttrDict
 
 from ..apps import Launcher
-from ..constants import DEFAULT_ENGINE_CONFIG_FILE, SHUTDOWN_NAME
-from ..core import logging_tool
-from ..core.config_tools import deep_update, dict2attr, read_json, read_toml
-from ..core.value_sharing import FolderDictWithLock, make_read_only
+from ..constants import DEFAULT_ENGINE_CONFIG_FILE, SHUTDOWN_NAME, STARTUP_PROFILER_NAME
+from ..core import logging_tool, metrics, startup_profiler
+from ..core.config_tools import CACHE_DIR_NAME, ConfigCache, dict2attr, read_engine_config, read_project_config
+from ..core.metrics_exporter import MetricsExporter
+from ..core.value_sharing import (
+    FolderDictWithLock,
+    ShutdownFlag,
+    make_read_only,
+    notify_triggers,
+    unlink_shared_memory_objects,
+)
 from . import argument_parsers
 
 logger = logging_tool.getLogger(logging_tool.MAIN_LOGGER_NAME)
@@ -26,67 +31,157 @@ def run():
     engine_config_file = args.engine_config_file
     config_file = args.config_file
     log_level = args.log_level
+    profile_path = args.profile_startup
+    if profile_path is not None:
+        profile_path = os.path.abspath(profile_path)
 
     # move to project directory and add it into path.
     os.chdir(project_dir)
     project_dir = os.getcwd()
     sys.path.insert(0, project_dir)
 
+    # parsed configs are cached in the project directory.
+    config_cache = ConfigCache(os.path.join(project_dir, CACHE_DIR_NAME))
+
     # load engine config file.
-    user_engine_config = read_toml(engine_config_file)
+    user_engine_config = read_engine_config(engine_config_file, DEFAULT_ENGINE_CONFIG_FILE, config_cache)
     user_engine_config["logging"]["log_level"] = log_level
-    default_engine_config = read_toml(DEFAULT_ENGINE_CONFIG_FILE)
-    user_engine_config = deep_update(default_engine_config, user_engine_config)
     engine_config = dict2attr(user_engine_config)
 
     # load config of the project.
-    config = read_json(config_file)
+    config = read_project_config(config_file, config_cache)
     config = dict2attr(config)
 
+    # set process spawn method (before starting any process).
+    set_start_method(engine_config.multiprocessing)
+
     # logging
-    logging_tool.setRootLoggerComponents(engine_config.logging)
+    # The LoggingServerProcess writes the sink, and records of this process are sent to it.
+    server_process = getattr(engine_config.logging, "server", "thread") == "process"
+    logging_tool.setRootLoggerComponents(engine_config.logging, sink=not server_process)
     ### starting logging server
     logging_server = logging_tool.getLoggingServer(engine_config.logging)
     logging_server.start()
-
-    # set process spawn method
-    start_method = engine_config.multiprocessing.start_method
-    mp.set_start_method(start_method)
+    if server_process:
+        logger.addHandler(logging_tool.getProcessHandler(engine_config.logging.host, engine_config.logging.port))
+        logger.propagate = False
 
     try:
         logger.info("JarvisEngine launch.")
-        main_process(config, engine_config, project_dir)
+        main_process(config, engine_config, project_dir, profile_path, logging_server)
     except BaseException as e:
         logger.exception(e)
+    logging_tool.closeProcessHandlers()  # send all records of this process before shutdown.
     logging_server.shutdown()
+    logger.handlers.clear()
+    logger.propagate = True
     logger.info("JarvisEngine shutdown.")
 
 
-def main_process(config: AttrDict, engine_config: AttrDict, project_dir: str) -> None:
-    """main process"""
+def set_start_method(mp_conf: AttrDict) -> None:
+    """Set the start method of app processes.
+    If `forkserver`, modules of `forkserver_preload` are imported once
+    in the fork server, and app processes are forked from it.
+    """
+    mp.set_start_method(mp_conf.start_method)
+    if mp_conf.start_method == "forkserver":
+        mp.set_forkserver_preload(list(mp_conf.forkserver_preload))
+
+
+def main_process(
+    config: AttrDict,
+    engine_config: AttrDict,
+    project_dir: str,
+    profile_path: str = None,
+    logging_server: Any = None,
+) -> None:
+    """main process
+    If `profile_path` is given, profiles the startup of all apps,
+    prints the report at shutdown and writes Chrome trace JSON to it.
+    Metrics are exported while apps are running, if enabled by `metrics` of engine config.
+    """
     mp.freeze_support()
+    profiler = create_startup_profiler() if profile_path is not None else None
     launcher = Launcher(config, engine_config, project_dir)
     with mp.Manager() as sync_manager:
         p_sv = launcher.prepare_for_launching(sync_manager)
-        shutdown = create_shutdown(p_sv)
-        launcher.launch(p_sv)
-        wait_for_EnterKey(shutdown)
-        launcher.join()
-
-
-def create_shutdown(process_shared_values: FolderDictWithLock) -> Synchronized:
+        try:
+            if profiler is not None:
+                p_sv[STARTUP_PROFILER_NAME] = profiler
+            shutdown = create_shutdown(p_sv)
+            exporter = create_metrics_exporter(launcher, engine_config, logging_server)
+            exporter.start()
+            if exporter.server_address is not None:
+                host, port = exporter.server_address
+                logger.info(f"Metrics are served at http://{host}:{port}/metrics")
+            try:
+                launcher.launch(p_sv)
+                wait_for_EnterKey(shutdown)
+                notify_triggers(p_sv)  # wake apps waiting for triggers.
+                launcher.join()
+            finally:
+                exporter.shutdown()
+        finally:
+            unlink_shared_memory_objects(p_sv)
+
+    if profiler is not None:
+        write_startup_profile(profiler, profile_path)
+
+
+def create_startup_profiler() -> startup_profiler.StartupProfiler:
+    """Creates the startup profiler and enables it in the main process."""
+    profiler = startup_profiler.StartupProfiler()
+    startup_profiler.enable(profiler)
+    profiler.start()
+    return profiler
+
+
+def write_startup_profile(profiler: startup_profiler.StartupProfiler, path: str) -> None:
+    """Stops the profiler, prints the report and writes Chrome trace JSON to `path`."""
+    profiler.stop()
+    startup_profiler.enable(None)
+    print(profiler.report())
+    profiler.write_chrome_trace(path)
+    logger.info(f"The startup profile was written to {path}")
+
+
+def collect_metrics(launcher: Launcher, logging_server: Any = None) -> List[metrics.MetricValue]:
+    """Returns metrics of the launcher, and the number of records dropped by the LoggingServer."""
+    values = launcher.get_metrics()
+    dropped = getattr(logging_server, "dropped_records", None)
+    if dropped is not None:
+        values.append(metrics.MetricValue("jarvis_log_server_dropped_records_total", metrics.COUNTER, {}, dropped))
+    return values
+
+
+def create_metrics_exporter(launcher: Launcher, engine_config: AttrDict, logging_server: Any = None) -> MetricsExporter:
+    """Creates the exporter of metrics by `metrics` of engine config.
+    The exporter does nothing if both of the HTTP endpoint and the textfile are disabled.
+    """
+    metrics_conf = getattr(engine_config, "metrics", None)
+    exporter = MetricsExporter(
+        lambda: collect_metrics(launcher, logging_server),
+        http_host=getattr(metrics_conf, "http_host", "127.0.0.1"),
+        http_port=getattr(metrics_conf, "http_port", 0),
+        textfile=getattr(metrics_conf, "textfile", ""),
+        textfile_interval=getattr(metrics_conf, "textfile_interval", 5.0),
+    )
+    return exporter
+
+
+def create_shutdown(process_shared_values: FolderDictWithLock) -> ShutdownFlag:
     """
-    Creates a shutdown value and share it inter all app processes.
-    The shared shutdown value is readonly.
-    Returns pure shutdown value (writable).
+    Creates a shutdown flag and share it inter all app processes.
+    The shared shutdown flag is readonly.
+    Returns pure shutdown flag (writable).
     """
-    shutdown = mp.Value(ctypes.c_bool, False)
+    shutdown = ShutdownFlag()
     shutdown_read_only = make_read_only(shutdown)
     process_shared_values[SHUTDOWN_NAME] = shutdown_read_only
     return shutdown
 
 
-def wait_for_EnterKey(shutdown: Synchronized) -> None:
+def wait_for_EnterKey(shutdown: ShutdownFlag) -> None:
     """Waiting for pushing enter key."""
     input()
     shutdown.value = True
@@ -8,4 +8,4 @@ class App(BaseApp):
     frame_rate = 10.0
 
     def Update(self, delta_time: float) -> None:
-        self.logger.info(f"Updating in {delta_time:.2f} secs.")
+        self.logger.info("Updating in %.2f secs.", delta_time)
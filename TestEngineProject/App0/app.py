@@ -31,6 +31,7 @@ class App0(BaseApp):
         assert self.getProcessSharedValue("Launcher.App1.shared_float").value == -10.0
         assert self.getProcessSharedValue("Launcher.App1.App1_1.shared_bool").value is True
         assert self.getProcessSharedValue("Launcher.App1.App1_2.shared_str").value == b"abc"
+        assert self.getProcessSharedValue("Launcher.App1.shared_array").tolist() == [1, 2, 3]
 
         assert self.getThreadSharedValue("Launcher.App0.set_obj") == {"number"}
         assert self.getThreadSharedValue("Launcher.App1.range_obj") is None
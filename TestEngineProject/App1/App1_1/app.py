@@ -33,6 +33,7 @@ class App1_1(BaseApp):
         assert self.getProcessSharedValue("Launcher.App1.shared_float").value == -10.0
         assert self.getProcessSharedValue("Launcher.App1.App1_1.shared_bool").value is True
         assert self.getProcessSharedValue("Launcher.App1.App1_2.shared_str").value == b"abc"
+        assert self.getProcessSharedValue("Launcher.App1.shared_array").tolist() == [1, 2, 3]
 
         assert self.getThreadSharedValue("Launcher.App0.set_obj") is None
         assert self.getThreadSharedValue("Launcher.App1.range_obj") == range(10)
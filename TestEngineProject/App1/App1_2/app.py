@@ -1,12 +1,17 @@
 import ctypes
 import multiprocessing as mp
 
+import numpy as np
+
 from JarvisEngine.apps import BaseApp
 
 
 class App1_2(BaseApp):
+    shared_array: np.ndarray  # bound in `Init`.
+
     def Init(self):
         self.logger.info("Init1_2")
+        self.bindProcessSharedValue("shared_array", "..shared_array")
 
     def RegisterProcessSharedValues(self, sync_manager) -> None:
         super().RegisterProcessSharedValues(sync_manager)
@@ -32,6 +37,8 @@ class App1_2(BaseApp):
         assert self.getProcessSharedValue("Launcher.App1.shared_float").value == -10.0
         assert self.getProcessSharedValue("Launcher.App1.App1_1.shared_bool").value is True
         assert self.getProcessSharedValue("Launcher.App1.App1_2.shared_str").value == b"abc"
+        assert self.getProcessSharedValue("Launcher.App1.shared_array").tolist() == [1, 2, 3]
+        assert self.shared_array.tolist() == [1, 2, 3]
 
         assert self.getThreadSharedValue("Launcher.App0.set_obj") is None
         assert self.getThreadSharedValue("Launcher.App1.range_obj") is None
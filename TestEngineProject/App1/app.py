@@ -1,6 +1,9 @@
 import multiprocessing as mp
 
+import numpy as np
+
 from JarvisEngine.apps import BaseApp
+from JarvisEngine.core.value_sharing import SharedArray
 
 
 class App1(BaseApp):
@@ -13,6 +16,9 @@ class App1(BaseApp):
 
         self.addProcessSharedValue("int_value", 100)
         self.addProcessSharedValue("shared_float", mp.Value("f", -10.0))
+        shared_array = SharedArray(3, np.int64)
+        shared_array.get_obj()[:] = [1, 2, 3]
+        self.addProcessSharedValue("shared_array", shared_array)
 
     def RegisterThreadSharedValues(self) -> None:
         super().RegisterThreadSharedValues()
@@ -33,6 +39,7 @@ class App1(BaseApp):
         assert self.getProcessSharedValue("Launcher.App1.shared_float").value == -10.0
         assert self.getProcessSharedValue("Launcher.App1.App1_1.shared_bool").value is True
         assert self.getProcessSharedValue("Launcher.App1.App1_2.shared_str").value == b"abc"
+        assert self.getProcessSharedValue("Launcher.App1.shared_array").tolist() == [1, 2, 3]
 
         assert self.getThreadSharedValue("Launcher.App0.set_obj") is None
         assert self.getThreadSharedValue("Launcher.App1.range_obj") == range(10)
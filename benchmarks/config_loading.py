@@ -0,0 +1,64 @@
+"""
+Benchmark of loading a large generated project config.
+
+Compares parsing by `json5`, the C `json` fast path of `read_json`,
+and `read_project_config` with a warm `ConfigCache`.
+
+Usage:
+    python benchmarks/config_loading.py [-a NUM_APPS] [-r REPEAT]
+"""
+import argparse
+import json
+import os
+import tempfile
+import timeit
+
+import json5
+
+from JarvisEngine.core.config_tools import ConfigCache, read_json, read_project_config
+
+
+def generate_config(num_apps: int) -> dict:
+    """Returns a config of `num_apps` process apps which have 4 thread apps."""
+    return {
+        f"App{i}": {
+            "path": f"App{i}.app.App",
+            "thread": False,
+            "frame_rate": 30.0,
+            "apps": {f"Sub{j}": {"path": f"App{i}.sub.App", "thread": True, "option": [j, "x" * 16]} for j in range(4)},
+        }
+        for i in range(num_apps)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-a", "--num_apps", type=int, default=500)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as project_dir:
+        config_file = os.path.join(project_dir, "config.json")
+        with open(config_file, "w", encoding="utf-8") as f:
+            json.dump(generate_config(args.num_apps), f, indent=4)
+        with open(config_file, encoding="utf-8") as f:
+            num_lines = sum(1 for _ in f)
+        cache = ConfigCache(os.path.join(project_dir, "cache"))
+        read_project_config(config_file, cache)  # warm up the cache.
+
+        def json5_load():
+            with open(config_file, encoding="utf-8") as f:
+                return json5.load(f)
+
+        print(f"{num_lines} lines")
+        for label, func in [
+            ("json5", json5_load),
+            ("read_json (C json)", lambda: read_json(config_file)),
+            ("read_project_config (cached)", lambda: read_project_config(config_file, cache)),
+        ]:
+            sec = min(timeit.repeat(func, number=1, repeat=args.repeat))
+            print(f"{label:<32}{sec * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
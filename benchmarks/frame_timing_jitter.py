@@ -0,0 +1,54 @@
+"""
+Benchmark of frame timing jitter of `FrameScheduler`.
+
+Runs an empty update loop at the given frame rate with plain sleeps
+and with precise timing (sleep and spin) at several spin thresholds.
+Prints p50/p99/max of period errors and CPU usage of each mode.
+
+Usage:
+    python benchmarks/frame_timing_jitter.py [-r FRAME_RATE] [-n FRAMES] [-t THRESHOLD ...]
+"""
+import argparse
+import time
+from typing import *
+
+import numpy as np
+
+from JarvisEngine.core.frame_scheduler import FrameScheduler
+
+
+def measure(frame_rate: float, frames: int, spin_threshold: float) -> Tuple[np.ndarray, float, int]:
+    """Returns (period errors, cpu usage, the number of late frames)."""
+    period = 1 / frame_rate
+    scheduler = FrameScheduler(spin_threshold=spin_threshold)
+    start_times: np.ndarray = np.empty(frames, dtype=np.float64)
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for i in range(frames):
+        scheduler.wait(period)
+        start_times[i] = time.perf_counter()
+    cpu_usage = (time.process_time() - cpu_start) / (time.perf_counter() - wall_start)
+
+    errors = np.abs(np.diff(start_times) - period)
+    return errors, cpu_usage, scheduler.late_frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-r", "--frame_rate", type=float, default=1000.0)
+    parser.add_argument("-n", "--frames", type=int, default=3000)
+    parser.add_argument("-t", "--thresholds", type=float, nargs="*", default=[0.0005, 0.001, 0.002])
+    args = parser.parse_args()
+
+    print(f"frame rate {args.frame_rate} Hz, {args.frames} frames")
+    print(f"{'mode':<24}{'p50 [us]':>10}{'p99 [us]':>10}{'max [us]':>10}{'cpu':>8}{'late':>8}")
+    for spin_threshold in [0.0, *args.thresholds]:
+        errors, cpu_usage, late_frames = measure(args.frame_rate, args.frames, spin_threshold)
+        p50, p99 = np.percentile(errors, [50, 99]) * 1e6
+        label = "sleep" if spin_threshold == 0.0 else f"spin {spin_threshold * 1e3:g} ms"
+        print(f"{label:<24}{p50:>10.1f}{p99:>10.1f}{errors.max() * 1e6:>10.1f}{cpu_usage:>8.0%}{late_frames:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Throughput benchmark of LoggingServer: a thread in the main process vs a dedicated process.
+
+N producer processes log records as fast as possible through `Logger`.
+Measures records/second until the server handled all records (records
+lost by refused connections are reported), and
+iterations/second of a pure Python loop in the main thread during that,
+which shows GIL contention of the server with apps in the main process.
+Log output is written to /dev/null. Every case runs in a fresh interpreter.
+
+Usage:
+    python benchmarks/log_server_throughput.py [-n NUM_PRODUCERS ...] [-m NUM_RECORDS] [--buffered]
+"""
+import argparse
+import json
+import logging
+import multiprocessing as mp
+import subprocess
+import sys
+import threading
+import time
+
+SERVER_MODES = ["thread", "process"]
+PORT = 20300
+
+
+def produce(port: int, index: int, num_records: int, buffer_args) -> None:
+    from JarvisEngine.core import logging_tool
+
+    logger = logging_tool.Logger(f"Producer{index}", logging.DEBUG, "127.0.0.1", port, buffer_args)
+    for i in range(num_records):
+        logger.info("record %d of %d", i, index)
+    logging_tool.closeProcessHandlers()
+
+
+class CountingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += 1
+
+
+def run_worker(mode: str, num_producers: int, num_records: int, buffered: bool) -> dict:
+    from JarvisEngine.constants import DEFAULT_ENGINE_CONFIG_FILE
+    from JarvisEngine.core import logging_tool
+    from JarvisEngine.core.config_tools import dict2attr, read_toml
+    from JarvisEngine.core.log_server import LoggingServerProcess
+
+    engine_config = read_toml(DEFAULT_ENGINE_CONFIG_FILE)
+    engine_config["logging"].update(log_level="DEBUG", port=PORT, server=mode, server_queue_size=100000)
+    log_conf = dict2attr(engine_config).logging
+    buffer_args = (log_conf.buffer_capacity * 10, log_conf.flush_size, log_conf.flush_interval) if buffered else None
+
+    logging_tool.setRootLoggerComponents(log_conf)
+    counter = CountingHandler()
+    logging.getLogger().addHandler(counter)
+    server = logging_tool.getLoggingServer(log_conf)
+    server.start()
+
+    total = num_producers * num_records
+    producers = [mp.Process(target=produce, args=(PORT, i, num_records, buffer_args)) for i in range(num_producers)]
+    done = threading.Event()
+
+    def wait_for_handled() -> None:
+        for p in producers:
+            p.join()
+        if mode == "process":
+            server.shutdown()  # handles all records before stopping.
+        else:
+            # Records lost by refused connections never arrive.
+            count, last_change = counter.count, time.perf_counter()
+            while counter.count < total and time.perf_counter() - last_change < 1.0:
+                time.sleep(0.001)
+                if counter.count != count:
+                    count, last_change = counter.count, time.perf_counter()
+        done.set()
+
+    start = time.perf_counter()
+    for p in producers:
+        p.start()
+    threading.Thread(target=wait_for_handled).start()
+    iterations = 0
+    while not done.is_set():
+        for _ in range(1000):
+            iterations += 1
+    elapsed = time.perf_counter() - start
+
+    if mode == "thread":
+        server.shutdown()
+    handled = server.handled_records if isinstance(server, LoggingServerProcess) else counter.count
+    return {"records_per_sec": handled / elapsed, "main_loop_per_sec": iterations / elapsed, "lost": total - handled}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--num_producers", type=int, nargs="*", default=[1, 4, 8])
+    parser.add_argument("-m", "--num_records", type=int, default=20000, help="Records per producer.")
+    parser.add_argument("--buffered", action="store_true", help="Producers use buffered loggers.")
+    parser.add_argument("--worker", type=str, choices=SERVER_MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        result = run_worker(args.worker, args.num_producers[0], args.num_records, args.buffered)
+        print(json.dumps(result), file=sys.stderr)
+        return
+
+    print(f"{args.num_records} records per producer, buffered={args.buffered}")
+    print(f"{'producers':<12}{'server':<10}{'records/s':>12}{'main loop/s':>14}{'lost':>10}")
+    for num_producers in args.num_producers:
+        for mode in SERVER_MODES:
+            command = [sys.executable, __file__, "--worker", mode, "-n", str(num_producers)]
+            command += ["-m", str(args.num_records)] + (["--buffered"] if args.buffered else [])
+            stderr = subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            result = json.loads(stderr.stderr.strip().splitlines()[-1])
+            print(
+                f"{num_producers:<12}{mode:<10}{result['records_per_sec']:>12.0f}"
+                f"{result['main_loop_per_sec']:>14.0f}{result['lost']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
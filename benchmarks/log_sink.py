@@ -0,0 +1,79 @@
+"""
+Benchmark of the binary log sink.
+
+Compares handling records by the text `StreamHandler` of
+`setRootLoggerComponents` (written to /dev/null) and `BinaryLogHandler`,
+and reading a time range of the written logs with and without the index.
+
+Usage:
+    python benchmarks/log_sink.py [-n NUM_RECORDS]
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from JarvisEngine.constants import DEFAULT_ENGINE_CONFIG_FILE
+from JarvisEngine.core.config_tools import dict2attr, read_toml
+from JarvisEngine.core.log_sink import INDEX_SUFFIX, BinaryLogHandler, log_files, read_entries
+
+
+def make_records(num_records: int):
+    records = []
+    for i in range(num_records):
+        record = logging.LogRecord(
+            f"Launcher.App{i % 8}", logging.INFO, __file__, 0, "frame %d, position %.3f", (i, i * 0.1), None
+        )
+        record.created = 1000.0 + i * 0.001
+        records.append(record)
+    return records
+
+
+def handle_all(handler: logging.Handler, records) -> float:
+    start = time.perf_counter()
+    for record in records:
+        handler.handle(record)
+    handler.close()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--num_records", type=int, default=200000)
+    args = parser.parse_args()
+
+    log_conf = dict2attr(read_toml(DEFAULT_ENGINE_CONFIG_FILE)).logging
+    records = make_records(args.num_records)
+
+    with open(os.devnull, "w") as devnull:
+        stream_handler = logging.StreamHandler(devnull)
+        stream_handler.setFormatter(logging.Formatter(log_conf.message_format, datefmt=log_conf.date_format))
+        text_sec = handle_all(stream_handler, records)
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        binary_sec = handle_all(BinaryLogHandler(log_dir), records)
+        size = sum(os.path.getsize(f) for f in log_files(log_dir))
+
+        # the last 1% of records.
+        since = records[-len(records) // 100].created
+        start = time.perf_counter()
+        num_indexed = sum(1 for _ in read_entries(log_dir, since=since))
+        indexed_sec = time.perf_counter() - start
+        for file_path in log_files(log_dir):
+            os.remove(file_path + INDEX_SUFFIX)
+        start = time.perf_counter()
+        num_scanned = sum(1 for _ in read_entries(log_dir, since=since))
+        scanned_sec = time.perf_counter() - start
+        assert num_indexed == num_scanned
+
+    n = args.num_records
+    print(f"{n} records, {size / n:.1f} bytes per binary record")
+    print(f"{'StreamHandler (text)':<36}{text_sec / n * 1e9:>10.0f} ns/record")
+    print(f"{'BinaryLogHandler':<36}{binary_sec / n * 1e9:>10.0f} ns/record")
+    print(f"{'read last 1% (index)':<36}{indexed_sec * 1000:>10.2f} ms")
+    print(f"{'read last 1% (scan)':<36}{scanned_sec * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark of the cost of log calls in the app process.
+
+Compares disabled log calls with f-strings and `%`-style arguments,
+and `makePickle` of the standard `SocketHandler` and `RecordSocketHandler`
+(the part of an enabled log call which is done in the app process).
+
+Usage:
+    python benchmarks/logging_overhead.py [-n NUMBER]
+"""
+import argparse
+import logging
+import logging.handlers
+import timeit
+
+from JarvisEngine.core import logging_tool
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--number", type=int, default=200000)
+    args = parser.parse_args()
+
+    logger = logging_tool.Logger("App", logging.INFO)
+    position, frame = 1.2345, 7
+    record = logging.LogRecord("App", logging.INFO, __file__, 0, "pos %.2f frame %d", (position, frame), None)
+    stdlib_handler = logging.handlers.SocketHandler("127.0.0.1", 0)
+    record_handler = logging_tool.RecordSocketHandler("127.0.0.1", 0)
+
+    for label, func in [
+        ("disabled debug (f-string)", lambda: logger.debug(f"pos {position:.2f} frame {frame}")),
+        ("disabled debug (%-args)", lambda: logger.debug("pos %.2f frame %d", position, frame)),
+        ("makePickle (SocketHandler)", lambda: stdlib_handler.makePickle(record)),
+        ("makePickle (RecordSocketHandler)", lambda: record_handler.makePickle(record)),
+    ]:
+        sec = min(timeit.repeat(func, number=args.number, repeat=5)) / args.number
+        print(f"{label:<36}{sec * 1e9:>10.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark of the cost of recording metrics in the app process.
+
+Compares `MetricCounter.inc` and `MetricHistogram.observe` of `MetricsRegistry`
+(written to shared memory) with a process local counter, and with
+`multiprocessing.Value` which takes a lock on each increment.
+
+Usage:
+    python benchmarks/metrics_overhead.py [-n NUMBER]
+"""
+import argparse
+import multiprocessing as mp
+import timeit
+from typing import *
+
+from JarvisEngine.core import metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--number", type=int, default=200000)
+    args = parser.parse_args()
+
+    registry = metrics.MetricsRegistry(["Launcher", "Launcher.App"])
+    try:
+        counter = registry.get_metric("Launcher.App", metrics.MetricCounter, "items_total")
+        histogram = registry.get_metric("Launcher.App", metrics.MetricHistogram, "latency_seconds")
+        local_counter = metrics.create_local_metric(metrics.MetricCounter, "items_total")
+        mp_value = mp.Value("d", 0.0)
+
+        def inc_mp_value():
+            with mp_value.get_lock():
+                mp_value.value += 1
+
+        funcs: List[Tuple[str, Callable[[], Any]]] = [
+            ("MetricCounter.inc (shared memory)", counter.inc),
+            ("MetricCounter.inc (local)", local_counter.inc),
+            ("MetricHistogram.observe (shared memory)", lambda: histogram.observe(0.003)),
+            ("multiprocessing.Value += 1", inc_mp_value),
+        ]
+        for label, func in funcs:
+            sec = min(timeit.repeat(func, number=args.number, repeat=5)) / args.number
+            print(f"{label:<44}{sec * 1e9:>10.0f} ns")
+    finally:
+        registry.unlink()
+
+
+if __name__ == "__main__":
+    main()
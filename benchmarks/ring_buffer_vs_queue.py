@@ -0,0 +1,144 @@
+"""
+Throughput/latency benchmark of `RingBuffer` against `multiprocessing.Queue`.
+
+A producer process app sends timestamped records to a consumer process app,
+both launched as `child_process_apps` of the Launcher.
+
+Usage:
+    python benchmarks/ring_buffer_vs_queue.py [-n NUM_RECORDS] [-s RECORD_SIZE]
+"""
+import argparse
+import copy
+import multiprocessing as mp
+import os
+import time
+from typing import *
+
+import numpy as np
+
+from JarvisEngine.apps import BaseApp, Launcher
+from JarvisEngine.constants import DEFAULT_ENGINE_CONFIG_FILE
+from JarvisEngine.core import logging_tool
+from JarvisEngine.core.config_tools import dict2attr, read_toml
+from JarvisEngine.core.value_sharing import RingBuffer, SharedArray, unlink_shared_memory_objects
+from JarvisEngine.engine.run_project import create_shutdown
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+MODULE_NAME = os.path.splitext(os.path.basename(__file__))[0]
+
+CHANNELS = ["queue", "ring_buffer", "ring_buffer_batch"]
+BATCH_SIZE = 64
+
+
+def record_dtype(record_size: int) -> np.dtype:
+    return np.dtype([("time", np.float64), ("payload", np.float32, (record_size,))])
+
+
+class Producer(BaseApp):
+    frame_rate = 0.0
+
+    def RegisterProcessSharedValues(self, sync_manager) -> None:
+        super().RegisterProcessSharedValues(sync_manager)
+        dtype = record_dtype(self.config.record_size)
+        if self.config.channel == "queue":
+            self.addProcessSharedValue("channel", mp.Queue(maxsize=self.config.capacity))
+        else:
+            self.addProcessSharedValue("channel", RingBuffer(self.config.capacity, (), dtype))
+
+    def Update(self, delta_time: float) -> None:
+        channel = self.getProcessSharedValue(".channel")
+        num, kind = self.config.num_records, self.config.channel
+        records: np.ndarray = np.zeros(BATCH_SIZE, record_dtype(self.config.record_size))
+
+        sent = 0
+        while sent < num:
+            if kind == "ring_buffer_batch":
+                batch = records[: min(BATCH_SIZE, num - sent)]
+                batch["time"] = time.perf_counter()
+                put = channel.put_many(batch)
+                if put == 0:
+                    time.sleep(0)
+                sent += put
+            else:
+                record = records[0]
+                record["time"] = time.perf_counter()
+                channel.put(record)
+                sent += 1
+
+
+class Consumer(BaseApp):
+    frame_rate = 0.0
+
+    def RegisterProcessSharedValues(self, sync_manager) -> None:
+        super().RegisterProcessSharedValues(sync_manager)
+        # elapsed time, latencies...
+        self.addProcessSharedValue("results", SharedArray(1 + self.config.num_records))
+
+    def Update(self, delta_time: float) -> None:
+        channel = self.getProcessSharedValue("..Producer.channel")
+        results = self.getProcessSharedValue(".results")
+        num, kind = self.config.num_records, self.config.channel
+        latencies = results[1:]
+
+        received = 0
+        start = time.perf_counter()
+        while received < num:
+            if kind == "ring_buffer_batch":
+                records = channel.get_many(BATCH_SIZE)
+                if len(records) == 0:
+                    records = np.asarray(channel.get()).reshape(1)
+            else:
+                records = np.asarray(channel.get()).reshape(1)
+            now = time.perf_counter()
+            latencies[received : received + len(records)] = now - records["time"]
+            received += len(records)
+        results[0] = time.perf_counter() - start
+
+
+def run_benchmark(channel: str, num_records: int, record_size: int, engine_config: Any) -> Tuple[float, np.ndarray]:
+    """Runs producer/consumer apps and returns (elapsed time, latencies)."""
+    app_conf = {"channel": channel, "num_records": num_records, "record_size": record_size, "capacity": 1024}
+    config = dict2attr(
+        {
+            "Producer": {"path": f"{MODULE_NAME}.Producer", "thread": False, **app_conf},
+            "Consumer": {"path": f"{MODULE_NAME}.Consumer", "thread": False, **app_conf},
+        }
+    )
+    launcher = Launcher(config, engine_config, BENCHMARK_DIR)
+    with mp.Manager() as sync_manager:
+        p_sv = launcher.prepare_for_launching(sync_manager)
+        try:
+            create_shutdown(p_sv)
+            launcher.launch(p_sv)
+            launcher.join()
+            results = cast(SharedArray, p_sv["Launcher.Consumer.results"]).get_obj().copy()
+        finally:
+            unlink_shared_memory_objects(p_sv)
+    return results[0], results[1:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--num_records", type=int, default=100000)
+    parser.add_argument("-s", "--record_size", type=int, default=16, help="The number of float32 in one record.")
+    args = parser.parse_args()
+
+    mp.set_start_method("spawn")
+    user_engine_config = read_toml(DEFAULT_ENGINE_CONFIG_FILE)
+    user_engine_config["logging"]["log_level"] = "WARNING"
+    engine_config = dict2attr(user_engine_config)
+    logging_server = logging_tool.getLoggingServer(engine_config.logging)
+    logging_server.start()
+
+    print(f"records: {args.num_records}, record size: {args.record_size} float32")
+    print(f"{'channel':<20}{'records/s':>14}{'p50 [us]':>12}{'p99 [us]':>12}{'max [us]':>12}")
+    for channel in CHANNELS:
+        elapsed, latencies = run_benchmark(channel, args.num_records, args.record_size, copy.deepcopy(engine_config))
+        p50, p99, pmax = np.percentile(latencies, [50, 99, 100]) * 1e6
+        print(f"{channel:<20}{args.num_records / elapsed:>14.0f}{p50:>12.1f}{p99:>12.1f}{pmax:>12.1f}")
+
+    logging_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
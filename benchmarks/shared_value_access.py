@@ -0,0 +1,53 @@
+"""
+Micro-benchmark of accessing a process shared value from an app.
+
+Compares `getProcessSharedValue` by absolute and relative names,
+on locked and frozen registries, with a bound attribute.
+
+Usage:
+    python benchmarks/shared_value_access.py [-n NUMBER]
+"""
+import argparse
+import multiprocessing as mp
+import timeit
+
+from attr_dict import AttrDict
+
+from JarvisEngine.apps import Launcher
+from JarvisEngine.constants import DEFAULT_ENGINE_CONFIG_FILE
+from JarvisEngine.core import name as name_tools
+from JarvisEngine.core.config_tools import dict2attr, read_toml
+from JarvisEngine.core.value_sharing import FolderDictWithLock
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--number", type=int, default=200000)
+    args = parser.parse_args()
+
+    engine_config = read_toml(DEFAULT_ENGINE_CONFIG_FILE)
+    engine_config["logging"]["log_level"] = "WARNING"
+    app = Launcher(AttrDict(), dict2attr(engine_config), ".")
+
+    p_sv = FolderDictWithLock(sep=name_tools.SEP, lock=mp.RLock())
+    app.process_shared_values = p_sv
+    app.addProcessSharedValue("value", 1)
+    app.bindProcessSharedValue("value", ".value")
+
+    def bench(label: str, stmt: str) -> None:
+        sec = timeit.timeit(stmt, globals={"app": app}, number=args.number)
+        print(f"{label:<40}{sec / args.number * 1e9:>10.0f} ns")
+
+    print(f"{'access':<40}{'per call':>10}")
+    name_tools.join.cache_clear()
+    bench("absolute name (locked)", 'app.getProcessSharedValue("Launcher.value")')
+    bench("relative name (locked)", 'app.getProcessSharedValue(".value")')
+    p_sv.freeze()
+    bench("absolute name (frozen)", 'app.getProcessSharedValue("Launcher.value")')
+    bench("relative name (frozen)", 'app.getProcessSharedValue(".value")')
+    app.resolve_shared_value_bindings()
+    bench("bound attribute", "app.value")
+
+
+if __name__ == "__main__":
+    main()
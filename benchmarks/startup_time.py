@@ -0,0 +1,125 @@
+"""
+Startup time benchmark of process start methods: spawn, forkserver and fork.
+
+Generates an app tree of process apps (each with thread apps) which import
+given modules, and measures the time from `Launcher.launch` until all
+apps reach `Start`. Every start method runs in a fresh interpreter.
+
+Usage:
+    python benchmarks/startup_time.py [-p NUM_PROCESSES] [-t NUM_THREADS] [-m MODULE ...] [-r REPEAT]
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+APP_MODULE_NAME = "startup_app"
+APP_SOURCE = """
+{imports}
+from JarvisEngine.apps import BaseApp
+
+
+class App(BaseApp):
+    def Start(self):
+        started = self.getProcessSharedValue("started")
+        with started.get_lock():
+            started.value += 1
+"""
+
+START_METHODS = ["spawn", "forkserver", "fork"]
+
+
+def generate_project(project_dir: str, num_processes: int, num_threads: int, modules: list) -> dict:
+    """Writes the app module into `project_dir` and returns the config of app tree."""
+    imports = "\n".join(f"import {m}" for m in modules)
+    with open(os.path.join(project_dir, f"{APP_MODULE_NAME}.py"), "w") as f:
+        f.write(APP_SOURCE.format(imports=imports))
+
+    app = {"path": f"{APP_MODULE_NAME}.App"}
+    return {
+        f"Process{i}": {
+            **app,
+            "thread": False,
+            "apps": {f"Thread{j}": {**app, "thread": True} for j in range(num_threads)},
+        }
+        for i in range(num_processes)
+    }
+
+
+def run_worker(start_method: str, project_dir: str, config: dict, modules: list) -> float:
+    """Launches the app tree and returns seconds until all apps started."""
+    sys.path.insert(0, project_dir)
+    from JarvisEngine.apps import Launcher
+    from JarvisEngine.constants import DEFAULT_ENGINE_CONFIG_FILE
+    from JarvisEngine.core import logging_tool
+    from JarvisEngine.core.config_tools import dict2attr, read_toml
+    from JarvisEngine.core.value_sharing import unlink_shared_memory_objects
+    from JarvisEngine.engine.run_project import create_shutdown, set_start_method
+
+    user_engine_config = read_toml(DEFAULT_ENGINE_CONFIG_FILE)
+    user_engine_config["logging"]["log_level"] = "WARNING"
+    user_engine_config["multiprocessing"]["start_method"] = start_method
+    user_engine_config["multiprocessing"]["forkserver_preload"] += [*modules, APP_MODULE_NAME]
+    engine_config = dict2attr(user_engine_config)
+    logging_server = logging_tool.getLoggingServer(engine_config.logging)
+    logging_server.start()
+    set_start_method(engine_config.multiprocessing)
+
+    launcher = Launcher(dict2attr(config), engine_config, project_dir)
+    num_apps = len(launcher.get_all_app_names()) - 1
+    with mp.Manager() as sync_manager:
+        p_sv = launcher.prepare_for_launching(sync_manager)
+        started = mp.Value("i", 0)
+        p_sv["started"] = started
+        try:
+            shutdown = create_shutdown(p_sv)
+            start = time.perf_counter()
+            launcher.launch(p_sv)
+            while started.value < num_apps:
+                time.sleep(0.001)
+            elapsed = time.perf_counter() - start
+            shutdown.set()
+            launcher.join()
+        finally:
+            unlink_shared_memory_objects(p_sv)
+    logging_server.shutdown()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-p", "--num_processes", type=int, default=8)
+    parser.add_argument("-t", "--num_threads", type=int, default=2, help="The number of thread apps per process app.")
+    parser.add_argument("-m", "--modules", type=str, nargs="*", default=["numpy"], help="Modules imported by apps.")
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    parser.add_argument("--worker", type=str, choices=START_METHODS, help=argparse.SUPPRESS)
+    parser.add_argument("--project_dir", type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        config = generate_project(args.project_dir, args.num_processes, args.num_threads, args.modules)
+        print(json.dumps(run_worker(args.worker, args.project_dir, config, args.modules)))
+        return
+
+    num_apps = args.num_processes * (1 + args.num_threads)
+    print(f"{args.num_processes} process apps, {num_apps} apps, importing {args.modules}")
+    print(f"{'start method':<16}{'best [s]':>10}{'mean [s]':>10}")
+    with tempfile.TemporaryDirectory() as project_dir:
+        for start_method in START_METHODS:
+            if start_method not in mp.get_all_start_methods():
+                continue
+            command = [sys.executable, __file__, "--worker", start_method, "--project_dir", project_dir]
+            command += ["-p", str(args.num_processes), "-t", str(args.num_threads), "-m", *args.modules]
+            times = []
+            for _ in range(args.repeat):
+                output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+                times.append(json.loads(output.strip().splitlines()[-1]))
+            print(f"{start_method:<16}{min(times):>10.3f}{sum(times) / len(times):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
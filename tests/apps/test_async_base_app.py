@@ -0,0 +1,78 @@
+import asyncio
+import copy
+import multiprocessing as mp
+import threading
+import time
+
+from attr_dict import AttrDict
+
+from JarvisEngine.apps import AsyncBaseApp, Launcher
+from JarvisEngine.core.config_tools import dict2attr
+from JarvisEngine.core.event_loop import EVENT_LOOP_THREAD_NAME
+from JarvisEngine.core.logging_tool import getLoggingServer
+from JarvisEngine.core.value_sharing import unlink_shared_memory_objects
+from JarvisEngine.engine.run_project import create_shutdown
+
+from .test_base_app import engine_config as src_ec
+
+engine_config: AttrDict = copy.deepcopy(src_ec)
+engine_config.logging.port = 20224
+ls = getLoggingServer(engine_config.logging)
+ls.start()
+
+
+class PeriodicApp(AsyncBaseApp):
+    frame_rate = 20.0
+
+    def Init(self):
+        self.thread_names = set()
+
+    async def UpdateAsync(self, delta_time):
+        self.thread_names.add(threading.current_thread().name)
+        await asyncio.sleep(0.03)  # I/O
+
+
+class ShutdownWaiterApp(AsyncBaseApp):
+    shutdown_waited = False
+
+    async def UpdateAsync(self, delta_time):
+        await self.wait_for_shutdown()
+        self.shutdown_waited = True
+
+
+config = dict2attr(
+    {
+        "Periodic0": {"path": f"{__name__}.PeriodicApp", "thread": True},
+        "Periodic1": {"path": f"{__name__}.PeriodicApp", "thread": True},
+        "ShutdownWaiter": {"path": f"{__name__}.ShutdownWaiterApp", "thread": True},
+    }
+)
+
+
+def test_is_async():
+    assert AsyncBaseApp.is_async is True
+    assert not Launcher.is_async
+
+
+def test_launch():
+    LauncherApp = Launcher(config, engine_config, ".")
+    with mp.Manager() as sync_manager:
+        p_sv = LauncherApp.prepare_for_launching(sync_manager)
+        shutdown = create_shutdown(p_sv)
+        LauncherApp.launch(p_sv)
+        time.sleep(0.5)
+        shutdown.value = True
+        LauncherApp.join()
+        frame_stats = LauncherApp.get_frame_stats()
+        unlink_shared_memory_objects(p_sv)
+
+    # Async thread apps are not threads.
+    assert LauncherApp.threads == []
+    assert len(LauncherApp.async_futures) == 3
+
+    apps = LauncherApp.child_apps
+    assert apps["Periodic0"].thread_names == apps["Periodic1"].thread_names == {EVENT_LOOP_THREAD_NAME}
+    # Updates of both apps overlap on the event loop.
+    for name in ["Launcher.Periodic0", "Launcher.Periodic1"]:
+        assert 12 >= frame_stats[name]["frames"] >= 8
+    assert apps["ShutdownWaiter"].shutdown_waited
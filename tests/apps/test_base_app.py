@@ -5,12 +5,12 @@ import timeit
 
 from JarvisEngine.apps import base_app
 from JarvisEngine.apps.launcher import to_project_config
-from JarvisEngine.constants import DEFAULT_ENGINE_CONFIG_FILE
-from JarvisEngine.core import logging_tool
+from JarvisEngine.constants import DEFAULT_ENGINE_CONFIG_FILE, METRICS_NAME
+from JarvisEngine.core import logging_tool, metrics
 
 # prepare
 from JarvisEngine.core.config_tools import dict2attr, read_json, read_toml
-from JarvisEngine.core.value_sharing import FolderDictWithLock
+from JarvisEngine.core.value_sharing import FolderDictWithLock, SharedArray
 
 PROJECT_DIR = "TestEngineProject"
 sys.path.insert(0, os.path.join(os.getcwd(), PROJECT_DIR))
@@ -19,9 +19,9 @@ TEST_CONFIG_FILE_PATH = os.path.join(PROJECT_DIR, "config.json")
 project_config = dict2attr(read_json(TEST_CONFIG_FILE_PATH))
 project_config = to_project_config(project_config)
 
-engine_config = read_toml(DEFAULT_ENGINE_CONFIG_FILE)
-engine_config["logging"]["log_level"] = "DEBUG"
-engine_config = dict2attr(engine_config)
+user_engine_config = read_toml(DEFAULT_ENGINE_CONFIG_FILE)
+user_engine_config["logging"]["log_level"] = "DEBUG"
+engine_config = dict2attr(user_engine_config)
 
 
 def _cd_project_dir(func):
@@ -310,6 +310,12 @@ def test__get_shared_value():
     assert MainApp._get_shared_value("..Launcher.eee", True) is False
     assert App0._get_shared_value("Launcher.App0.fff", True) == 20
 
+    # SharedArray is returned as numpy array.
+    shared_array = SharedArray(3)
+    App1.addProcessSharedValue("ggg", shared_array)
+    assert App1._get_shared_value(".ggg", False) is shared_array.get_obj()
+    shared_array.unlink()
+
 
 @_cd_project_dir
 def test_getProcessSharedValue():
@@ -355,6 +361,165 @@ def test_getThreadSharedValue():
     assert App0.getThreadSharedValue("Launcher.App0.fff") == 20
 
 
+@_cd_project_dir
+def test_bind_shared_values():
+    name = "Launcher"
+    config = project_config.Launcher
+    app_dir = PROJECT_DIR
+    MainApp = base_app.BaseApp(name, config, engine_config, project_config, app_dir)
+    fdwl_thread = FolderDictWithLock(sep=".")
+    fdwl_process = FolderDictWithLock(sep=".")
+    MainApp.set_process_shared_values_to_all_apps(fdwl_process)
+    MainApp.set_thread_shared_values_to_all_apps(fdwl_thread)
+
+    App1 = MainApp.child_apps["App1"]
+    MainApp.addProcessSharedValue("aaa", 10)
+    App1.addProcessSharedValue("bbb", "apple")
+    MainApp.addThreadSharedValue("ccc", 20)
+
+    MainApp.bindProcessSharedValue("aaa", ".aaa")
+    MainApp.bindProcessSharedValue("bbb", "Launcher.App1.bbb")
+    MainApp._bind_shared_value("ccc", ".ccc", True)
+    MainApp.bindThreadSharedValue("ddd", ".ddd")
+    assert not hasattr(MainApp, "aaa")
+
+    MainApp.resolve_shared_value_bindings()
+    assert getattr(MainApp, "aaa") == 10
+    assert getattr(MainApp, "bbb") == "apple"
+    assert getattr(MainApp, "ccc") == 20
+    assert getattr(MainApp, "ddd") is None
+
+
+@_cd_project_dir
+def test_metrics():
+    MainApp = base_app.BaseApp("Launcher", project_config.Launcher, engine_config, project_config, PROJECT_DIR)
+    # process local metrics before Process Shared Values are set.
+    local_counter = MainApp.getCounter("items_total")
+    assert not local_counter.is_shared
+    assert MainApp.getCounter("items_total") is local_counter
+    local_counter.inc(5)
+
+    registry = metrics.MetricsRegistry(MainApp.get_all_app_names(), slots_per_app=4)
+    try:
+        p_sv = FolderDictWithLock(sep=".")
+        p_sv[METRICS_NAME] = registry
+        MainApp.set_process_shared_values_to_all_apps(p_sv)
+        # bound to the registry with the recorded value.
+        assert local_counter.is_shared
+        local_counter.inc()
+        App1 = MainApp.child_apps["App1"]
+        counter = App1.getCounter("items_total")
+        assert counter.is_shared
+        assert App1.getCounter("items_total") is counter
+        counter.inc(2)
+        App1.getHistogram(metrics.UPDATE_SECONDS).observe(0.01)
+        App1.record_log_metrics()
+
+        values = {(m.labels["app"], m.name): m for m in registry.read_all()}
+        assert values[("Launcher.App1", "items_total")].value == 2
+        assert values[("Launcher.App1", metrics.UPDATE_SECONDS)].value == 1
+        assert values[("Launcher.App1", metrics.LOG_DROPPED_RECORDS)].value == 0
+        assert values[("Launcher", "items_total")].value == 6
+
+        # the kind conflicts.
+        try:
+            App1.getGauge("items_total")
+            raise AssertionError
+        except ValueError:
+            pass
+        try:
+            MainApp.getCounter(metrics.UPDATE_SECONDS)
+            raise AssertionError
+        except ValueError:
+            pass
+    finally:
+        registry.unlink()
+
+
+def test_get_scheduling_settings():
+    config = base_app.AttrDict({"path": "JarvisEngine.apps.BaseApp", "thread": True, "nice": 5})
+    app = base_app.BaseApp("App", config, engine_config, project_config)
+    assert app.get_scheduling_settings() == {
+        "cpu_affinity": [],
+        "nice": 5,
+        "sched_policy": "inherit",
+        "sched_priority": 0,
+    }
+
+
+def test_expand_replicas():
+    config = base_app.AttrDict({"path": "App.app.App", "thread": False})
+    assert base_app.BaseApp.expand_replicas("App", config) == [("App", config)]
+
+    config.replicas = 2
+    replicas = base_app.BaseApp.expand_replicas("App", config)
+    assert [name for name, _ in replicas] == ["App_0", "App_1"]
+    for i, (_, conf) in enumerate(replicas):
+        assert conf.path == "App.app.App"
+        assert conf.replica_index == i
+        assert conf.replicas == 2
+    assert not hasattr(config, "replica_index")
+
+    config.replicas = "auto"
+    assert len(base_app.BaseApp.expand_replicas("App", config)) == os.cpu_count()
+
+    for invalid in [0, -1, 1.5, "many"]:
+        config.replicas = invalid
+        try:
+            base_app.BaseApp.expand_replicas("App", config)
+            raise AssertionError
+        except ValueError:
+            pass
+
+
+def test_get_construct_in_child():
+    f = base_app.BaseApp.get_construct_in_child
+    config = base_app.AttrDict({"path": "App.app.App", "thread": False})
+    assert f(config, engine_config) is False
+    ec = base_app.AttrDict(engine_config)
+    ec.multiprocessing = base_app.AttrDict(engine_config.multiprocessing)
+    ec.multiprocessing.construct_in_child = True
+    assert f(config, ec) is True
+    config.construct_in_child = False
+    assert f(config, ec) is False
+    config.construct_in_child = True
+    assert f(config, engine_config) is True
+    config.thread = True
+    assert f(config, engine_config) is False
+
+
+def test_get_log_level():
+    f = base_app.BaseApp.get_log_level
+    config = base_app.AttrDict({"path": "App.app.App", "thread": True})
+    assert f(config) is None
+    config.log_level = "WARNING"
+    assert f(config) == "WARNING"
+
+
+@_cd_project_dir
+def test_logger_settings_of_app_config():
+    config = base_app.AttrDict(project_config.Launcher.apps.App0)
+    config.log_level = "WARNING"
+    config.rate_limit = 50
+    config.sample_repeats = 10
+    app = base_app.BaseApp("Launcher.App0", config, engine_config, project_config)
+    assert app.logger.level == logging_tool.logging.WARNING
+    assert app.logger.limit_args == (50.0, engine_config.logging.rate_burst, 10)
+
+
+@_cd_project_dir
+def test_get_all_app_names():
+    MainApp = base_app.BaseApp("Launcher", project_config.Launcher, engine_config, project_config, PROJECT_DIR)
+    assert MainApp.get_all_app_names() == [
+        "Launcher",
+        "Launcher.App0",
+        "Launcher.App1",
+        "Launcher.App1.App1_1",
+        "Launcher.App1.App1_2",
+    ]
+    assert MainApp.frame_stats.frames == 0
+
+
 @_cd_project_dir
 def test_prepare_for_launching_thread_apps():
     name = "Launcher"
@@ -365,6 +530,7 @@ def test_prepare_for_launching_thread_apps():
 
     t_sv = MainApp.thread_shared_values
     assert isinstance(t_sv, FolderDictWithLock)
+    assert t_sv.is_frozen
     assert t_sv["Launcher.App0.set_obj"] == {"number"}
     assert t_sv["Launcher.App1.range_obj"] is None
 
@@ -384,8 +550,27 @@ def test_adjust_frame_rate():
     MainApp = base_app.BaseApp(name, config, engine_config, project_config, app_dir)
 
     assert MainApp.frame_rate == 0.0
+    assert MainApp.overrun_policy == "skip"
     assert MainApp._update_start_time == float("-inf")
 
     MainApp.frame_rate = 10
     MainApp.adjust_update_frame_rate()
     assert 9 < 1 / timeit.timeit("MainApp.adjust_update_frame_rate()", globals=locals(), number=5) * 5 < 11
+    assert MainApp.frame_scheduler.late_frames == 0
+
+
+def test_get_spin_threshold():
+    name = "Launcher"
+    config = project_config.Launcher
+    MainApp = base_app.BaseApp(name, config, engine_config, project_config, PROJECT_DIR)
+
+    assert MainApp.precise_timing is None
+    assert MainApp.spin_threshold is None
+    assert MainApp.get_spin_threshold() == 0.0  # engine default is not precise.
+
+    MainApp.precise_timing = True
+    assert MainApp.get_spin_threshold() == engine_config.timing.spin_threshold
+    MainApp.spin_threshold = 0.001
+    assert MainApp.get_spin_threshold() == 0.001
+    MainApp.precise_timing = False
+    assert MainApp.get_spin_threshold() == 0.0
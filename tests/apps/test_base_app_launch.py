@@ -11,10 +11,11 @@ from attr_dict import AttrDict
 
 from JarvisEngine.apps.base_app import BaseApp
 from JarvisEngine.apps.launcher import Launcher
-from JarvisEngine.constants import SHUTDOWN_NAME
+from JarvisEngine.constants import SHUTDOWN_NAME, STARTUP_PROFILER_NAME
+from JarvisEngine.core import startup_profiler
 from JarvisEngine.core.logging_tool import getLoggingServer
-from JarvisEngine.core.value_sharing import FolderDictWithLock
-from JarvisEngine.engine.run_project import create_shutdown
+from JarvisEngine.core.value_sharing import FolderDictWithLock, unlink_shared_memory_objects
+from JarvisEngine.engine.run_project import create_shutdown, create_startup_profiler
 
 from .test_base_app import PROJECT_DIR
 from .test_base_app import engine_config as src_ec
@@ -46,6 +47,7 @@ def test_launch(caplog):
         p_sv = LauncherApp.prepare_for_launching(sync_manager)
         shutdown = create_shutdown(p_sv)
         LauncherApp.launch(p_sv)
+        assert p_sv.is_frozen
         time.sleep(0.1)
 
         # launch_child_apps
@@ -66,6 +68,22 @@ def test_launch(caplog):
         shutdown.value = True
         LauncherApp.join()
 
+        # frame stats
+        frame_stats = LauncherApp.get_frame_stats()
+        assert set(frame_stats) == set(LauncherApp.get_all_app_names())
+        assert frame_stats["Launcher.App0"]["frames"] == 1
+        assert 6 >= frame_stats["Launcher.App1"]["frames"] >= 4
+        assert 11 >= frame_stats["Launcher.App1.App1_1"]["frames"] >= 9
+        assert 0 < frame_stats["Launcher.App1.App1_1"]["fps"] < 12
+
+        # metrics
+        values = {(m.name, m.labels.get("app")): m for m in LauncherApp.get_metrics()}
+        for app_name, stats in frame_stats.items():
+            assert values[("jarvis_frames_total", app_name)].value == stats["frames"]
+            assert values[("jarvis_update_seconds", app_name)].value == stats["frames"]
+            assert ("jarvis_log_dropped_records_total", app_name) in values
+        unlink_shared_memory_objects(p_sv)
+
         # join_child_apps
         for t in threads:
             assert not t.is_alive()
@@ -83,6 +101,11 @@ def test_launch(caplog):
         assert ("Launcher.App1.App1_1", INFO, "launch") in rec_tup
         assert ("Launcher.App1.App1_2", INFO, "launch") in rec_tup
 
+        # apply_scheduling_settings
+        scheduling_logs = {(n, lv) for n, lv, msg in rec_tup if msg.startswith("scheduling: cpu_affinity=")}
+        for app_name in LauncherApp.get_all_app_names():
+            assert (app_name, INFO) in scheduling_logs
+
         # Awake
         assert ("Launcher.App0", INFO, "Awake") in rec_tup
         assert ("Launcher.App1", INFO, "Awake") in rec_tup
@@ -139,3 +162,61 @@ def test_launch(caplog):
 
     for record in caplog.records:
         assert record.levelno < WARNING, record.message
+
+
+def test_launch_with_startup_profiler():
+    config = project_config.Launcher
+    with cd_project_dir(), mp.Manager() as sync_manager:
+        profiler = create_startup_profiler()
+        try:
+            LauncherApp = Launcher(config.apps, engine_config, PROJECT_DIR)
+            p_sv = LauncherApp.prepare_for_launching(sync_manager)
+            p_sv[STARTUP_PROFILER_NAME] = profiler
+            shutdown = create_shutdown(p_sv)
+            LauncherApp.launch(p_sv)
+            time.sleep(0.5)
+            shutdown.value = True
+            LauncherApp.join()
+            unlink_shared_memory_objects(p_sv)
+        finally:
+            profiler.stop()
+            startup_profiler.enable(None)
+
+    times = profiler.get_phase_times()
+    assert set(times) == set(LauncherApp.get_all_app_names())
+    for name in ["Launcher.App0", "Launcher.App1", "Launcher.App1.App1_1", "Launcher.App1.App1_2"]:
+        assert startup_profiler.IMPORT_APP in times[name]
+        assert startup_profiler.INIT in times[name]
+        assert startup_profiler.AWAKE in times[name]
+        assert startup_profiler.FIRST_UPDATE in times[name]
+    assert startup_profiler.REGISTER_PROCESS_SHARED_VALUES in times["Launcher"]
+    assert startup_profiler.SPAWN in times["Launcher.App1"]
+    assert startup_profiler.SPAWN in times["Launcher.App1.App1_2"]
+    assert startup_profiler.REGISTER_THREAD_SHARED_VALUES in times["Launcher.App1.App1_1"]
+
+    # events of child processes are collected.
+    (event,) = [e for e in profiler.events if e.app_name == "Launcher.App1.App1_1" and e.phase == "first_Update"]
+    assert event.pid != os.getpid()
+    assert set(profiler.get_ready_times()) == set(times)
+
+
+def test_launch_with_buffered_logger(caplog):
+    buffered_ec = copy.deepcopy(engine_config)
+    buffered_ec.logging.buffered = True
+    buffered_ec.logging.flush_interval = 10.0  # sent at the end of apps.
+    config = project_config.Launcher
+    with cd_project_dir(), mp.Manager() as sync_manager:
+        LauncherApp = Launcher(config.apps, buffered_ec, PROJECT_DIR)
+        p_sv = LauncherApp.prepare_for_launching(sync_manager)
+        shutdown = create_shutdown(p_sv)
+        LauncherApp.launch(p_sv)
+        time.sleep(0.3)
+        shutdown.value = True
+        LauncherApp.join()
+        unlink_shared_memory_objects(p_sv)
+
+    time.sleep(0.1)
+    rec_tup = caplog.record_tuples
+    for app_name in LauncherApp.get_all_app_names():
+        assert (app_name, INFO, "launch") in rec_tup
+        assert (app_name, DEBUG, "terminate") in rec_tup
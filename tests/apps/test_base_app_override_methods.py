@@ -10,7 +10,7 @@ from attr_dict import AttrDict
 
 from JarvisEngine.apps import base_app
 from JarvisEngine.core.logging_tool import getLoggingServer
-from JarvisEngine.core.value_sharing import FolderDictWithLock
+from JarvisEngine.core.value_sharing import FolderDictWithLock, SharedArray, unlink_shared_memory_objects
 
 from .test_base_app import PROJECT_DIR
 from .test_base_app import engine_config as src_ec
@@ -58,6 +58,10 @@ def test_RegisterProcessSharedValues():
         assert fdwl["Launcher.App1.App1_2.float_value"] == 0.0
         assert fdwl["Launcher.App1.App1_1.str_value"] == "apple"
         assert fdwl["Launcher.App0.bool_value"] is True
+        shared_array = fdwl["Launcher.App1.shared_array"]
+        assert isinstance(shared_array, SharedArray)
+        assert shared_array.get_obj().tolist() == [1, 2, 3]
+        unlink_shared_memory_objects(fdwl)
 
 
 def test_RegisterThreadSharedValues():
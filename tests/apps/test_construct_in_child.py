@@ -0,0 +1,117 @@
+import copy
+import multiprocessing as mp
+import os
+import time
+
+import numpy as np
+from attr_dict import AttrDict
+
+from JarvisEngine.apps import BaseApp, Launcher
+from JarvisEngine.core.config_tools import dict2attr
+from JarvisEngine.core.logging_tool import getLoggingServer
+from JarvisEngine.core.value_sharing import SharedArray, unlink_shared_memory_objects
+from JarvisEngine.engine.run_project import create_shutdown
+
+from .test_base_app import engine_config as src_ec
+
+engine_config: AttrDict = copy.deepcopy(src_ec)
+engine_config.logging.port = 20228
+ls = getLoggingServer(engine_config.logging)
+ls.start()
+
+
+class RecordingApp(BaseApp):
+    """Records the pid where `Init` was called."""
+
+    def Init(self):
+        self.init_pid = os.getpid()
+
+    def RegisterProcessSharedValues(self, sync_manager):
+        super().RegisterProcessSharedValues(sync_manager)
+        self.addProcessSharedValue("init_pid", SharedArray((1,), np.int64))
+
+    def Start(self):
+        self.getProcessSharedValue(".init_pid")[0] = self.init_pid
+
+
+config = dict2attr(
+    {
+        "Deferred": {
+            "path": f"{__name__}.RecordingApp",
+            "thread": False,
+            "construct_in_child": True,
+            "apps": {"Child": {"path": f"{__name__}.RecordingApp", "thread": True}},
+        },
+        "Eager": {"path": f"{__name__}.RecordingApp", "thread": False},
+    }
+)
+
+
+def test_skip_init():
+    LauncherApp = Launcher(config, engine_config, ".")
+    deferred = LauncherApp.child_apps["Deferred"]
+    assert deferred.construct_in_child
+    assert deferred.init_skipped
+    assert not hasattr(deferred, "init_pid")
+    assert deferred.child_apps["Child"].init_skipped
+    assert not hasattr(deferred.child_apps["Child"], "init_pid")
+
+    eager = LauncherApp.child_apps["Eager"]
+    assert not eager.construct_in_child
+    assert not eager.init_skipped
+    assert eager.init_pid == os.getpid()
+
+    spec = deferred.get_launch_spec()
+    assert spec["name"] == "Launcher.Deferred"
+    assert spec["config"] == config.Deferred
+    assert spec["app_dir"] == deferred.app_dir
+    assert "project_config" not in spec  # only the config of the subtree.
+
+
+class InitDependentApp(BaseApp):
+    def Init(self):
+        self.shape = (2, 3)
+
+    def RegisterProcessSharedValues(self, sync_manager):
+        super().RegisterProcessSharedValues(sync_manager)
+        self.addProcessSharedValue("array", SharedArray(self.shape, np.float64))
+
+
+def test_register_before_init():
+    init_dependent_config = dict2attr(
+        {"Deferred": {"path": f"{__name__}.InitDependentApp", "thread": False, "construct_in_child": True}}
+    )
+    LauncherApp = Launcher(init_dependent_config, engine_config, ".")
+    with mp.Manager() as sync_manager:
+        try:
+            LauncherApp.prepare_for_launching(sync_manager)
+            raise AssertionError
+        except AttributeError as e:
+            assert "construct_in_child" in str(e)
+        finally:
+            unlink_shared_memory_objects(LauncherApp.process_shared_values)
+
+
+def test_launch_constructed_in_child():
+    LauncherApp = Launcher(config, engine_config, ".")
+    with mp.Manager() as sync_manager:
+        p_sv = LauncherApp.prepare_for_launching(sync_manager)
+        shutdown = create_shutdown(p_sv)
+        LauncherApp.launch(p_sv)
+        time.sleep(0.5)
+        deferred_pid = LauncherApp.processes[0].pid
+        eager_pid = LauncherApp.processes[1].pid
+        init_pids = {}
+        for name in ["Deferred", "Deferred.Child", "Eager"]:
+            init_pid = p_sv[f"Launcher.{name}.init_pid"]
+            assert isinstance(init_pid, SharedArray)
+            init_pids[name] = int(init_pid.get_obj()[0])
+        shutdown.value = True
+        LauncherApp.join()
+        unlink_shared_memory_objects(p_sv)
+
+    # Init of deferred subtree runs in its own process, Init of others runs in parent.
+    assert init_pids["Deferred"] == deferred_pid
+    assert init_pids["Deferred.Child"] == deferred_pid
+    assert init_pids["Eager"] == os.getpid()
+    assert eager_pid != os.getpid()
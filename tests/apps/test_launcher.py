@@ -5,8 +5,12 @@ import os
 from attr_dict import AttrDict
 
 from JarvisEngine.apps import launcher
+from JarvisEngine.constants import FRAME_STATS_NAME, METRICS_NAME
 from JarvisEngine.core import logging_tool
 from JarvisEngine.core.config_tools import dict2attr, read_json
+from JarvisEngine.core.frame_stats import FrameStatsTable
+from JarvisEngine.core.metrics import MetricsRegistry
+from JarvisEngine.core.value_sharing import unlink_shared_memory_objects
 
 from .test_base_app import TEST_CONFIG_FILE_PATH, _cd_project_dir, engine_config
 
@@ -56,3 +60,11 @@ def test_prepare_for_launching():
         assert p_sv["Launcher.App1.App1_2.float_value"] == 0.0
         assert p_sv["Launcher.App1.App1_1.str_value"] == "apple"
         assert p_sv["Launcher.App0.bool_value"] is True
+        stats_table = p_sv[FRAME_STATS_NAME]
+        assert isinstance(stats_table, FrameStatsTable)
+        assert stats_table.app_names == tuple(lnchr.get_all_app_names())
+        registry = p_sv[METRICS_NAME]
+        assert isinstance(registry, MetricsRegistry)
+        assert registry.app_names == tuple(lnchr.get_all_app_names())
+        assert lnchr.get_metrics() == []  # not launched.
+        unlink_shared_memory_objects(p_sv)
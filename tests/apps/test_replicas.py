@@ -0,0 +1,99 @@
+import copy
+import multiprocessing as mp
+import time
+
+import numpy as np
+from attr_dict import AttrDict
+
+from JarvisEngine.apps import BaseApp, Launcher
+from JarvisEngine.core.config_tools import dict2attr
+from JarvisEngine.core.logging_tool import getLoggingServer
+from JarvisEngine.core.value_sharing import ShardedChannel, unlink_shared_memory_objects
+from JarvisEngine.engine.run_project import create_shutdown
+
+from .test_base_app import engine_config as src_ec
+
+engine_config: AttrDict = copy.deepcopy(src_ec)
+engine_config.logging.port = 20227
+ls = getLoggingServer(engine_config.logging)
+ls.start()
+
+NUM_REPLICAS = 3
+NUM_RECORDS = 30
+
+
+class SourceApp(BaseApp):
+    def RegisterProcessSharedValues(self, sync_manager):
+        super().RegisterProcessSharedValues(sync_manager)
+        self.addProcessSharedValue("inputs", ShardedChannel(NUM_REPLICAS, NUM_RECORDS))
+        self.addProcessSharedValue("outputs", ShardedChannel(NUM_REPLICAS, NUM_RECORDS, (2,)))
+
+    def Update(self, delta_time):
+        inputs = self.getProcessSharedValue(".inputs")
+        for i in range(NUM_RECORDS):
+            inputs.put(i, key=i)
+
+
+class WorkerApp(BaseApp):
+    frame_rate = 100.0
+
+    def Start(self):
+        self.inputs = self.getProcessSharedValue("..Source.inputs").shard(self.replica_index)
+        self.outputs = self.getProcessSharedValue("..Source.outputs").shard(self.replica_index)
+
+    def Update(self, delta_time):
+        for value in self.inputs.get_many():
+            self.outputs.put((value * value, self.replica_index))
+
+
+class SinkApp(BaseApp):
+    frame_rate = 100.0
+
+    def Init(self):
+        self.results = []
+
+    def Start(self):
+        self.outputs = self.getProcessSharedValue("..Source.outputs")
+
+    def Update(self, delta_time):
+        self.results.extend(self.outputs.get_many().tolist())
+
+
+config = dict2attr(
+    {
+        "Source": {"path": f"{__name__}.SourceApp", "thread": True},
+        "Worker": {"path": f"{__name__}.WorkerApp", "thread": False, "replicas": NUM_REPLICAS},
+        "Sink": {"path": f"{__name__}.SinkApp", "thread": True},
+    }
+)
+
+
+def test_construct_replicas():
+    LauncherApp = Launcher(config, engine_config, ".")
+    assert list(LauncherApp.child_apps) == ["Source", "Worker_0", "Worker_1", "Worker_2", "Sink"]
+    assert list(LauncherApp.child_process_apps) == ["Worker_0", "Worker_1", "Worker_2"]
+    for i in range(NUM_REPLICAS):
+        worker = LauncherApp.child_apps[f"Worker_{i}"]
+        assert isinstance(worker, WorkerApp)
+        assert worker.name == f"Launcher.Worker_{i}"
+        assert worker.replica_index == i
+        assert worker.num_replicas == NUM_REPLICAS
+    assert LauncherApp.child_apps["Sink"].num_replicas == 1
+    assert LauncherApp.child_apps["Sink"].replica_index == 0
+
+
+def test_launch_replicas():
+    LauncherApp = Launcher(config, engine_config, ".")
+    with mp.Manager() as sync_manager:
+        p_sv = LauncherApp.prepare_for_launching(sync_manager)
+        shutdown = create_shutdown(p_sv)
+        LauncherApp.launch(p_sv)
+        time.sleep(1.0)
+        shutdown.value = True
+        LauncherApp.join()
+        unlink_shared_memory_objects(p_sv)
+
+    results = LauncherApp.child_apps["Sink"].results
+    assert sorted(v for v, _ in results) == [i * i for i in range(NUM_RECORDS)]
+    for value, replica_index in results:
+        assert int(np.sqrt(value)) % NUM_REPLICAS == replica_index  # sharded by key.
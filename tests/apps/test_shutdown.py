@@ -0,0 +1,57 @@
+import copy
+import multiprocessing as mp
+import time
+
+from attr_dict import AttrDict
+
+from JarvisEngine.apps import AsyncBaseApp, BaseApp, Launcher
+from JarvisEngine.core.config_tools import dict2attr
+from JarvisEngine.core.logging_tool import getLoggingServer
+from JarvisEngine.core.value_sharing import unlink_shared_memory_objects
+from JarvisEngine.engine.run_project import create_shutdown
+
+from .test_base_app import engine_config as src_ec
+
+engine_config: AttrDict = copy.deepcopy(src_ec)
+engine_config.logging.port = 20226
+ls = getLoggingServer(engine_config.logging)
+ls.start()
+
+
+class SlowApp(BaseApp):
+    frame_rate = 0.1  # sleeps 10 seconds.
+
+
+class AsyncSlowApp(AsyncBaseApp):
+    frame_rate = 0.1
+
+
+config = dict2attr(
+    {
+        "Thread": {
+            "path": f"{__name__}.SlowApp",
+            "thread": True,
+            "apps": {"Async": {"path": f"{__name__}.AsyncSlowApp", "thread": True}},
+        },
+        "Process": {
+            "path": f"{__name__}.SlowApp",
+            "thread": False,
+            "apps": {"Thread": {"path": f"{__name__}.SlowApp", "thread": True}},
+        },
+    }
+)
+
+
+def test_shutdown_interrupts_sleeping():
+    LauncherApp = Launcher(config, engine_config, ".")
+    with mp.Manager() as sync_manager:
+        p_sv = LauncherApp.prepare_for_launching(sync_manager)
+        shutdown = create_shutdown(p_sv)
+        LauncherApp.launch(p_sv)
+        time.sleep(0.5)
+
+        start = time.perf_counter()
+        shutdown.value = True
+        LauncherApp.join()
+        assert time.perf_counter() - start < 1.0  # not 10 seconds.
+        unlink_shared_memory_objects(p_sv)
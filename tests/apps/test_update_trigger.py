@@ -0,0 +1,155 @@
+import asyncio
+import copy
+import multiprocessing as mp
+import threading
+import time
+
+import numpy as np
+from attr_dict import AttrDict
+
+from JarvisEngine.apps import AsyncBaseApp, BaseApp, Launcher
+from JarvisEngine.constants import SHUTDOWN_NAME
+from JarvisEngine.core.config_tools import dict2attr
+from JarvisEngine.core.logging_tool import getLoggingServer
+from JarvisEngine.core.value_sharing import (
+    FolderDictWithLock,
+    SeqLockValue,
+    Trigger,
+    notify_triggers,
+    unlink_shared_memory_objects,
+)
+from JarvisEngine.engine.run_project import create_shutdown
+
+from .test_base_app import engine_config as src_ec
+
+engine_config: AttrDict = copy.deepcopy(src_ec)
+engine_config.logging.port = 20225
+ls = getLoggingServer(engine_config.logging)
+ls.start()
+
+
+class ProducerApp(BaseApp):
+    frame_rate = 20.0
+
+    def RegisterProcessSharedValues(self, sync_manager):
+        super().RegisterProcessSharedValues(sync_manager)
+        self.addProcessSharedValue("published_time", SeqLockValue(np.float64, 0.0, trigger=Trigger()))
+
+    def Start(self):
+        self.published_time = self.getProcessSharedValue(".published_time")
+
+    def Update(self, delta_time):
+        self.published_time.value = time.perf_counter()
+
+
+class ConsumerApp(BaseApp):
+    update_trigger = "..Producer.published_time"
+
+    def Init(self):
+        self.latencies = []
+
+    def Start(self):
+        self.published_time = self.getProcessSharedValue("..Producer.published_time")
+        self.version = 0
+
+    def Update(self, delta_time):
+        if self.published_time.changed_since(self.version):
+            published_time, self.version = self.published_time.read()
+            self.latencies.append(time.perf_counter() - published_time)
+
+
+class AsyncConsumerApp(ConsumerApp, AsyncBaseApp):
+    async def UpdateAsync(self, delta_time):
+        ConsumerApp.Update(self, delta_time)
+
+
+config = dict2attr(
+    {
+        "Producer": {"path": f"{__name__}.ProducerApp", "thread": True},
+        "Consumer": {"path": f"{__name__}.ConsumerApp", "thread": True},
+        "AsyncConsumer": {"path": f"{__name__}.AsyncConsumerApp", "thread": True},
+    }
+)
+
+
+def test_update_trigger():
+    LauncherApp = Launcher(config, engine_config, ".")
+    with mp.Manager() as sync_manager:
+        p_sv = LauncherApp.prepare_for_launching(sync_manager)
+        shutdown = create_shutdown(p_sv)
+        LauncherApp.launch(p_sv)
+        time.sleep(0.5)
+        shutdown.value = True
+        notify_triggers(p_sv)
+        LauncherApp.join()
+        unlink_shared_memory_objects(p_sv)
+
+    for name in ["Consumer", "AsyncConsumer"]:
+        latencies = LauncherApp.child_apps[name].latencies
+        assert 12 >= len(latencies) >= 8
+        assert np.median(latencies) < 0.01  # woken up by publishing, not polling.
+
+
+def test_get_update_trigger():
+    LauncherApp = Launcher(config, engine_config, ".")
+    assert LauncherApp.get_update_trigger() is None
+
+
+class _ShutdownWhileChecking:
+    """Shutdown flag which is set and notifies the trigger just after the first check."""
+
+    name = "shutdown_while_checking"
+
+    def __init__(self, trigger: Trigger) -> None:
+        self.trigger = trigger
+        self.checked = False
+
+    def wait(self, timeout: float = None) -> bool:
+        return threading.Event().wait(timeout)  # never set, like without notification.
+
+    @property
+    def value(self) -> bool:
+        if self.checked:
+            return True
+        self.checked = True
+        self.trigger.notify()
+        return False
+
+
+class WaitingApp(BaseApp):
+    update_trigger = "trigger"
+    trigger_timeout = None
+
+    def Update(self, delta_time):
+        pass
+
+
+class AsyncWaitingApp(WaitingApp, AsyncBaseApp):
+    pass  # `UpdateAsync` calls `Update`.
+
+
+def test_shutdown_during_update_trigger():
+    config = dict2attr(
+        {
+            "Waiting": {"path": f"{__name__}.WaitingApp", "thread": True},
+            "AsyncWaiting": {"path": f"{__name__}.AsyncWaitingApp", "thread": True},
+        }
+    )
+    LauncherApp = Launcher(config, engine_config, ".")
+    for name, run in [
+        ("Waiting", lambda app: app.periodic_update()),
+        ("AsyncWaiting", lambda app: asyncio.run(app.periodic_update_async())),
+    ]:
+        app = LauncherApp.child_apps[name]
+        trigger = Trigger()
+        try:
+            p_sv = FolderDictWithLock(sep=".")
+            p_sv["trigger"] = trigger
+            p_sv[SHUTDOWN_NAME] = _ShutdownWhileChecking(trigger)
+            app.process_shared_values = p_sv
+            thread = threading.Thread(target=run, args=(app,), daemon=True)
+            thread.start()
+            thread.join(5.0)
+            assert not thread.is_alive(), name  # not waiting for the notification forever.
+        finally:
+            trigger.unlink()
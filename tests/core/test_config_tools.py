@@ -1,3 +1,4 @@
+import os
 from typing import Dict, Union
 
 from JarvisEngine.core import config_tools
@@ -72,3 +73,98 @@ def test_deep_update():
     overrides = {"hello": {"value": 2}}
     config_tools.deep_update(source, overrides)
     assert source == {"hello": {"value": 2, "no_change": 1}}
+
+
+def test_read_json_fast_path(monkeypatch):
+    # plain json is not parsed by json5.
+    monkeypatch.setattr(config_tools.json5, "loads", None)
+    conf = config_tools.read_json("tests/core/test_config.json")
+    assert conf["name"] == "kazuya"
+
+
+def _write_json(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_read_project_config_include(tmp_path):
+    config_file = _write_json(
+        tmp_path / "config.json",
+        '{"App0": {"path": "App0.App", "thread": true}, "App1": {"include": "App1/config.json", "thread": false}}',
+    )
+    _write_json(
+        tmp_path / "App1" / "config.json",
+        # json5 and nested include relative to App1 directory.
+        '{path: "App1.App", thread: true, apps: {App1_1: {include: ["sub.json"]}}, filter: {include: "cats"}}',
+    )
+    _write_json(tmp_path / "App1" / "sub.json", '{"path": "App1.sub.App", "thread": true}')
+
+    conf = config_tools.read_project_config(config_file)
+    assert conf == {
+        "App0": {"path": "App0.App", "thread": True},
+        "App1": {
+            "path": "App1.App",
+            "thread": False,  # overrides included value.
+            "apps": {"App1_1": {"path": "App1.sub.App", "thread": True}},
+            "filter": {"include": "cats"},  # not an app config.
+        },
+    }
+
+    _write_json(tmp_path / "App1" / "sub.json", '{"include": "../config.json"}')
+    try:
+        config_tools.read_project_config(config_file)
+        raise AssertionError
+    except ValueError:
+        pass
+
+
+def test_config_cache(tmp_path, monkeypatch):
+    cache = config_tools.ConfigCache(str(tmp_path / "cache"))
+    config_file = _write_json(tmp_path / "config.json", '{"App": {"include": "App/config.json"}}')
+    app_config_file = _write_json(tmp_path / "App" / "config.json", '{"path": "App.App", "thread": true}')
+
+    parsed = []
+    read_json = config_tools.read_json
+
+    def counting_read_json(path):
+        parsed.append(path)
+        return read_json(path)
+
+    monkeypatch.setattr(config_tools, "read_json", counting_read_json)
+
+    conf = config_tools.read_project_config(config_file, cache)
+    assert conf == {"App": {"path": "App.App", "thread": True}}
+    assert len(parsed) == 2
+
+    # cache hit
+    parsed.clear()
+    assert config_tools.read_project_config(config_file, cache) == conf
+    assert parsed == []
+
+    # only changed file is parsed again.
+    _write_json(tmp_path / "App" / "config.json", '{"path": "App.App", "thread": false}')
+    conf = config_tools.read_project_config(config_file, cache)
+    assert conf == {"App": {"path": "App.App", "thread": False}}
+    assert parsed == [os.path.abspath(app_config_file)]
+
+    # broken cache files are ignored.
+    for name in os.listdir(cache.cache_dir):
+        (tmp_path / "cache" / name).write_bytes(b"broken")
+    assert config_tools.read_project_config(config_file, cache) == conf
+
+
+def test_read_engine_config(tmp_path):
+    default_file = tmp_path / "default.toml"
+    default_file.write_text('[logging]\nhost = "127.0.0.1"\nport = 8316\n')
+    user_file = tmp_path / "user.toml"
+    user_file.write_text("[logging]\nport = 1234\n")
+    cache = config_tools.ConfigCache(str(tmp_path / "cache"))
+
+    for _ in range(2):  # miss and hit
+        conf = config_tools.read_engine_config(str(user_file), str(default_file), cache)
+        assert conf == {"logging": {"host": "127.0.0.1", "port": 1234}}
+
+    user_file.write_text("[logging]\nport = 12345\n")
+    conf = config_tools.read_engine_config(str(user_file), str(default_file), cache)
+    assert conf["logging"]["port"] == 12345
@@ -0,0 +1,34 @@
+import asyncio
+import multiprocessing as mp
+import threading
+from typing import *
+
+from JarvisEngine.core import event_loop
+
+
+def test_get_process_event_loop():
+    loop = event_loop.get_process_event_loop()
+    assert loop.is_running()
+    assert event_loop.get_process_event_loop() is loop
+
+    async def thread_name():
+        return threading.current_thread().name
+
+    future = asyncio.run_coroutine_threadsafe(thread_name(), loop)
+    assert future.result(timeout=1.0) == event_loop.EVENT_LOOP_THREAD_NAME
+
+
+def _put_loop_id(queue):
+    loop = event_loop.get_process_event_loop()
+    queue.put((id(loop), loop.is_running()))
+
+
+def test_get_process_event_loop_in_child_process():
+    loop = event_loop.get_process_event_loop()
+    queue: "mp.Queue[Tuple[int, bool]]" = mp.Queue()
+    p = mp.Process(target=_put_loop_id, args=(queue,))
+    p.start()
+    loop_id, is_running = queue.get(timeout=5.0)
+    p.join()
+    assert is_running
+    assert loop_id != id(loop) or mp.get_start_method() != "fork"
@@ -0,0 +1,116 @@
+from JarvisEngine.core import frame_scheduler
+from JarvisEngine.core.frame_scheduler import CATCH_UP, REPHASE, SKIP, FrameScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, sec):
+        self.sleeps.append(sec)
+        self.now += sec
+
+
+class TickingClock(FakeClock):
+    def __call__(self):
+        self.now += 0.0001  # time goes while spinning.
+        return self.now
+
+
+def _scheduler():
+    clock = FakeClock()
+    return FrameScheduler(clock, clock.sleep), clock
+
+
+def test_OVERRUN_POLICIES():
+    assert frame_scheduler.OVERRUN_POLICIES == ("catch_up", "skip", "rephase")
+
+
+def test_reset():
+    fs, clock = _scheduler()
+    assert fs.start_time == float("-inf")
+    assert fs.late_frames == 0
+    assert fs.skipped_frames == 0
+    fs.reset(1.0)
+    assert fs.start_time == 1.0
+
+
+def test_wait():
+    fs, clock = _scheduler()
+    fs.wait(0.1)  # first call returns immediately.
+    assert clock.sleeps == []
+
+    for i in range(1, 11):
+        clock.now += 0.03  # Update
+        fs.wait(0.1)
+        assert abs(clock.now - 0.1 * i) < 1e-9  # no drift.
+    assert fs.late_frames == 0
+
+
+def test_sleep_until_spin():
+    clock = TickingClock()
+    fs = FrameScheduler(clock, clock.sleep, spin_threshold=0.002)
+    fs.sleep_until(0.1)
+    assert len(clock.sleeps) == 1
+    assert abs(clock.sleeps[0] - 0.098) < 1e-3  # coarse sleep.
+    assert 0.1 <= clock.now < 0.1 + 1e-3  # spin.
+
+    clock.sleeps.clear()
+    fs.sleep_until(clock.now + 0.001)  # shorter than threshold, spin only.
+    assert clock.sleeps == []
+
+
+def test_sleep_until_interrupted():
+    clock = TickingClock()
+
+    def interrupted_sleep(sec):
+        clock.sleeps.append(sec)
+        return True
+
+    fs = FrameScheduler(clock, interrupted_sleep, spin_threshold=0.002)
+    fs.sleep_until(0.1)
+    assert len(clock.sleeps) == 1
+    assert clock.now < 0.01  # does not spin.
+
+
+def test_catch_up():
+    fs, clock = _scheduler()
+    fs.reset(0.0)
+    clock.now = 0.35  # 3 frames late.
+    for deadline in [0.1, 0.2, 0.3, 0.4]:
+        assert abs(fs.next_deadline(0.1, CATCH_UP) - deadline) < 1e-9
+    assert fs.late_frames == 3
+    assert fs.skipped_frames == 0
+
+
+def test_skip():
+    fs, clock = _scheduler()
+    fs.reset(0.0)
+    clock.now = 0.35
+    assert abs(fs.next_deadline(0.1, SKIP) - 0.4) < 1e-9
+    assert fs.late_frames == 1
+    assert fs.skipped_frames == 3
+
+
+def test_rephase():
+    fs, clock = _scheduler()
+    fs.reset(0.0)
+    clock.now = 0.35
+    assert fs.next_deadline(0.1, REPHASE) == 0.35
+    assert abs(fs.next_deadline(0.1, REPHASE) - 0.45) < 1e-9
+    assert fs.late_frames == 1
+
+
+def test_unknown_policy():
+    fs, clock = _scheduler()
+    fs.reset(0.0)
+    clock.now = 1.0
+    try:
+        fs.next_deadline(0.1, "unknown")
+        raise AssertionError
+    except ValueError:
+        pass
@@ -0,0 +1,56 @@
+import pickle
+
+from JarvisEngine.core.frame_stats import FIELDS, FrameStatsRecorder, FrameStatsTable
+
+
+def test_FIELDS():
+    assert FIELDS == (
+        "frames",
+        "update_time",
+        "mean_update_time",
+        "max_update_time",
+        "mean_sleep_time",
+        "fps",
+        "late_frames",
+        "skipped_frames",
+    )
+
+
+def test_recorder():
+    recorder = FrameStatsRecorder(window=4)
+    assert recorder.stats() == (0.0,) * len(FIELDS)
+    assert recorder.summary() == "no frames."
+
+    for update_time in [0.4, 0.1, 0.1, 0.1, 0.1, 0.1]:
+        recorder.record(update_time, 0.5 - update_time, 0.5)
+
+    stats = dict(zip(FIELDS, recorder.stats(late_frames=2, skipped_frames=1)))
+    assert stats["frames"] == 6
+    assert stats["update_time"] == 0.1
+    assert abs(stats["mean_update_time"] - 0.1) < 1e-9  # only latest 4 frames.
+    assert stats["max_update_time"] == 0.4
+    assert abs(stats["mean_sleep_time"] - 0.4) < 1e-9
+    assert abs(stats["fps"] - 2.0) < 1e-9
+    assert stats["late_frames"] == 2
+    assert stats["skipped_frames"] == 1
+    assert recorder.summary().startswith("6 frames, 2.0 fps")
+
+
+def test_table():
+    table = FrameStatsTable(["Launcher", "Launcher.App"])
+    try:
+        assert table.app_names == ("Launcher", "Launcher.App")
+        assert table.index("Launcher.App") == 1
+        assert table.read("Launcher") == dict.fromkeys(FIELDS, 0.0)
+
+        stats = tuple(range(len(FIELDS)))
+        table.write("Launcher.App", stats)
+        attached = pickle.loads(pickle.dumps(table))
+        assert tuple(attached.read("Launcher.App").values()) == stats
+
+        attached.write(0, stats)
+        all_stats = table.read_all()
+        assert list(all_stats) == ["Launcher", "Launcher.App"]
+        assert tuple(all_stats["Launcher"].values()) == stats
+    finally:
+        table.unlink()
@@ -0,0 +1,104 @@
+import logging
+import logging.handlers
+import pickle
+import struct
+import threading
+import time
+
+from JarvisEngine.core.log_buffer import FLUSH_THREAD_NAME, BufferedHandler
+
+
+class RecordingSocketHandler(logging.handlers.SocketHandler):
+    """Records sent batches instead of sending."""
+
+    def __init__(self):
+        super().__init__("127.0.0.1", 0)
+        self.batches = []
+        self.sent = threading.Event()
+
+    def send(self, s):
+        self.batches.append(s)
+        self.sent.set()
+
+    def records(self):
+        records = []
+        for batch in self.batches:
+            while batch:
+                (length,) = struct.unpack(">L", batch[:4])
+                records.append(logging.makeLogRecord(pickle.loads(batch[4 : 4 + length])))
+                batch = batch[4 + length :]
+        return records
+
+
+def make_logger(name, handler):
+    logger = logging.Logger(name, logging.DEBUG)
+    logger.addHandler(handler)
+    return logger
+
+
+def test_flush_in_batch():
+    target = RecordingSocketHandler()
+    handler = BufferedHandler(target, capacity=100, flush_size=100, flush_interval=10.0)
+    logger = make_logger("app", handler)
+    for i in range(10):
+        logger.info("value %d", i)
+    assert target.batches == []  # not sent at log calls.
+
+    handler.flush()
+    assert len(target.batches) == 1
+    assert [r.getMessage() for r in target.records()] == [f"value {i}" for i in range(10)]
+    handler.close()
+
+
+def test_flush_thread():
+    # by size
+    target = RecordingSocketHandler()
+    handler = BufferedHandler(target, capacity=100, flush_size=5, flush_interval=10.0)
+    logger = make_logger("app", handler)
+    for i in range(5):
+        logger.info("value %d", i)
+    assert target.sent.wait(1.0)
+    assert handler._thread.name == FLUSH_THREAD_NAME
+    assert len(target.records()) == 5
+    handler.close()
+    assert not handler._thread.is_alive()
+
+    # by interval
+    target = RecordingSocketHandler()
+    handler = BufferedHandler(target, capacity=100, flush_size=100, flush_interval=0.05)
+    logger = make_logger("app", handler)
+    logger.info("hello")
+    start = time.perf_counter()
+    assert target.sent.wait(1.0)
+    assert time.perf_counter() - start < 0.5
+    assert target.records()[0].getMessage() == "hello"
+
+    # close sends remaining records.
+    handler.flush_interval = 10.0
+    time.sleep(0.1)
+    logger.info("last")
+    handler.close()
+    assert target.records()[-1].getMessage() == "last"
+
+
+def test_overflow():
+    target = RecordingSocketHandler()
+    handler = BufferedHandler(target, capacity=3, flush_size=100, flush_interval=10.0)
+    logger = make_logger("app", handler)
+    for i in range(3):
+        logger.info("value %d", i)
+    for _ in range(4):
+        logger.info("value %d", 2)  # coalesced into the last record.
+    logger.info("value %d", 3)  # dropped.
+    logger.info("other")  # dropped.
+    assert handler.dropped_records == 2
+
+    handler.flush()
+    messages = [(r.levelno, r.getMessage()) for r in target.records()]
+    assert messages == [
+        (logging.INFO, "value 0"),
+        (logging.INFO, "value 1"),
+        (logging.INFO, "value 2 (repeated 5 times)"),
+        (logging.WARNING, "2 log records were dropped because the log buffer was full."),
+    ]
+    handler.close()
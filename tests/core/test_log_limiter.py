@@ -0,0 +1,67 @@
+import logging
+
+from JarvisEngine.core import log_limiter
+from JarvisEngine.core.log_limiter import LogLimiter
+
+
+def make_record(msg, level=logging.INFO, *args):
+    return logging.LogRecord("App", level, __file__, 0, msg, args, None)
+
+
+def test_sampling():
+    limiter = LogLimiter(sample_repeats=3)
+    allowed = [limiter.allow(make_record("frame %d", logging.INFO, i)) for i in range(7)]
+    assert allowed == [True, False, False, True, False, False, True]
+
+    # other messages and levels are not repeats.
+    assert limiter.allow(make_record("other"))
+    assert limiter.allow(make_record("frame %d", logging.INFO, 0))
+    assert limiter.allow(make_record("frame %d", logging.WARNING, 0))
+
+    summary = limiter.take_summary("App")
+    assert summary.name == "App"
+    assert summary.levelno == logging.WARNING
+    assert summary.getMessage() == "4 log records were suppressed (0 by the rate limit, 4 by sampling)."
+    assert limiter.suppressed_records == 4
+    assert limiter.take_summary("App") is None
+
+    # disabled
+    limiter = LogLimiter(sample_repeats=1)
+    assert all(limiter.allow(make_record("msg")) for _ in range(10))
+
+
+def test_rate_limit(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(log_limiter.time, "monotonic", lambda: now[0])
+    limiter = LogLimiter(rate_limit=10.0, rate_burst=5)
+
+    # bursts of `rate_burst` records.
+    assert [limiter.allow(make_record(f"msg {i}")) for i in range(7)] == [True] * 5 + [False] * 2
+
+    # 10 records per second.
+    now[0] += 0.25
+    assert [limiter.allow(make_record(f"msg {i}")) for i in range(4)] == [True, True, False, False]
+
+    # refilled up to `rate_burst`.
+    now[0] += 10.0
+    assert sum(limiter.allow(make_record(f"msg {i}")) for i in range(10)) == 5
+
+    summary = limiter.take_summary("App")
+    assert summary.getMessage() == "9 log records were suppressed (9 by the rate limit, 0 by sampling)."
+
+
+def test_append_summary():
+    limiter = LogLimiter(sample_repeats=2)
+    record = make_record("frame %d", logging.INFO, 0)
+    assert limiter.allow(record)
+    limiter.append_summary(record)
+    assert record.getMessage() == "frame 0"  # nothing was suppressed.
+
+    assert not limiter.allow(make_record("frame %d", logging.INFO, 1))
+    record = make_record("frame %d", logging.INFO, 2)
+    assert limiter.allow(record)
+    limiter.append_summary(record)
+    assert record.getMessage() == "frame 2 [1 log records were suppressed (0 by the rate limit, 1 by sampling).]"
+    assert record.levelno == logging.INFO
+    assert limiter.suppressed_records == 1
+    assert limiter.take_summary("App") is None
@@ -0,0 +1,102 @@
+import logging
+import threading
+import time
+
+from JarvisEngine.constants import DEFAULT_ENGINE_CONFIG_FILE
+from JarvisEngine.core import logging_tool
+from JarvisEngine.core.config_tools import dict2attr, read_toml
+from JarvisEngine.core.log_server import (
+    BLOCK,
+    DROP,
+    OVERFLOW_POLICIES,
+    SERVER_PROCESS_NAME,
+    LoggingServerProcess,
+    QueueingLogServer,
+)
+
+HOST = "127.0.0.1"
+PORT = 20229
+
+
+def test_OVERFLOW_POLICIES():
+    assert OVERFLOW_POLICIES == ("block", "drop")
+
+
+def _record_dict(msg):
+    return logging.makeLogRecord({"name": "test_log_server", "msg": msg, "levelno": logging.DEBUG}).__dict__
+
+
+def test_queueing_server_overflow():
+    try:
+        QueueingLogServer(HOST, 0, overflow="invalid")
+        raise AssertionError
+    except ValueError:
+        pass
+
+    # drop
+    server = QueueingLogServer(HOST, 0, queue_size=2, overflow=DROP)
+    for i in range(5):
+        server.put(_record_dict(i))
+    assert server.queue.qsize() == 2
+    assert server.dropped_records == 3
+    server.server_close()
+
+    # block
+    server = QueueingLogServer(HOST, 0, queue_size=2, overflow=BLOCK)
+    server.put(_record_dict(0))
+    server.put(_record_dict(1))
+    putter = threading.Thread(target=server.put, args=(_record_dict(2),))
+    putter.start()
+    time.sleep(0.1)
+    assert putter.is_alive()  # waiting for the space.
+    server.queue.get()
+    putter.join(1.0)
+    assert not putter.is_alive()
+    assert server.dropped_records == 0
+    server.server_close()
+
+
+def test_queueing_server_handles_records(caplog):
+    server = QueueingLogServer(HOST, 0, overflow=DROP)
+    server.start_writer()
+    serve_thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+    serve_thread.start()
+
+    port = server.server_address[1]
+    with caplog.at_level(logging.DEBUG):
+        logger = logging_tool.Logger("test_log_server.app", logging.DEBUG, HOST, port)
+        for i in range(100):
+            logger.info("record %d", i)
+        logging_tool.closeProcessHandlers()
+        server.stop()
+        serve_thread.join()
+
+    messages = [r.getMessage() for r in caplog.records if r.name == "test_log_server.app"]
+    assert messages == [f"record {i}" for i in range(100)]
+    assert server.handled_records == 100
+
+
+def test_logging_server_process():
+    engine_config = read_toml(DEFAULT_ENGINE_CONFIG_FILE)
+    engine_config["logging"].update(log_level="DEBUG", port=PORT, server="process", server_queue_size=1000)
+    log_conf = dict2attr(engine_config).logging
+
+    server = logging_tool.getLoggingServer(log_conf)
+    assert isinstance(server, LoggingServerProcess)
+    assert server.server_address == (HOST, PORT)
+    server.start()
+    assert server._process.name == SERVER_PROCESS_NAME
+
+    logger = logging_tool.Logger("test_log_server.process", logging.DEBUG, HOST, PORT, (1000, 10, 0.01))
+    for i in range(500):
+        logger.debug("record %d", i)
+    logging_tool.closeProcessHandlers()
+    server.shutdown()  # all records are handled before stopping.
+    assert server.handled_records == 500
+    assert server.dropped_records == 0
+
+    try:
+        LoggingServerProcess(HOST, PORT, overflow="invalid")
+        raise AssertionError
+    except ValueError:
+        pass
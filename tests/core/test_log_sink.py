@@ -0,0 +1,134 @@
+import logging
+import os
+
+from JarvisEngine.core.log_sink import (
+    FILE_SUFFIX,
+    INDEX_SUFFIX,
+    MAGIC,
+    BinaryLogHandler,
+    _read_index,
+    log_files,
+    read_entries,
+)
+
+
+def make_record(name, level, msg, created, *args, **extras):
+    record = logging.LogRecord(name, level, __file__, 0, msg, args, None)
+    record.created = created
+    record.__dict__.update(extras)
+    return record
+
+
+def write_records(handler, records):
+    for record in records:
+        handler.handle(record)
+    handler.close()
+
+
+def test_write_and_read(tmp_path):
+    handler = BinaryLogHandler(str(tmp_path), flush_interval=60.0)
+    write_records(
+        handler,
+        [
+            make_record("Launcher.App0", logging.INFO, "frame %d", 100.0, 1),
+            make_record("Launcher.App0.Sub", logging.DEBUG, "position", 101.0, frame=2, position=[1, 2]),
+            make_record("Launcher.App1", logging.ERROR, "failed", 102.0),
+        ],
+    )
+    files = log_files(str(tmp_path))
+    assert len(files) == 1 and files[0].endswith(FILE_SUFFIX)
+    with open(files[0], "rb") as f:
+        assert f.read(len(MAGIC)) == MAGIC
+    assert os.path.exists(files[0] + INDEX_SUFFIX)
+
+    entries = list(read_entries(str(tmp_path)))
+    assert [e.name for e in entries] == ["Launcher.App0", "Launcher.App0.Sub", "Launcher.App1"]
+    assert entries[0].message == "frame 1"
+    assert entries[0].created == 100.0
+    assert entries[0].levelname == "INFO"
+    assert entries[0].extras == {}
+    assert entries[1].extras == {"frame": 2, "position": [1, 2]}
+
+    record = entries[1].to_record()
+    assert record.getMessage() == "position"
+    assert record.levelno == logging.DEBUG
+    assert getattr(record, "frame") == 2
+
+    # filters
+    names = lambda **kwds: [e.name for e in read_entries(str(tmp_path), **kwds)]
+    assert names(apps=["Launcher.App0"]) == ["Launcher.App0", "Launcher.App0.Sub"]
+    assert names(apps=["*.App1"]) == ["Launcher.App1"]
+    assert names(level=logging.INFO) == ["Launcher.App0", "Launcher.App1"]
+    assert names(since=100.5) == ["Launcher.App0.Sub", "Launcher.App1"]
+    assert names(since=100.5, until=101.5) == ["Launcher.App0.Sub"]
+
+
+def test_exception(tmp_path):
+    handler = BinaryLogHandler(str(tmp_path))
+    logger = logging.Logger("App", logging.DEBUG)
+    logger.addHandler(handler)
+    try:
+        raise ValueError("broken")
+    except ValueError:
+        logger.exception("error")
+    handler.close()
+
+    (entry,) = read_entries(str(tmp_path))
+    assert entry.message.startswith("error\nTraceback")
+    assert "ValueError: broken" in entry.message
+
+
+def test_index(tmp_path):
+    # a block per record.
+    handler = BinaryLogHandler(str(tmp_path), buffer_size=1)
+    write_records(handler, [make_record("App", logging.DEBUG + i, "msg", float(i)) for i in range(10)])
+    (file_path,) = log_files(str(tmp_path))
+    index = _read_index(file_path)
+    assert len(index) == 10
+    assert index[3][:2] == (3.0, 3.0)
+    assert index[3][4] == logging.DEBUG + 3
+    assert index[0][2] == len(MAGIC)
+
+    # blocks are skipped by the index.
+    assert [e.created for e in read_entries(file_path, since=3.0, until=5.0)] == [3.0, 4.0, 5.0]
+    assert [e.created for e in read_entries(file_path, level=logging.DEBUG + 8)] == [8.0, 9.0]
+
+    # scanned without the index.
+    os.truncate(file_path + INDEX_SUFFIX, 0)
+    assert [e.created for e in read_entries(file_path, since=3.0, until=5.0)] == [3.0, 4.0, 5.0]
+
+
+def test_unindexed_and_truncated_records(tmp_path):
+    handler = BinaryLogHandler(str(tmp_path), buffer_size=1)
+    write_records(handler, [make_record("App", logging.INFO, "msg", float(i)) for i in range(5)])
+    (file_path,) = log_files(str(tmp_path))
+    # the writer crashed before writing the index of last 2 blocks, and in the middle of the last record.
+    index_size = os.path.getsize(file_path + INDEX_SUFFIX)
+    os.truncate(file_path + INDEX_SUFFIX, index_size * 3 // 5)
+    os.truncate(file_path, os.path.getsize(file_path) - 1)
+    assert [e.created for e in read_entries(file_path)] == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_rotation(tmp_path):
+    handler = BinaryLogHandler(str(tmp_path), max_bytes=200, buffer_size=1)
+    write_records(handler, [make_record("App", logging.INFO, "x" * 50, float(i)) for i in range(6)])
+    files = log_files(str(tmp_path))
+    assert len(files) > 1
+    for file_path in files:
+        assert os.path.getsize(file_path) <= 200
+    # merged in order of time.
+    assert [e.created for e in read_entries(str(tmp_path))] == [float(i) for i in range(6)]
+
+    handler = BinaryLogHandler(str(tmp_path), rotate_interval=0.0, buffer_size=1, max_files=2)
+    write_records(handler, [make_record("App", logging.INFO, "x" * 300, 10.0 + i) for i in range(3)])
+    assert len(log_files(str(tmp_path))) == 2
+    assert len(os.listdir(str(tmp_path))) == 4  # with index files.
+
+
+def test_buffered_writes(tmp_path):
+    handler = BinaryLogHandler(str(tmp_path), flush_interval=60.0)
+    handler.handle(make_record("App", logging.INFO, "msg", 0.0))
+    assert handler.file_path is None  # not written yet.
+    handler.flush()
+    assert len(list(read_entries(handler.file_path))) == 1
+    handler.close()
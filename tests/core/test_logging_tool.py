@@ -1,4 +1,10 @@
-from JarvisEngine.core import logging_tool
+import logging
+import logging.handlers
+import multiprocessing as mp
+import pickle
+
+from JarvisEngine.core import log_limiter, logging_tool
+from JarvisEngine.core.log_buffer import BufferedHandler
 
 
 def test_MAIN_LOGGER_NAME():
@@ -21,10 +27,189 @@ def test_getAppLogger():
     logger = logging_tool.getAppLogger(name, log_conf)
 
     assert isinstance(logger, logging_tool.Logger)
-    assert logger.level == log_conf.log_level
+    assert logger.level == logging.DEBUG
     assert logger.host == log_conf.host
     assert logger.port == log_conf.port
     assert logger.name == name
+    assert logger.buffer_args is None
+    assert isinstance(logger.process_handler, logging_tool.RecordSocketHandler)
+
+    # overridden by app config.
+    logger = logging_tool.getAppLogger(name, log_conf, "WARNING")
+    assert logger.level == logging.WARNING
+
+    class buffered_log_conf(log_conf):
+        buffered = True
+        buffer_capacity = 10
+        flush_size = 5
+        flush_interval = 0.5
+
+    logger = logging_tool.getAppLogger(name, buffered_log_conf)
+    assert logger.buffer_args == (10, 5, 0.5)
+    handler = logger.process_handler
+    assert isinstance(handler, BufferedHandler)
+    assert handler.capacity == 10
+    assert handler.flush_size == 5
+    assert handler.flush_interval == 0.5
+
+    # pickled with the settings.
+    logger = pickle.loads(pickle.dumps(logger))
+    assert isinstance(logger, logging_tool.Logger)
+    assert logger.name == name
+    assert logger.level == logging.DEBUG
+    assert logger.buffer_args == (10, 5, 0.5)
+
+
+def test_process_handler():
+    # All loggers in a process share one handler for same settings.
+    logger_a = logging_tool.Logger("a", "DEBUG", "127.0.0.1", 9998)
+    logger_b = logging_tool.Logger("b", "INFO", "127.0.0.1", 9998)
+    assert logger_a.process_handler is logger_b.process_handler
+    assert logging_tool.getProcessHandler("127.0.0.1", 9998) is logger_a.process_handler
+    assert logging_tool.getProcessHandler("127.0.0.1", 9997) is not logger_a.process_handler
+    assert logger_a.handlers == []
+
+
+def _check_process_handler(logger, conn):
+    inherited = list(logging_tool._process_handlers.values())
+    conn.send(all(logger.process_handler is not handler for handler in inherited))
+
+
+def test_process_handler_in_child_process():
+    logger = logging_tool.Logger("a", "DEBUG", "127.0.0.1", 9998)
+    logger.process_handler
+    ctx = mp.get_context("fork")
+    parent_conn, child_conn = ctx.Pipe()
+    p = ctx.Process(target=_check_process_handler, args=(logger, child_conn))
+    p.start()
+    assert parent_conn.recv()  # not inherited from the parent process.
+    p.join()
+
+
+def test_callHandlers():
+    records = []
+
+    class ListHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    logger = logging_tool.Logger("a", "INFO", "127.0.0.1", 9996)
+    handler = ListHandler()
+    logger.addHandler(handler)
+    logger.debug("not logged")
+    logger.info("logged")
+    assert [r.getMessage() for r in records] == ["logged"]
+
+
+def test_getLimitArgs():
+    class log_conf:
+        pass
+
+    assert logging_tool.getLimitArgs(log_conf) is None  # disabled by default.
+
+    class limited_log_conf:
+        rate_limit = 100
+        rate_burst = 10
+        sample_repeats = 0
+
+    assert logging_tool.getLimitArgs(limited_log_conf) == (100.0, 10, 0)
+
+    # overridden by app config.
+    class app_conf:
+        rate_limit = 0.0
+        sample_repeats = 5
+
+    assert logging_tool.getLimitArgs(limited_log_conf, app_conf) == (0.0, 10, 5)
+    app_conf.sample_repeats = 1
+    assert logging_tool.getLimitArgs(limited_log_conf, app_conf) is None
+
+
+def test_limited_logger():
+    records = []
+
+    class ListHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    logger = logging_tool.Logger("a", "DEBUG", "127.0.0.1", 9996, limit_args=(0.0, 100, 10))
+    logger.addHandler(ListHandler())
+    for i in range(25):
+        logger.info("frame %d", i)
+    logger.info("done")
+    assert [r.getMessage() for r in records] == [
+        "frame 0",
+        "frame 10 [9 log records were suppressed (0 by the rate limit, 9 by sampling).]",
+        "frame 20 [9 log records were suppressed (0 by the rate limit, 9 by sampling).]",
+        "done [4 log records were suppressed (0 by the rate limit, 4 by sampling).]",
+    ]
+    assert [r.levelno for r in records] == [logging.INFO] * 4
+
+    # reported at flush.
+    records.clear()
+    logger.info("done")
+    logging_tool.flushLogger(logger)
+    assert [r.getMessage() for r in records] == ["1 log records were suppressed (0 by the rate limit, 1 by sampling)."]
+    assert logger.limiter.suppressed_records == 23
+
+    logger = pickle.loads(pickle.dumps(logger))
+    assert logger.limit_args == (0.0, 100, 10)
+    assert logger.limiter.suppressed_records == 0
+
+
+def test_rate_limited_logger(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(log_limiter.time, "monotonic", lambda: now[0])
+    records = []
+
+    class ListHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    logger = logging_tool.Logger("a", "DEBUG", "127.0.0.1", 9996, limit_args=(10.0, 1, 0))
+    logger.addHandler(ListHandler())
+    for _ in range(1000):
+        now[0] += 0.001
+        logger.debug("flood")
+    # summaries do not cost records over the rate limit.
+    assert len(records) == 10
+    assert all(r.levelno == logging.DEBUG for r in records)
+
+
+def test_setLevel():
+    logger = logging_tool.Logger("a", "INFO", "127.0.0.1", 9996)
+    assert not logger.isEnabledFor(logging.DEBUG)
+    logger.setLevel("DEBUG")
+    assert logger.isEnabledFor(logging.DEBUG)  # level cache is cleared.
+
+
+def test_RecordSocketHandler():
+    handler = logging_tool.RecordSocketHandler("127.0.0.1", 9996)
+
+    def sent(msg, *args):
+        record = logging.LogRecord("a", logging.INFO, __file__, 0, msg, args, None)
+        return logging.makeLogRecord(pickle.loads(handler.makePickle(record)[4:]))
+
+    # plain args are formatted by the LoggingServer.
+    record = sent("%d frames, %.1f fps, %s", 10, 29.97, "ok")
+    assert record.msg == "%d frames, %.1f fps, %s"
+    assert record.args == (10, 29.97, "ok")
+    assert record.getMessage() == "10 frames, 30.0 fps, ok"
+
+    record = sent("%(name)s", {"name": "App"})
+    assert record.args == {"name": "App"}
+    assert record.getMessage() == "App"
+
+    # the other args are formatted in the app process.
+    class Position:
+        def __str__(self):
+            return "(1, 2)"
+
+    record = sent("position: %s", Position())
+    assert record.msg == "position: (1, 2)"
+    assert record.args is None
+
+    record = sent("no args")
+    assert record.getMessage() == "no args"
 
 
 def test_setRootLoggerComponents():
@@ -51,6 +236,37 @@ def test_setRootLoggerComponents():
     assert sh.formatter.datefmt == log_conf.date_format
 
 
+def test_setRootLoggerComponents_with_sink(tmp_path):
+    from JarvisEngine.constants import DEFAULT_ENGINE_CONFIG_FILE
+    from JarvisEngine.core.config_tools import dict2attr, read_toml
+    from JarvisEngine.core.log_sink import BinaryLogHandler
+
+    config = read_toml(DEFAULT_ENGINE_CONFIG_FILE)
+    config["logging"].update(log_level="DEBUG", console=False, sink_dir=str(tmp_path), sink_max_files=3)
+    log_conf = dict2attr(config).logging
+
+    root_logger = logging.getLogger()
+    num_handlers = len(root_logger.handlers)
+    logging_tool.setRootLoggerComponents(log_conf)
+    try:
+        (handler,) = root_logger.handlers[num_handlers:]
+        assert isinstance(handler, BinaryLogHandler)
+        assert handler.log_dir == str(tmp_path)
+        assert handler.max_bytes == log_conf.sink_max_bytes
+        assert handler.rotate_interval == log_conf.sink_rotate_interval
+        assert handler.buffer_size == log_conf.sink_buffer_size
+        assert handler.flush_interval == log_conf.sink_flush_interval
+        assert handler.max_files == 3
+    finally:
+        for handler in root_logger.handlers[num_handlers:]:
+            root_logger.removeHandler(handler)
+            handler.close()
+
+    # the sink is written by the other process.
+    logging_tool.setRootLoggerComponents(log_conf, sink=False)
+    assert len(root_logger.handlers) == num_handlers
+
+
 def test_getLoggingServer():
     class log_conf:
         host = "127.0.0.1"
@@ -0,0 +1,240 @@
+import multiprocessing as mp
+import pickle
+from typing import *
+
+import numpy as np
+
+from JarvisEngine.core import metrics
+from JarvisEngine.core.metrics import (
+    BUILTIN_METRICS,
+    COUNTER,
+    GAUGE,
+    HISTOGRAM,
+    MetricCounter,
+    MetricGauge,
+    MetricHistogram,
+    MetricsRegistry,
+    MetricValue,
+    create_local_metric,
+    frame_stats_metrics,
+    queue_metrics,
+    render_prometheus,
+)
+from JarvisEngine.core.value_sharing import FolderDictWithLock, LatestValueMailbox, RingBuffer, ShardedChannel
+
+
+def test_check_name():
+    metrics.check_name("jarvis_frames_total")
+    metrics.check_name("app:requests")
+    for name in ["", "1st", "with space", "dash-ed", "a" * 65]:
+        try:
+            metrics.check_name(name)
+            raise AssertionError(name)
+        except ValueError:
+            pass
+
+
+def test_check_buckets():
+    assert metrics.check_buckets([1, 2.5]) == (1.0, 2.5)
+    invalid_buckets: List[List[float]] = [[], [2.0, 1.0], [1.0, 1.0], [float("inf")], [float(i) for i in range(17)]]
+    for buckets in invalid_buckets:
+        try:
+            metrics.check_buckets(buckets)
+            raise AssertionError(buckets)
+        except ValueError:
+            pass
+
+
+def test_local_metrics():
+    counter = create_local_metric(MetricCounter, "items_total")
+    assert isinstance(counter, MetricCounter)
+    assert not counter.is_shared
+    counter.inc()
+    counter.inc(2.5)
+    assert counter.value == 3.5
+    try:
+        counter.inc(-1)
+        raise AssertionError
+    except ValueError:
+        pass
+
+    gauge = create_local_metric(MetricGauge, "clients")
+    assert isinstance(gauge, MetricGauge)
+    gauge.set(10)
+    gauge.inc()
+    gauge.dec(3)
+    assert gauge.value == 8
+
+    histogram = create_local_metric(MetricHistogram, "latency_seconds", [0.1, 1.0])
+    assert isinstance(histogram, MetricHistogram)
+    for value in [0.05, 0.1, 0.5, 2.0, 3.0]:
+        histogram.observe(value)
+    assert histogram.bounds == (0.1, 1.0)
+    assert histogram.buckets == (2, 1, 2)  # 0.1 is counted in the bucket `le=0.1`.
+    assert histogram.count == 5
+    assert histogram.sum == 5.65
+
+    unpickled = pickle.loads(pickle.dumps(histogram))
+    assert unpickled.buckets == (2, 1, 2)
+    unpickled.observe(0.0)
+    assert histogram.count == 5
+
+
+def test_registry():
+    registry = MetricsRegistry(["Launcher", "Launcher.App"], slots_per_app=5)
+    try:
+        assert registry.app_names == ("Launcher", "Launcher.App")
+        # built-in metrics are registered to all apps.
+        assert [m.name for m in registry.read_all()] == [name for _, name, _ in BUILTIN_METRICS] * 2
+
+        counter = registry.get_metric("Launcher.App", MetricCounter, "items_total")
+        assert counter.is_shared
+        counter.inc(3)
+        # the same slot is returned by name.
+        assert registry.get_metric("Launcher.App", MetricCounter, "items_total").value == 3
+        histogram = registry.get_metric("Launcher.App", MetricHistogram, "latency_seconds", [0.1, 1.0])
+        histogram.observe(0.5)
+
+        values = {(m.labels["app"], m.name): m for m in registry.read_all()}
+        items = values[("Launcher.App", "items_total")]
+        assert items == MetricValue("items_total", COUNTER, {"app": "Launcher.App"}, 3)
+        assert ("Launcher", "items_total") not in values
+        latency = values[("Launcher.App", "latency_seconds")]
+        assert latency.bounds == (0.1, 1.0)
+        assert latency.buckets == (0, 1, 0)
+        assert latency.value == 1
+        assert latency.sum == 0.5
+
+        # the kind conflicts.
+        try:
+            registry.get_metric("Launcher.App", MetricGauge, "items_total")
+            raise AssertionError
+        except ValueError:
+            pass
+        # all slots are used.
+        try:
+            registry.get_metric("Launcher.App", MetricGauge, "clients")
+            raise AssertionError
+        except ValueError:
+            pass
+        registry.get_metric("Launcher", MetricGauge, "clients")
+
+        try:
+            MetricsRegistry(["Launcher"], slots_per_app=len(BUILTIN_METRICS) - 1)
+            raise AssertionError
+        except ValueError:
+            pass
+    finally:
+        registry.unlink()
+
+
+def test_bind():
+    registry = MetricsRegistry(["Launcher.App"])
+    try:
+        counter = create_local_metric(MetricCounter, "items_total")
+        counter.inc(2)
+        registry.bind("Launcher.App", counter)
+        assert counter.is_shared
+        counter.inc()
+        assert registry.get_metric("Launcher.App", MetricCounter, "items_total").value == 3
+
+        histogram = create_local_metric(MetricHistogram, "latency_seconds", [0.1, 1.0])
+        histogram.observe(0.5)
+        registry.bind("Launcher.App", histogram)
+        assert registry.get_metric("Launcher.App", MetricHistogram, "latency_seconds").buckets == (0, 1, 0)
+
+        # registered with other buckets.
+        try:
+            registry.bind("Launcher.App", create_local_metric(MetricHistogram, metrics.UPDATE_SECONDS, [1.0]))
+            raise AssertionError
+        except ValueError:
+            pass
+    finally:
+        registry.unlink()
+
+
+def _record(registry: MetricsRegistry, counter: MetricCounter, num: int) -> None:
+    for _ in range(num):
+        counter.inc()
+    registry.get_metric("Launcher.App", MetricHistogram, "latency_seconds").observe(0.01)
+
+
+def test_registry_in_other_process():
+    registry = MetricsRegistry(["Launcher", "Launcher.App"])
+    try:
+        counter = registry.get_metric("Launcher.App", MetricCounter, "items_total")
+        p = mp.Process(target=_record, args=(registry, counter, 1000))
+        p.start()
+        p.join()
+        assert counter.value == 1000
+        values = {m.name: m for m in registry.read_all() if m.labels["app"] == "Launcher.App"}
+        assert values["latency_seconds"].bounds == metrics.DEFAULT_BUCKETS
+        assert values["latency_seconds"].value == 1
+    finally:
+        registry.unlink()
+
+
+def test_frame_stats_metrics():
+    stats = {"frames": 10.0, "late_frames": 2.0, "skipped_frames": 1.0, "fps": 30.0}
+    stats.update(mean_update_time=0.01, max_update_time=0.02, mean_sleep_time=0.02)
+    values = {m.name: m for m in frame_stats_metrics({"Launcher.App": stats})}
+    assert len(values) == len(metrics.FRAME_STATS_METRICS)
+    assert values["jarvis_frames_total"] == MetricValue("jarvis_frames_total", COUNTER, {"app": "Launcher.App"}, 10.0)
+    assert values["jarvis_fps"].kind == GAUGE
+    assert values["jarvis_max_update_seconds"].value == 0.02
+
+
+def test_queue_metrics():
+    p_sv = FolderDictWithLock()
+    rb = RingBuffer(8)
+    channel = ShardedChannel(2, 4)
+    mailbox = LatestValueMailbox()
+    try:
+        p_sv["Launcher.App.queue"] = rb
+        p_sv["Launcher.App.channel"] = channel
+        p_sv["Launcher.App.mailbox"] = mailbox
+        p_sv["Launcher.App.value"] = 1
+        rb.put_many(np.arange(3.0))
+        channel.shard(1).try_put(1.0)
+        mailbox.publish(1.0)
+        mailbox.publish(2.0)
+
+        values = {(m.name, *m.labels.values()): m.value for m in queue_metrics(p_sv)}
+        assert values == {
+            ("jarvis_queue_depth", "Launcher.App.queue"): 3,
+            ("jarvis_queue_capacity", "Launcher.App.queue"): 8,
+            ("jarvis_queue_depth", "Launcher.App.channel", "0"): 0,
+            ("jarvis_queue_capacity", "Launcher.App.channel", "0"): 4,
+            ("jarvis_queue_depth", "Launcher.App.channel", "1"): 1,
+            ("jarvis_queue_capacity", "Launcher.App.channel", "1"): 4,
+            ("jarvis_mailbox_overwritten_total", "Launcher.App.mailbox"): 1,
+            ("jarvis_mailbox_dropped_total", "Launcher.App.mailbox"): 0,
+        }
+    finally:
+        for obj in (rb, channel, mailbox):
+            obj.unlink()
+
+
+def test_render_prometheus():
+    text = render_prometheus(
+        [
+            MetricValue("items_total", COUNTER, {"app": "Launcher.App"}, 3),
+            MetricValue("clients", GAUGE, {}, 0.5),
+            MetricValue("items_total", COUNTER, {"app": 'Launcher."A"'}, 1e20),
+            MetricValue("latency_seconds", HISTOGRAM, {"app": "App"}, 3, (0.1, 1.0), (1, 0, 2), 4.25),
+        ]
+    )
+    assert text == (
+        "# TYPE items_total counter\n"
+        'items_total{app="Launcher.App"} 3\n'
+        'items_total{app="Launcher.\\"A\\""} 1e+20\n'
+        "# TYPE clients gauge\n"
+        "clients 0.5\n"
+        "# TYPE latency_seconds histogram\n"
+        'latency_seconds_bucket{app="App",le="0.1"} 1\n'
+        'latency_seconds_bucket{app="App",le="1"} 1\n'
+        'latency_seconds_bucket{app="App",le="+Inf"} 3\n'
+        'latency_seconds_sum{app="App"} 4.25\n'
+        'latency_seconds_count{app="App"} 3\n'
+    )
+    assert render_prometheus([]) == ""
@@ -0,0 +1,59 @@
+import urllib.error
+import urllib.request
+from typing import *
+
+from JarvisEngine.core.metrics import COUNTER, MetricValue
+from JarvisEngine.core.metrics_exporter import CONTENT_TYPE, MetricsExporter
+
+PORT = 20230
+
+
+def make_collect():
+    calls: List[None] = []
+
+    def collect():
+        calls.append(None)
+        return [MetricValue("scrapes_total", COUNTER, {}, len(calls))]
+
+    return collect
+
+
+def test_disabled():
+    exporter = MetricsExporter(make_collect())
+    assert not exporter.enabled
+    exporter.start()
+    assert exporter.server_address is None
+    exporter.shutdown()
+
+
+def test_http():
+    exporter = MetricsExporter(make_collect(), http_port=PORT)
+    assert exporter.enabled
+    exporter.start()
+    try:
+        assert exporter.server_address == ("127.0.0.1", PORT)
+        with urllib.request.urlopen(f"http://127.0.0.1:{PORT}/metrics") as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert response.read().decode() == "# TYPE scrapes_total counter\nscrapes_total 1\n"
+        with urllib.request.urlopen(f"http://127.0.0.1:{PORT}/metrics") as response:
+            assert response.read().decode().endswith("scrapes_total 2\n")
+
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{PORT}/")
+            raise AssertionError
+        except urllib.error.HTTPError as e:
+            assert e.code == 404
+    finally:
+        exporter.shutdown()
+    assert exporter.server_address is None
+
+
+def test_textfile(tmp_path):
+    textfile = tmp_path / "jarvis.prom"
+    exporter = MetricsExporter(make_collect(), textfile=str(textfile), textfile_interval=0.05)
+    exporter.start()
+    assert textfile.read_text().endswith("scrapes_total 1\n")  # written at the start.
+    exporter.shutdown()
+    # written periodically, and at the shutdown.
+    assert not textfile.read_text().endswith("scrapes_total 1\n")
+    assert list(tmp_path.iterdir()) == [textfile]
@@ -38,3 +38,17 @@ def test_join_relatively():
     assert name.join_relatively("a.", "...d.e.f") == "d.e.f"
     assert name.join_relatively("a.b.c", ".d.e") == "a.b.c.d.e"
     assert name.join_relatively("a", "b") == "a.b"
+
+
+def test_memoized():
+    assert name.CACHE_SIZE > 0
+    name.join.cache_clear()
+    assert name.join("a.b.c", "..d") == "a.b.d"
+    assert name.join("a.b.c", "..d") == "a.b.d"
+    assert name.join.cache_info().hits == 1
+
+
+def test_replica():
+    assert name.REPLICA_SEP == "_"
+    assert name.replica("Worker", 0) == "Worker_0"
+    assert name.replica("a.Worker", 12) == "a.Worker_12"
@@ -0,0 +1,62 @@
+import os
+import threading
+
+from JarvisEngine.core import scheduling
+
+
+def _in_thread(func):
+    """Run func in another thread not to change settings of the test thread."""
+    result = {}
+
+    def run():
+        result["value"] = func()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    return result["value"]
+
+
+def test_SETTING_KEYS():
+    assert scheduling.SETTING_KEYS == ("cpu_affinity", "nice", "sched_policy", "sched_priority")
+    assert scheduling.INHERIT == "inherit"
+
+
+def test_get_settings():
+    settings = scheduling.get_settings()
+    assert settings["cpu_affinity"] == sorted(os.sched_getaffinity(0))
+    assert settings["sched_policy"] == "other"
+    assert settings["sched_priority"] == 0
+
+
+def test_apply_settings():
+    cpu = min(os.sched_getaffinity(0))
+    nice = os.getpriority(os.PRIO_PROCESS, threading.get_native_id()) + 1
+
+    def apply():
+        errors = scheduling.apply_settings(
+            {"cpu_affinity": [cpu], "nice": nice, "sched_policy": "batch", "sched_priority": 0}
+        )
+        return errors, scheduling.get_settings()
+
+    errors, settings = _in_thread(apply)
+    assert errors == {}
+    assert settings == {"cpu_affinity": [cpu], "nice": nice, "sched_policy": "batch", "sched_priority": 0}
+
+    # Settings of the calling thread only.
+    assert scheduling.get_settings()["sched_policy"] == "other"
+
+
+def test_apply_settings_inherit():
+    settings = scheduling.get_settings()
+    inherit = {"cpu_affinity": [], "nice": "inherit", "sched_policy": "inherit", "sched_priority": 0}
+    assert _in_thread(lambda: (scheduling.apply_settings(inherit), scheduling.get_settings())) == ({}, settings)
+
+
+def test_apply_settings_errors():
+    def apply():
+        return scheduling.apply_settings({"nice": "inherit", "sched_policy": "unknown"})
+
+    errors = _in_thread(apply)
+    assert list(errors) == ["sched_policy"]
+    assert isinstance(errors["sched_policy"], ValueError)
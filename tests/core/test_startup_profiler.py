@@ -0,0 +1,121 @@
+import json
+import multiprocessing as mp
+import os
+import time
+
+from JarvisEngine.constants import STARTUP_PROFILER_NAME
+from JarvisEngine.core import startup_profiler
+from JarvisEngine.core.startup_profiler import FIRST_UPDATE, INIT, PHASES, SPAWN, StartupProfiler
+from JarvisEngine.core.value_sharing import FolderDictWithLock
+
+
+def test_PHASES():
+    assert PHASES == (
+        "import_app",
+        "Init",
+        "RegisterProcessSharedValues",
+        "spawn",
+        "Awake",
+        "RegisterThreadSharedValues",
+        "first_Update",
+    )
+
+
+def test_disabled():
+    assert startup_profiler.get_profiler() is None
+    with startup_profiler.measure("App", INIT):
+        pass
+    startup_profiler.record("App", INIT, 0.0)  # do nothing.
+
+
+def test_measure():
+    profiler = StartupProfiler()
+    startup_profiler.enable(profiler)
+    try:
+        assert startup_profiler.get_profiler() is profiler
+        with startup_profiler.measure("App", INIT):
+            time.sleep(0.01)
+        with startup_profiler.measure("App", INIT):
+            time.sleep(0.01)
+        startup_profiler.record("App", FIRST_UPDATE, profiler.origin + 0.5, profiler.origin + 0.6)
+    finally:
+        startup_profiler.enable(None)
+
+    events = profiler.events
+    assert [e.phase for e in events] == [INIT, INIT, FIRST_UPDATE]
+    assert events[0].app_name == "App"
+    assert events[0].pid == os.getpid()
+
+    times = profiler.get_phase_times()
+    assert times["App"][INIT] >= 0.02  # summed.
+    assert abs(times["App"][FIRST_UPDATE] - 0.1) < 1e-6
+    assert abs(profiler.get_ready_times()["App"] - 0.5) < 1e-6
+
+
+def test_enable_shared():
+    profiler = StartupProfiler()
+    p_sv = FolderDictWithLock()
+    startup_profiler.enable_shared(p_sv)  # not registered.
+    assert startup_profiler.get_profiler() is None
+
+    p_sv[STARTUP_PROFILER_NAME] = profiler
+    startup_profiler.enable_shared(p_sv)
+    try:
+        assert startup_profiler.get_profiler() is profiler
+    finally:
+        startup_profiler.enable(None)
+
+
+def _record_in_child(profiler: StartupProfiler) -> None:
+    startup_profiler.enable(profiler)
+    startup_profiler.record("Child", SPAWN, 1.0, 2.0)
+
+
+def test_record_in_child_process():
+    profiler = StartupProfiler()
+    profiler.start()
+    p = mp.Process(target=_record_in_child, args=(profiler,))
+    p.start()
+    p.join()
+    profiler.stop()
+
+    events = profiler.events
+    assert len(events) == 1
+    assert events[0].app_name == "Child"
+    assert events[0].pid == p.pid
+
+
+def test_report():
+    profiler = StartupProfiler()
+    o = profiler.origin
+    profiler.record("Fast", INIT, o, o + 0.001)
+    profiler.record("Fast", FIRST_UPDATE, o + 0.1, o + 0.2)
+    profiler.record("Slow", FIRST_UPDATE, o + 1.0, o + 1.1)
+    profiler.record("Never", INIT, o, o + 0.002)
+
+    lines = profiler.report().splitlines()
+    assert lines[0] == "startup profile [ms]"
+    assert lines[1].split() == ["app", *PHASES, "ready"]
+    assert [line.split()[0] for line in lines[2:]] == ["Slow", "Fast", "Never"]
+    assert lines[2].split()[-1] == "1000.0"
+    assert lines[3].split()[2] == "1.0"
+    assert lines[4].split()[-1] == "-"
+
+
+def test_chrome_trace(tmp_path):
+    profiler = StartupProfiler()
+    o = profiler.origin
+    profiler.record("App", INIT, o + 0.5, o + 0.75)
+
+    trace = profiler.to_chrome_trace()
+    event = trace["traceEvents"][0]
+    assert event["ph"] == "X"
+    assert event["name"] == "Init App"
+    assert abs(event["ts"] - 500000) < 1e-3
+    assert abs(event["dur"] - 250000) < 1e-3
+    assert event["pid"] == os.getpid()
+
+    path = tmp_path / "trace.json"
+    profiler.write_chrome_trace(str(path))
+    with open(path) as f:
+        assert json.load(f) == trace
@@ -1,10 +1,23 @@
 def test_import():
     from JarvisEngine.core.value_sharing import (
         FolderDictWithLock,
+        LatestValueMailbox,
         ReadOnly,
         ReadOnlyArray,
         ReadOnlyError,
+        ReadOnlySeqLockValue,
+        ReadOnlySharedArray,
+        ReadOnlyShutdownFlag,
         ReadOnlyString,
         ReadOnlyValue,
+        RingBuffer,
+        SeqLockValue,
+        ShardedChannel,
+        SharedArray,
+        SharedMemoryObject,
+        ShutdownFlag,
+        Trigger,
         make_read_only,
+        notify_triggers,
+        unlink_shared_memory_objects,
     )
@@ -1,6 +1,7 @@
 import threading
 
 from JarvisEngine.core.value_sharing import folder_dict_with_lock
+from JarvisEngine.core.value_sharing.read_only_objects import ReadOnlyError
 
 
 def test_FolderDictWithLock():
@@ -16,3 +17,26 @@ def test_FolderDictWithLock():
     # Not implemented locking test because I don't know how to test it.
     fdwl["a.b.c"] = 1
     fdwl["a.b.c"]
+
+
+def test_freeze():
+    fdwl = folder_dict_with_lock.FolderDictWithLock(sep=".")
+    fdwl["a.b.c"] = 1
+    fdwl["a.d"] = 2
+    assert not fdwl.is_frozen
+    assert fdwl["x.y"] is None
+
+    fdwl.freeze()
+    assert fdwl.is_frozen
+    assert fdwl["a.b.c"] == 1
+    assert fdwl[".a.d"] == 2
+    assert fdwl["a.b"]["c"] == 1  # folder
+    assert fdwl[["a.b.c", "a.d"]] == [1, 2]
+    assert fdwl[["a.d", "x.y"]] == [2, None]
+    assert fdwl["x.y"] is None  # missing paths are the same as before freezing.
+
+    try:
+        fdwl["a.e"] = 3
+        raise AssertionError
+    except ReadOnlyError:
+        pass
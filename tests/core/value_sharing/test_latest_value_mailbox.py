@@ -0,0 +1,126 @@
+import multiprocessing as mp
+import pickle
+
+import numpy as np
+
+from JarvisEngine.core.value_sharing.latest_value_mailbox import LatestValueMailbox
+from JarvisEngine.core.value_sharing.trigger import Trigger
+
+
+def test_LatestValueMailbox():
+    mb = LatestValueMailbox((2, 2), np.uint8)
+    try:
+        assert mb.shape == (2, 2)
+        assert mb.dtype == np.uint8
+        assert mb.num_slots == 3
+        assert mb.published == 0
+        assert mb.read() == (None, 0)
+        assert not mb.has_new()
+
+        try:
+            LatestValueMailbox(num_slots=2)
+            raise AssertionError
+        except ValueError:
+            pass
+    finally:
+        mb.unlink()
+
+
+def test_publish_read():
+    mb = LatestValueMailbox(3, np.int32)
+    try:
+        assert mb.publish([1, 2, 3]) == 1
+        assert mb.has_new()
+        value, frame = mb.read()
+        assert value.tolist() == [1, 2, 3]
+        assert frame == 1
+        assert not mb.has_new()
+
+        # reading again returns the same value.
+        value, frame = mb.read()
+        assert value.tolist() == [1, 2, 3]
+        assert frame == 1
+        assert mb.dropped == 0
+        assert mb.overwritten == 0
+
+        # newest value only.
+        for i in range(2, 6):
+            mb.publish([i] * 3)
+        value, frame = mb.read()
+        assert value.tolist() == [5, 5, 5]
+        assert frame == 5
+        assert mb.published == 5
+        assert mb.dropped == 3
+        assert mb.overwritten == 3
+        assert mb.last_read_frame == 5
+    finally:
+        mb.unlink()
+
+
+def test_invalid_publish():
+    mb = LatestValueMailbox(3, np.float64)
+    try:
+        mb.publish([1.0, 2.0, 3.0])
+        for _ in range(mb.num_slots):
+            try:
+                mb.publish([1.0, 2.0])
+                raise AssertionError
+            except ValueError:
+                pass
+        assert mb.published == 1
+        for i in range(mb.num_slots + 1):
+            assert mb.publish(float(i)) == i + 2
+            value, frame = mb.read()  # never hangs.
+            assert value.tolist() == [float(i)] * 3
+            assert frame == i + 2
+    finally:
+        mb.unlink()
+
+
+def test_pickle():
+    mb = LatestValueMailbox((), np.float64, num_slots=4)
+    try:
+        unpickled = pickle.loads(pickle.dumps(mb))
+        assert unpickled.num_slots == 4
+        unpickled.publish(1.5)
+        assert mb.read() == (1.5, 1)
+    finally:
+        mb.unlink()
+
+
+def _publish_many(mb: LatestValueMailbox, num: int) -> None:
+    for i in range(1, num + 1):
+        mb.publish(np.full(256, i))
+
+
+def test_no_torn_read():
+    mb = LatestValueMailbox(256, np.int64)
+    try:
+        num = 5000
+        p = mp.Process(target=_publish_many, args=(mb, num))
+        p.start()
+        last_frame = 0
+        while p.is_alive():
+            value, frame = mb.read()
+            if value is not None:
+                assert np.all(value == frame)
+                assert frame >= last_frame
+                last_frame = frame
+        p.join()
+        assert mb.read()[1] == num
+    finally:
+        mb.unlink()
+
+
+def test_trigger():
+    trigger = Trigger()
+    mailbox = LatestValueMailbox(trigger=trigger)
+    try:
+        assert mailbox.trigger is trigger
+        mailbox.publish(1.0)
+        assert trigger.generation == 1
+        mailbox.read()
+        assert trigger.generation == 1
+    finally:
+        mailbox.unlink()
+        trigger.unlink()
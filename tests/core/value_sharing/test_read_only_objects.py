@@ -2,17 +2,22 @@ import ctypes
 import multiprocessing as mp
 from typing import *
 
+import numpy as np
+
 from JarvisEngine.core import value_sharing
 from JarvisEngine.core.value_sharing.read_only_objects import (
     ReadOnly,
     ReadOnlyArray,
     ReadOnlyError,
+    ReadOnlySeqLockValue,
+    ReadOnlySharedArray,
+    ReadOnlyShutdownFlag,
     ReadOnlyString,
     ReadOnlyValue,
 )
 
 
-def assert_modify_value(obj: Union[ReadOnlyValue, ReadOnlyString]):
+def assert_modify_value(obj: Union[ReadOnlyValue, ReadOnlyString, ReadOnlySeqLockValue, ReadOnlyShutdownFlag]):
     try:
         obj.value = None
         raise AssertionError
@@ -94,6 +99,43 @@ def test_ReadOnlyString():
     assert_modify_string(ros0)
 
 
+def test_ReadOnlySeqLockValue():
+    slv = value_sharing.SeqLockValue(np.float64, 1.0)
+    roslv = ReadOnlySeqLockValue(slv)
+    assert roslv.name == slv.name
+    assert roslv.trigger is slv.trigger
+    assert roslv.read() == (1.0, 0)
+
+    slv.value = 2.0
+    assert roslv.value == 2.0
+    assert roslv.changed_since(0)
+    assert_modify_value(roslv)
+    try:
+        roslv.write(3.0)
+        raise AssertionError
+    except ReadOnlyError:
+        pass
+    slv.unlink()
+
+
+def test_ReadOnlyShutdownFlag():
+    shutdown = value_sharing.ShutdownFlag()
+    roshutdown = ReadOnlyShutdownFlag(shutdown)
+    assert roshutdown.name == shutdown.name
+    assert roshutdown.value is False
+    assert_modify_value(roshutdown)
+    try:
+        roshutdown.set()
+        raise AssertionError
+    except ReadOnlyError:
+        pass
+
+    shutdown.set()
+    assert roshutdown.value is True
+    assert roshutdown.wait(0.0)
+    shutdown.unlink()
+
+
 def test_make_read_only():
 
     v = mp.Value("i")
@@ -108,6 +150,21 @@ def test_make_read_only():
     assert isinstance(roa, ReadOnlyArray)
     assert isinstance(ros, ReadOnlyString)
 
+    sa = value_sharing.SharedArray(3, np.int8)
+    rosa = value_sharing.make_read_only(sa)
+    assert isinstance(rosa, ReadOnlySharedArray)
+    assert not rosa.get_obj().flags.writeable
+    sa.unlink()
+
+    slv = value_sharing.SeqLockValue(np.int32, 0)
+    roslv = value_sharing.make_read_only(slv)
+    assert isinstance(roslv, ReadOnlySeqLockValue)
+    slv.unlink()
+
+    shutdown = value_sharing.ShutdownFlag()
+    assert isinstance(value_sharing.make_read_only(shutdown), ReadOnlyShutdownFlag)
+    shutdown.unlink()
+
     try:
         value_sharing.make_read_only(None)
         raise AssertionError
@@ -0,0 +1,119 @@
+import multiprocessing as mp
+import threading
+import time
+
+import numpy as np
+
+from JarvisEngine.core.value_sharing.ring_buffer import RingBuffer
+from JarvisEngine.core.value_sharing.trigger import Trigger
+
+
+def test_RingBuffer():
+    rb = RingBuffer(4, (2,), np.int32)
+    try:
+        assert rb.capacity == 4
+        assert rb.shape == (2,)
+        assert rb.dtype == np.int32
+        assert len(rb) == 0
+        assert rb.empty()
+        assert not rb.full()
+
+        try:
+            RingBuffer(0)
+            raise AssertionError
+        except ValueError:
+            pass
+    finally:
+        rb.unlink()
+
+
+def test_try_put_try_get():
+    rb = RingBuffer(3, (), np.int64)
+    try:
+        assert rb.try_get() is None
+        for i in range(3):
+            assert rb.try_put(i)
+        assert rb.full()
+        assert not rb.try_put(3)
+
+        assert rb.try_get() == 0
+        assert rb.try_put(3)
+        assert [rb.try_get() for _ in range(3)] == [1, 2, 3]
+        assert rb.try_get() is None
+    finally:
+        rb.unlink()
+
+
+def test_put_many_get_many():
+    rb = RingBuffer(5, (2,), np.float32)
+    try:
+        assert rb.put_many(np.arange(6).reshape(3, 2)) == 3
+        assert rb.get_many(2).tolist() == [[0, 1], [2, 3]]
+
+        # wrap around.
+        assert rb.put_many(np.arange(12).reshape(6, 2)) == 4
+        assert len(rb) == 5
+        out = rb.get_many()
+        assert out.shape == (5, 2)
+        assert out.tolist() == [[4, 5], [0, 1], [2, 3], [4, 5], [6, 7]]
+        assert rb.get_many().shape == (0, 2)
+        assert rb.put_many(np.zeros((0, 2))) == 0
+    finally:
+        rb.unlink()
+
+
+def test_blocking():
+    rb = RingBuffer(1, (), np.int8)
+    try:
+        start = time.perf_counter()
+        assert rb.get(timeout=0.05) is None
+        assert time.perf_counter() - start >= 0.05
+
+        assert rb.put(1, timeout=0.05)
+        assert not rb.put(2, timeout=0.05)
+
+        def put_later():
+            time.sleep(0.1)
+            rb.put(2)
+
+        assert rb.get() == 1
+        thread = threading.Thread(target=put_later)
+        thread.start()
+        assert rb.get(timeout=1.0) == 2
+        thread.join()
+    finally:
+        rb.unlink()
+
+
+def _produce(rb: RingBuffer, num: int) -> None:
+    for i in range(num):
+        rb.put(i)
+
+
+def test_between_processes():
+    rb = RingBuffer(8, (), np.int64)
+    try:
+        num = 1000
+        p = mp.Process(target=_produce, args=(rb, num))
+        p.start()
+        received = [int(rb.get(timeout=10.0)) for _ in range(num)]
+        p.join()
+        assert received == list(range(num))
+    finally:
+        rb.unlink()
+
+
+def test_trigger():
+    trigger = Trigger()
+    rb = RingBuffer(4, trigger=trigger)
+    try:
+        assert rb.trigger is trigger
+        rb.try_put(1.0)
+        assert trigger.generation == 1
+        rb.put_many([2.0, 3.0])
+        assert trigger.generation == 2
+        rb.try_get()
+        assert trigger.generation == 2
+    finally:
+        rb.unlink()
+        trigger.unlink()
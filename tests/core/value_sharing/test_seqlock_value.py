@@ -0,0 +1,112 @@
+import multiprocessing as mp
+import pickle
+
+import numpy as np
+
+from JarvisEngine.core.value_sharing.seqlock_value import SeqLockValue
+from JarvisEngine.core.value_sharing.trigger import Trigger
+
+
+def test_SeqLockValue():
+    slv = SeqLockValue(np.int32, 5)
+    try:
+        assert slv.dtype == np.int32
+        assert slv.shape == ()
+        assert slv.value == 5
+        assert isinstance(slv.value, int)
+        assert slv.version == 0
+
+        slv.value = 10
+        assert slv.value == 10
+        assert slv.version == 1
+        slv.write(20)
+        assert slv.read() == (20, 2)
+    finally:
+        slv.unlink()
+
+
+def test_array_value():
+    slv = SeqLockValue(np.float32, np.zeros(3))
+    try:
+        assert slv.shape == (3,)
+        value, version = slv.read()
+        assert value.tolist() == [0.0, 0.0, 0.0]
+
+        slv.value = np.array([1.0, 2.0, 3.0])
+        assert value.tolist() == [0.0, 0.0, 0.0]  # copied.
+        assert slv.value.tolist() == [1.0, 2.0, 3.0]
+    finally:
+        slv.unlink()
+
+
+def test_invalid_write():
+    slv = SeqLockValue(np.float64, np.zeros(3))
+    try:
+        try:
+            slv.write([1.0, 2.0])
+            raise AssertionError
+        except ValueError:
+            pass
+        # the value is still readable.
+        assert slv.read()[0].tolist() == [0.0, 0.0, 0.0]
+        assert slv.version == 0
+        slv.write(1.0)
+        assert slv.read()[0].tolist() == [1.0, 1.0, 1.0]
+    finally:
+        slv.unlink()
+
+
+def test_changed_since():
+    slv = SeqLockValue(np.float64, 0.0)
+    try:
+        _, version = slv.read()
+        assert not slv.changed_since(version)
+        slv.value = 1.0
+        assert slv.changed_since(version)
+        _, version = slv.read()
+        assert not slv.changed_since(version)
+    finally:
+        slv.unlink()
+
+
+def test_pickle():
+    slv = SeqLockValue(np.int64, 1)
+    try:
+        unpickled = pickle.loads(pickle.dumps(slv))
+        unpickled.value = 2
+        assert slv.read() == (2, 1)
+    finally:
+        slv.unlink()
+
+
+def _write_many(slv: SeqLockValue, num: int) -> None:
+    for i in range(1, num + 1):
+        slv.value = np.full(64, i)
+
+
+def test_no_torn_read():
+    slv = SeqLockValue(np.int64, np.zeros(64))
+    try:
+        num = 2000
+        p = mp.Process(target=_write_many, args=(slv, num))
+        p.start()
+        while p.is_alive():
+            value = slv.value
+            assert np.all(value == value[0])
+        p.join()
+        assert slv.read()[1] == num
+    finally:
+        slv.unlink()
+
+
+def test_trigger():
+    trigger = Trigger()
+    slv = SeqLockValue(np.int32, 0, trigger=trigger)
+    try:
+        assert slv.trigger is trigger
+        slv.value = 1
+        slv.write(2)
+        assert trigger.generation == 2
+    finally:
+        slv.unlink()
+        trigger.unlink()
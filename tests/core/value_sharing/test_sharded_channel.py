@@ -0,0 +1,128 @@
+import multiprocessing as mp
+import zlib
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from JarvisEngine.core.value_sharing.ring_buffer import RingBuffer
+from JarvisEngine.core.value_sharing.sharded_channel import ShardedChannel
+from JarvisEngine.core.value_sharing.trigger import Trigger
+
+
+def test_ShardedChannel():
+    channel = ShardedChannel(3, 8, (2,), np.int32)
+    try:
+        assert channel.num_shards == 3
+        assert len(channel.shards) == 3
+        assert isinstance(channel.shard(0), RingBuffer)
+        assert channel.shard(0).capacity == 8
+        assert channel.shard(0).shape == (2,)
+        assert channel.trigger is None
+        assert len(channel) == 0
+
+        try:
+            ShardedChannel(0, 8)
+            raise AssertionError
+        except ValueError:
+            pass
+    finally:
+        channel.unlink()
+
+    for obj in [channel, *channel.shards]:
+        try:
+            shared_memory.SharedMemory(name=obj.name)
+            raise AssertionError
+        except FileNotFoundError:
+            pass
+
+
+def test_scatter():
+    channel = ShardedChannel(3, 8)
+    try:
+        assert [channel.shard_index() for _ in range(4)] == [0, 1, 2, 0]  # round-robin.
+        assert channel.shard_index(7) == 1
+        assert channel.shard_index("user") == zlib.crc32(b"user") % 3
+        assert channel.shard_index(b"user") == channel.shard_index("user")
+
+        for i in range(6):
+            assert channel.try_put(i, key=i)
+        assert channel.put(6.0, key=0, timeout=0.0)
+        assert channel.shard(0).get_many().tolist() == [0.0, 3.0, 6.0]
+        assert channel.shard(1).get_many().tolist() == [1.0, 4.0]
+        assert channel.shard(2).get_many().tolist() == [2.0, 5.0]
+    finally:
+        channel.unlink()
+
+
+def test_gather():
+    trigger = Trigger()
+    channel = ShardedChannel(3, 8, trigger=trigger)
+    try:
+        assert channel.try_get() is None
+        channel.shard(0).put_many([0.0, 1.0])
+        channel.shard(2).try_put(2.0)
+        assert trigger.generation == 2
+
+        assert len(channel) == 3
+        assert channel.try_get() == 0.0
+        assert channel.try_get() == 2.0  # next shard in turn.
+        assert channel.try_get() == 1.0
+        assert channel.try_get() is None
+
+        channel.shard(1).put_many([3.0, 4.0])
+        channel.shard(2).put_many([5.0])
+        assert channel.get_many(2).tolist() == [3.0, 4.0]
+        assert channel.get_many().tolist() == [5.0]
+        assert channel.get_many().shape == (0,)
+    finally:
+        channel.unlink()
+        trigger.unlink()
+
+
+def test_get_many_empty():
+    channel = ShardedChannel(2, 4, (3,), np.float32)
+    try:
+        channel.shard(0).try_put(np.ones(3))
+        records = channel.get_many(0)
+        assert records.shape == (0, 3)
+        assert records.dtype == np.float32
+        assert channel.get_many().shape == (1, 3)
+        assert channel.get_many().shape == (0, 3)
+    finally:
+        channel.unlink()
+
+
+def test_get_many_round_robin():
+    channel = ShardedChannel(3, 8)
+    try:
+        for i in range(3):
+            channel.shard(i).put_many([i * 10.0, i * 10.0 + 1.0])
+        # starts from the next shard on each call.
+        assert channel.get_many(1).tolist() == [0.0]
+        assert channel.get_many(1).tolist() == [10.0]
+        assert channel.get_many(1).tolist() == [20.0]
+        assert channel.get_many(2).tolist() == [1.0, 11.0]
+        assert channel.get_many().tolist() == [21.0]
+    finally:
+        channel.unlink()
+
+
+def _square(inputs, outputs, index):
+    record = inputs.shard(index).get(timeout=5.0)
+    outputs.shard(index).put(record * record, timeout=5.0)
+
+
+def test_between_processes():
+    inputs, outputs = ShardedChannel(2, 4), ShardedChannel(2, 4)
+    try:
+        processes = [mp.Process(target=_square, args=(inputs, outputs, i)) for i in range(2)]
+        for p in processes:
+            p.start()
+        inputs.put(2.0)
+        inputs.put(3.0)
+        for p in processes:
+            p.join()
+        assert sorted(outputs.get_many().tolist()) == [4.0, 9.0]
+    finally:
+        inputs.unlink()
+        outputs.unlink()
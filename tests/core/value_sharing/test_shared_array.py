@@ -0,0 +1,81 @@
+import multiprocessing as mp
+import pickle
+
+import numpy as np
+
+from JarvisEngine.core.value_sharing.shared_array import ReadOnlySharedArray, SharedArray
+from JarvisEngine.core.value_sharing.shared_memory_object import SharedMemoryObject
+
+
+def test_SharedArray():
+    sa = SharedArray((2, 3), np.int32)
+    try:
+        assert isinstance(sa, SharedMemoryObject)
+        assert sa.shape == (2, 3)
+        assert sa.dtype == np.int32
+        array = sa.get_obj()
+        assert isinstance(array, np.ndarray)
+        assert array.shape == (2, 3)
+        assert array.dtype == np.int32
+
+        sa1 = SharedArray(5)
+        assert sa1.shape == (5,)
+        assert sa1.dtype == np.float64
+        sa1.unlink()
+
+        # attach by name.
+        array[:] = 1
+        attached = SharedArray((2, 3), np.int32, sa.name)
+        assert np.all(attached.get_obj() == 1)
+        attached.get_obj()[0, 0] = 10
+        assert array[0, 0] == 10
+    finally:
+        sa.unlink()
+
+
+def test_pickle():
+    sa = SharedArray(4, np.uint8)
+    try:
+        unpickled = pickle.loads(pickle.dumps(sa))
+        assert unpickled.name == sa.name
+        unpickled.get_obj()[:] = 3
+        assert np.all(sa.get_obj() == 3)
+    finally:
+        sa.unlink()
+
+
+def _write_in_child(sa: SharedArray) -> None:
+    sa.get_obj()[:] = np.arange(len(sa.get_obj()))
+
+
+def test_share_between_processes():
+    ctx = mp.get_context("spawn")
+    sa = SharedArray(8, np.int64)
+    try:
+        p = ctx.Process(target=_write_in_child, args=(sa,))
+        p.start()
+        p.join()
+        assert np.all(sa.get_obj() == np.arange(8))
+    finally:
+        sa.unlink()
+
+
+def test_ReadOnlySharedArray():
+    sa = SharedArray(3, np.float32)
+    try:
+        sa.get_obj()[:] = 2.0
+        ro = ReadOnlySharedArray(sa)
+        assert isinstance(ro, SharedArray)
+        assert ro.name == sa.name
+        assert np.all(ro.get_obj() == 2.0)
+        try:
+            ro.get_obj()[0] = 1.0
+            raise AssertionError
+        except ValueError:
+            pass
+
+        unpickled = pickle.loads(pickle.dumps(ro))
+        assert isinstance(unpickled, ReadOnlySharedArray)
+        assert not unpickled.get_obj().flags.writeable
+    finally:
+        sa.unlink()
@@ -0,0 +1,51 @@
+import pickle
+from multiprocessing import shared_memory
+
+from JarvisEngine.core.value_sharing import FolderDictWithLock
+from JarvisEngine.core.value_sharing.shared_memory_object import SharedMemoryObject, unlink_shared_memory_objects
+
+
+class _Bytes(SharedMemoryObject):
+    _shm_views = ("view",)
+    trigger: SharedMemoryObject  # set only in `test_unlink_shared_memory_objects`.
+
+    def _attach(self):
+        self.view = self.buf[:4]
+
+
+def test_SharedMemoryObject():
+    obj = _Bytes(4)
+    try:
+        assert len(obj.buf) >= 4
+        obj.view[0] = 7
+
+        unpickled = pickle.loads(pickle.dumps(obj))
+        assert unpickled.name == obj.name
+        assert unpickled.view[0] == 7
+        assert "view" not in obj.__getstate__()
+    finally:
+        obj.unlink()
+
+    obj.unlink()  # unlinking twice is allowed.
+    try:
+        shared_memory.SharedMemory(name=obj.name)
+        raise AssertionError
+    except FileNotFoundError:
+        pass
+
+
+def test_unlink_shared_memory_objects():
+    fdwl = FolderDictWithLock(sep=".")
+    obj0, obj1 = _Bytes(1), _Bytes(1)
+    obj1.trigger = _Bytes(1)
+    fdwl["a.b"] = obj0
+    fdwl["a.c.d"] = obj1
+    fdwl["e"] = 10
+
+    unlink_shared_memory_objects(fdwl)
+    for obj in [obj0, obj1, obj1.trigger]:
+        try:
+            shared_memory.SharedMemory(name=obj.name)
+            raise AssertionError
+        except FileNotFoundError:
+            pass
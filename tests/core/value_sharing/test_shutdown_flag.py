@@ -0,0 +1,56 @@
+import multiprocessing as mp
+import threading
+import time
+
+from JarvisEngine.core.value_sharing.shutdown_flag import ShutdownFlag
+
+
+def test_ShutdownFlag():
+    shutdown = ShutdownFlag()
+    try:
+        assert shutdown.value is False
+        assert shutdown.is_set() is False
+        assert shutdown.wait(0.01) is False
+        assert shutdown.sleep(0.01) is False
+        try:
+            shutdown.value = False
+            raise AssertionError
+        except ValueError:
+            pass
+
+        shutdown.value = True
+        assert shutdown.value is True
+        assert shutdown.is_set() is True
+        assert shutdown.wait() is True
+    finally:
+        shutdown.unlink()
+
+
+def test_interrupt_sleep():
+    shutdown = ShutdownFlag()
+    try:
+        thread = threading.Timer(0.05, shutdown.set)
+        thread.start()
+        start = time.perf_counter()
+        assert shutdown.sleep(5.0) is True
+        assert time.perf_counter() - start < 1.0
+        thread.join()
+    finally:
+        shutdown.unlink()
+
+
+def _set_later(shutdown):
+    time.sleep(0.05)
+    shutdown.set()
+
+
+def test_between_processes():
+    shutdown = ShutdownFlag()
+    try:
+        p = mp.Process(target=_set_later, args=(shutdown,))
+        p.start()
+        assert shutdown.wait(5.0)
+        assert shutdown.value is True
+        p.join()
+    finally:
+        shutdown.unlink()
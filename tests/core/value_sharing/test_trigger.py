@@ -0,0 +1,77 @@
+import multiprocessing as mp
+import threading
+import time
+
+import numpy as np
+
+from JarvisEngine.core.value_sharing import FolderDictWithLock, RingBuffer
+from JarvisEngine.core.value_sharing.trigger import Trigger, notify_triggers
+
+
+def test_Trigger():
+    trigger = Trigger()
+    try:
+        assert trigger.generation == 0
+        trigger.notify()
+        assert trigger.generation == 1
+
+        assert trigger.wait(0, timeout=0.0) is True  # already notified.
+        start = time.perf_counter()
+        assert trigger.wait(1, timeout=0.05) is False
+        assert time.perf_counter() - start >= 0.05
+    finally:
+        trigger.unlink()
+
+
+def test_wake_up():
+    trigger = Trigger()
+    try:
+        notified_time = None
+
+        def notify_later():
+            nonlocal notified_time
+            time.sleep(0.05)
+            notified_time = time.perf_counter()
+            trigger.notify()
+
+        thread = threading.Thread(target=notify_later)
+        thread.start()
+        assert trigger.wait(trigger.generation, timeout=1.0)
+        assert time.perf_counter() - notified_time < 0.01
+        thread.join()
+    finally:
+        trigger.unlink()
+
+
+def _notify(trigger):
+    time.sleep(0.05)
+    trigger.notify()
+
+
+def test_between_processes():
+    trigger = Trigger()
+    try:
+        p = mp.Process(target=_notify, args=(trigger,))
+        p.start()
+        assert trigger.wait(0, timeout=5.0)
+        assert trigger.generation == 1
+        p.join()
+    finally:
+        trigger.unlink()
+
+
+def test_notify_triggers():
+    trigger = Trigger()
+    channel = RingBuffer(4, trigger=Trigger())
+    fdwl = FolderDictWithLock()
+    fdwl["trigger"] = trigger
+    fdwl["channel"] = channel
+    fdwl["value"] = 1
+    try:
+        notify_triggers(fdwl)
+        assert trigger.generation == 1
+        assert channel.trigger.generation == 1
+    finally:
+        trigger.unlink()
+        channel.trigger.unlink()
+        channel.unlink()
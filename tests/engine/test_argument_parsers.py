@@ -18,6 +18,9 @@ def test_at_launching():
     args = _parse_args(parser, ["run"])
     assert args.command == "run"
 
+    args = _parse_args(parser, ["logs"])
+    assert args.command == "logs"
+
     try:
         _parse_args(parser, ["invalid command"])
         raise AssertionError("Invalid command was recognized!")
@@ -27,7 +30,7 @@ def test_at_launching():
     # test -ll, --log_level
     ### default behavior
     args = _parse_args(parser, ["create"])
-    assert args.log_level == "DEBUG"
+    assert args.log_level == "INFO"
 
     ### run -ll INFO
     args = _parse_args(parser, ["run", "-ll", "INFO"])
@@ -98,3 +101,53 @@ def test_at_running():
     argv = "run --engine_config_file bbb"
     args = _parse_args(parser, argv.split())
     assert args.engine_config_file == "bbb"
+
+    # check --profile_startup
+    args = _parse_args(parser, ["run"])
+    assert args.profile_startup is None
+
+    args = _parse_args(parser, ["run", "--profile-startup"])
+    assert args.profile_startup == "startup_profile.json"
+
+    args = _parse_args(parser, ["run", "--profile_startup", "aaa.json"])
+    assert args.profile_startup == "aaa.json"
+
+
+def test_to_timestamp():
+    from datetime import datetime, timezone
+
+    assert argument_parsers.to_timestamp("1700000000.5") == 1700000000.5
+    assert argument_parsers.to_timestamp("2023-11-14T22:13:20+00:00") == 1700000000.0
+    assert argument_parsers.to_timestamp("2023-11-14 22:13:20") == datetime(2023, 11, 14, 22, 13, 20).timestamp()
+    try:
+        argument_parsers.to_timestamp("yesterday")
+        raise AssertionError("Invalid time is converted!")
+    except ValueError:
+        pass
+
+
+def test_at_reading_logs():
+    parser = argument_parsers.at_reading_logs()
+
+    # check default value
+    args = _parse_args(parser, ["logs", "aaa"])
+    assert args.log_path == "aaa"
+    assert args.app is None
+    assert args.level is None
+    assert args.since is None
+    assert args.until is None
+    assert args.json is False
+
+    argv = "logs aaa -a App0 --app App1 --level WARNING --since 10 --until 20.5 --json"
+    args = _parse_args(parser, argv.split())
+    assert args.app == ["App0", "App1"]
+    assert args.level == "WARNING"
+    assert args.since == 10.0
+    assert args.until == 20.5
+    assert args.json is True
+
+    try:
+        _parse_args(parser, ["logs"])
+        raise AssertionError("`log_path` is not required!")
+    except SystemExit:
+        pass
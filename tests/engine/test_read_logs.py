@@ -0,0 +1,32 @@
+import io
+import json
+import logging
+
+from JarvisEngine.core.log_sink import BinaryLogHandler
+from JarvisEngine.engine.read_logs import print_entries
+
+
+def test_print_entries(tmp_path):
+    handler = BinaryLogHandler(str(tmp_path))
+    for name, level, msg in [("Launcher.App0", logging.INFO, "100% done"), ("Launcher.App1", logging.ERROR, "failed")]:
+        record = logging.LogRecord(name, level, __file__, 0, msg, (), None)
+        record.created = 1700000000.25
+        handler.handle(record)
+    handler.close()
+
+    f = io.StringIO()
+    print_entries(str(tmp_path), file=f)
+    lines = f.getvalue().splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith(".250 Launcher.App0 [INFO]: 100% done")
+    assert lines[1].endswith("Launcher.App1 [ERROR]: failed")
+
+    f = io.StringIO()
+    print_entries(str(tmp_path), level=logging.WARNING, as_json=True, file=f)
+    (line,) = f.getvalue().splitlines()
+    assert json.loads(line) == {
+        "created": 1700000000.25,
+        "levelname": "ERROR",
+        "name": "Launcher.App1",
+        "message": "failed",
+    }
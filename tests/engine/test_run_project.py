@@ -1,8 +1,12 @@
-from multiprocessing.sharedctypes import Synchronized
-
 # prepare
+import os
+
+from JarvisEngine.apps import Launcher
 from JarvisEngine.constants import SHUTDOWN_NAME
-from JarvisEngine.core.value_sharing import FolderDictWithLock, ReadOnlyValue
+from JarvisEngine.core import metrics
+from JarvisEngine.core.config_tools import dict2attr
+from JarvisEngine.core.value_sharing import FolderDictWithLock, ReadOnlyShutdownFlag, ShutdownFlag
+from JarvisEngine.engine import run_project
 from JarvisEngine.engine.run_project import create_shutdown
 
 
@@ -11,7 +15,56 @@ def test_create_shutdown():
     shutdown = create_shutdown(fdwl)
     shutdown_readonly = fdwl[SHUTDOWN_NAME]
 
-    assert isinstance(shutdown, Synchronized)
-    assert isinstance(shutdown_readonly, ReadOnlyValue)
+    assert isinstance(shutdown, ShutdownFlag)
+    assert isinstance(shutdown_readonly, ReadOnlyShutdownFlag)
     assert shutdown.value is False
     assert shutdown_readonly.value is False
+
+    shutdown.value = True
+    assert shutdown_readonly.value is True
+    assert shutdown_readonly.wait(0.0)
+    shutdown.unlink()
+
+
+def test_set_start_method(monkeypatch):
+    calls = []
+    monkeypatch.setattr(run_project.mp, "set_start_method", lambda method: calls.append(("start", method)))
+    monkeypatch.setattr(run_project.mp, "set_forkserver_preload", lambda mods: calls.append(("preload", mods)))
+
+    run_project.set_start_method(dict2attr({"start_method": "spawn", "forkserver_preload": ["numpy"]}))
+    assert calls == [("start", "spawn")]
+
+    calls.clear()
+    run_project.set_start_method(dict2attr({"start_method": "forkserver", "forkserver_preload": ["numpy"]}))
+    assert calls == [("start", "forkserver"), ("preload", ["numpy"])]
+
+
+class _LoggingServer:
+    dropped_records = 3
+
+
+class _Launcher(Launcher):
+    def __init__(self) -> None:
+        pass
+
+    def get_metrics(self):
+        return [metrics.MetricValue("jarvis_frames_total", metrics.COUNTER, {"app": "Launcher"}, 1)]
+
+
+def test_collect_metrics():
+    values = run_project.collect_metrics(_Launcher(), _LoggingServer())
+    assert [m.name for m in values] == ["jarvis_frames_total", "jarvis_log_server_dropped_records_total"]
+    assert values[1].value == 3
+    assert len(run_project.collect_metrics(_Launcher())) == 1
+
+
+def test_create_metrics_exporter():
+    engine_config = dict2attr({"metrics": {"http_host": "localhost", "http_port": 20231, "textfile": "metrics.prom"}})
+    exporter = run_project.create_metrics_exporter(_Launcher(), engine_config)
+    assert exporter.http_host == "localhost"
+    assert exporter.http_port == 20231
+    assert exporter.textfile == os.path.abspath("metrics.prom")
+    assert exporter.textfile_interval == 5.0
+    assert "jarvis_frames_total" in exporter.render()
+
+    assert not run_project.create_metrics_exporter(_Launcher(), dict2attr({})).enabled
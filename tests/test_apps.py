@@ -9,3 +9,7 @@ def test_import():
     from JarvisEngine.apps.launcher import Launcher
 
     assert apps.Launcher == Launcher
+
+    from JarvisEngine.apps.async_base_app import AsyncBaseApp
+
+    assert apps.AsyncBaseApp is AsyncBaseApp
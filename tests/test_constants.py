@@ -23,3 +23,15 @@ def test_DEFAULT_CONFIG_FILE_NAME():
 
 def test_SHUTDOWN_NAME():
     assert constants.SHUTDOWN_NAME == "shutdown"
+
+
+def test_FRAME_STATS_NAME():
+    assert constants.FRAME_STATS_NAME == "frame_stats"
+
+
+def test_STARTUP_PROFILER_NAME():
+    assert constants.STARTUP_PROFILER_NAME == "startup_profiler"
+
+
+def test_METRICS_NAME():
+    assert constants.METRICS_NAME == "metrics"
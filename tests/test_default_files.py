@@ -10,7 +10,46 @@ def test_default_engine_config():
     assert log_conf["port"] == 8316
     assert log_conf["message_format"] == "%(asctime)s.%(msecs)03d %(name)s [%(levelname)s]: %(message)s"
     assert log_conf["date_format"] == "%Y/%m/%d %H:%M:%S"
+    assert log_conf["buffered"] is False
+    assert log_conf["buffer_capacity"] == 10000
+    assert log_conf["flush_size"] == 100
+    assert log_conf["flush_interval"] == 0.1
+    assert log_conf["server"] == "thread"
+    assert log_conf["server_queue_size"] == 10000
+    assert log_conf["server_overflow"] == "block"
+    assert log_conf["console"] is True
+    assert log_conf["sink_dir"] == ""
+    assert log_conf["sink_max_bytes"] == 67108864
+    assert log_conf["sink_rotate_interval"] == 3600.0
+    assert log_conf["sink_buffer_size"] == 65536
+    assert log_conf["sink_flush_interval"] == 1.0
+    assert log_conf["sink_max_files"] == 0
+    assert log_conf["rate_limit"] == 0.0
+    assert log_conf["rate_burst"] == 100
+    assert log_conf["sample_repeats"] == 0
 
     assert "multiprocessing" in conf
     mp_conf = conf["multiprocessing"]
     assert mp_conf["start_method"] == "spawn"
+    assert mp_conf["forkserver_preload"] == ["JarvisEngine.apps"]
+    assert mp_conf["construct_in_child"] is False
+
+    assert "timing" in conf
+    timing_conf = conf["timing"]
+    assert timing_conf["precise"] is False
+    assert timing_conf["spin_threshold"] == 0.002
+
+    assert "scheduling" in conf
+    sched_conf = conf["scheduling"]
+    assert sched_conf["cpu_affinity"] == []
+    assert sched_conf["nice"] == "inherit"
+    assert sched_conf["sched_policy"] == "inherit"
+    assert sched_conf["sched_priority"] == 0
+
+    assert "metrics" in conf
+    metrics_conf = conf["metrics"]
+    assert metrics_conf["slots_per_app"] == 32
+    assert metrics_conf["http_host"] == "127.0.0.1"
+    assert metrics_conf["http_port"] == 0
+    assert metrics_conf["textfile"] == ""
+    assert metrics_conf["textfile_interval"] == 5.0